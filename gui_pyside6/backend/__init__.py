@@ -4,40 +4,42 @@ import functools
 import importlib
 import importlib.util
 from importlib import metadata
+import hashlib
 import json
+import os
+import site
 import sys
 from pathlib import Path
+from typing import Callable
 
 
 from datetime import datetime
 from ..utils import install_utils
 from ..utils.install_utils import uninstall_package_from_venv
+from .registry import BackendRegistry, MetadataView, parse_distribution_name
+from . import wheelhouse
 import subprocess
 from shutil import which
 
 _METADATA_DIR = Path(__file__).with_name("metadata")
-_BACKEND_METADATA: dict[str, dict[str, str]] = {}
-if _METADATA_DIR.exists():
-    try:
-        import tomllib  # Python 3.11+
+_REQ_FILE = Path(__file__).with_name("backend_requirements.json")
 
-        for path in _METADATA_DIR.glob("*.toml"):
-            with path.open("rb") as f:
-                _BACKEND_METADATA[path.stem] = tomllib.load(f)
-    except Exception:
-        pass
 
 def get_backend_repo(name: str) -> str | None:
-    return _BACKEND_METADATA.get(name, {}).get("repo_url")
+    return _registry().metadata(name).get("repo_url")
 
 def get_backend_package(name: str) -> str | None:
-    return _BACKEND_METADATA.get(name, {}).get("package")
+    return _registry().metadata(name).get("package")
 
 
 def _call_backend(module: str, func: str, *args, **kwargs):
     """Import the given backend module on demand and run the requested function."""
+    from ..utils.memory_governor import in_use
+
     mod = importlib.import_module(f".{module}", __name__)
-    return getattr(mod, func)(*args, **kwargs)
+    # Keeps the memory governor from unloading this backend's models mid-call.
+    with in_use(module.removesuffix("_backend")):
+        return getattr(mod, func)(*args, **kwargs)
 
 
 BACKENDS = {
@@ -56,25 +58,27 @@ BACKENDS = {
 # Explicit feature flags describing which optional parameters each backend
 # understands. These are used by the PySide6 GUI to show or hide UI controls.
 # Keys correspond to backend names, values are sets containing any of
-# "voice", "lang", "rate", "seed" and "file".
+# "voice", "lang", "rate", "seed" and "file". "stream" marks backends that
+# accept an ``on_chunk(samples, sample_rate)`` callback and call it as audio
+# is generated, which the GUI uses for progressive playback. "threadsafe"
+# marks backends that may be called from several threads at once (batch
+# workers); the others, e.g. pyttsx3 with its one engine per driver, render
+# one line at a time.
 BACKEND_FEATURES: dict[str, set[str]] = {
     "pyttsx3": {"voice", "lang", "rate"},
-    "gtts": {"lang"},
-    "bark": {"voice"},
+    "gtts": {"lang", "threadsafe"},
+    "bark": {"voice", "stream"},
     "tortoise": {"voice"},
-    "edge_tts": {"voice", "rate"},
+    "edge_tts": {"voice", "rate", "threadsafe"},
     "demucs": {"file"},
-    "mms": {"lang"},
+    "mms": {"lang", "stream", "threadsafe"},
     "vocos": {"file"},
-    "kokoro": {"voice", "rate", "seed"},
-    "chatterbox": {"voice", "seed"},
+    "kokoro": {"voice", "rate", "seed", "stream", "threadsafe"},
+    "chatterbox": {"voice", "seed", "stream", "threadsafe"},
     "whisper": {"file"},
+    "faster_whisper": {"file"},
 }
 
-# Short descriptions for each backend shown in the UI
-BACKEND_INFO: dict[str, str] = {
-    name: data.get("description", "") for name, data in _BACKEND_METADATA.items()
-}
 
 # Categorize backends for the PySide6 UI. Stable text-to-speech engines are
 # listed separately from audio tools and experimental components.
@@ -98,9 +102,16 @@ _LOG_DIR = Path.home() / ".hybrid_tts"
 _INSTALL_LOG = _LOG_DIR / "install.log"
 
 # Backends that have been installed previously according to the install log or
-# current environment.  Populated at import time by ``load_persisted_installs``.
+# current environment.  Populated on first use by ``load_persisted_installs``.
 _INSTALLED_BACKENDS: set[str] = set()
 
+# Whether each backend's packages are present, answered from the snapshot in
+# ``installed_state.json`` while the environment fingerprint is unchanged.
+_INSTALLED_STATE: dict[str, bool] = {}
+# Fingerprint the two sets above were computed for; None until first loaded.
+_STATE_FINGERPRINT: str | None = None
+_SNAPSHOT_VERSION = 1
+
 def get_edge_voices(locale: str | None = None) -> list[str]:
     """Return list of available Edge TTS voices."""
     if "edge_tts" not in sys.modules:
@@ -130,8 +141,44 @@ def get_chatterbox_voices() -> list[tuple[str, str]]:
 
 TRANSCRIBERS = {
     "whisper": functools.partial(_call_backend, "whisper_backend", "transcribe_to_text"),
+    "faster_whisper": functools.partial(
+        _call_backend, "faster_whisper_backend", "transcribe_to_text"
+    ),
 }
 
+def transcribe_files(sources, manifest_path: Path, **kwargs) -> Path:
+    """Transcribe many audio files with Whisper into a JSONL manifest."""
+    return _call_backend("whisper_backend", "transcribe_batch", sources, manifest_path, **kwargs)
+
+REGISTRY = BackendRegistry(
+    _REQ_FILE,
+    _METADATA_DIR,
+    backends=BACKENDS,
+    transcribers=TRANSCRIBERS,
+    features=BACKEND_FEATURES,
+    categories={
+        "tts": TTS_BACKENDS,
+        "tool": TOOL_BACKENDS,
+        "experimental": EXPERIMENTAL_BACKENDS,
+    },
+)
+
+# Short descriptions for each backend shown in the UI
+BACKEND_INFO = MetadataView(REGISTRY, "description")
+
+
+def _registry() -> BackendRegistry:
+    """Return the backend registry, following overrides of ``_REQ_FILE``."""
+    if REGISTRY.requirements_file != _REQ_FILE:
+        REGISTRY.requirements_file = _REQ_FILE
+    return REGISTRY
+
+
+def register_backend(name: str, func, **kwargs) -> None:
+    """Register a third-party backend. See ``BackendRegistry.register``."""
+    REGISTRY.register(name, func, **kwargs)
+
+
 def available_transcribers():
     return list(TRANSCRIBERS.keys())
 
@@ -139,8 +186,95 @@ def available_backends():
     return list(BACKENDS.keys())
 
 
+def _state_file() -> Path:
+    return _LOG_DIR / "installed_state.json"
+
+
+def _site_dirs() -> list[str]:
+    """Return the directories packages can be installed into."""
+    dirs: set[str] = set()
+    try:
+        dirs.update(site.getsitepackages())
+        dirs.add(site.getusersitepackages())
+    except Exception:
+        pass
+    dirs.add(str(install_utils._venv_site_packages()))
+    dirs.update(p for p in sys.path if p.endswith(("site-packages", "dist-packages")))
+    return sorted(dirs)
+
+
+def _environment_fingerprint() -> str:
+    """Hash describing the installed packages without reading their metadata.
+
+    Installing, upgrading or removing a distribution adds or renames its
+    ``.dist-info`` directory, which updates the mtime of the site-packages
+    directory holding it. Hashing those mtimes together with the interpreter,
+    the requirements file and the install log lets a snapshot be reused until
+    any of them change.
+    """
+    parts = [sys.executable, sys.version, str(_SNAPSHOT_VERSION)]
+    for path in [*_site_dirs(), str(_REQ_FILE), str(_INSTALL_LOG)]:
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{path}:-")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _read_snapshot() -> dict | None:
+    try:
+        with _state_file().open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _write_snapshot() -> None:
+    """Persist the installed state for the current environment fingerprint."""
+    global _STATE_FINGERPRINT
+    _STATE_FINGERPRINT = _environment_fingerprint()
+    data = {
+        "fingerprint": _STATE_FINGERPRINT,
+        "installed": sorted(_INSTALLED_BACKENDS),
+        "state": _INSTALLED_STATE,
+    }
+    path = _state_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[WARN] Failed to save installed state: {e}")
+
+
+def refresh_installed_state() -> None:
+    """Discard the snapshot and rescan the environment."""
+    _INSTALLED_STATE.clear()
+    try:
+        _state_file().unlink()
+    except OSError:
+        pass
+    load_persisted_installs()
+
+
 def load_persisted_installs() -> None:
-    """Populate ``_INSTALLED_BACKENDS`` from the install log and environment."""
+    """Populate ``_INSTALLED_BACKENDS`` from the install log and environment.
+
+    When the environment fingerprint matches the saved snapshot, the result
+    is loaded from the snapshot and no package metadata is read.
+    """
+    global _INSTALLED_BACKENDS, _INSTALLED_STATE, _STATE_FINGERPRINT
+    snapshot = _read_snapshot()
+    fingerprint = _environment_fingerprint()
+    if snapshot and snapshot.get("fingerprint") == fingerprint:
+        _INSTALLED_BACKENDS = set(snapshot.get("installed", []))
+        _INSTALLED_STATE = {k: bool(v) for k, v in snapshot.get("state", {}).items()}
+        _STATE_FINGERPRINT = fingerprint
+        return
+
     names: set[str] = set()
     if _INSTALL_LOG.exists():
         for line in _INSTALL_LOG.read_text().splitlines():
@@ -153,41 +287,42 @@ def load_persisted_installs() -> None:
                     names.discard(backend)
 
     # Also mark any backends whose packages are already available
+    state: dict[str, bool] = {}
     for backend in BACKENDS:
-        if backend not in names and not missing_backend_packages(backend):
+        state[backend] = not missing_backend_packages(backend)
+        if state[backend]:
             names.add(backend)
 
-    global _INSTALLED_BACKENDS
     _INSTALLED_BACKENDS = names
+    _INSTALLED_STATE = state
+    _write_snapshot()
+
+
+def _sync_installed_state() -> None:
+    """Reload the installed state when the environment has changed.
+
+    Packages installed or removed outside the app (pip in a terminal,
+    another process) change the fingerprint, so cached answers, including
+    negative ones, are discarded and the environment is scanned again.
+    """
+    if _STATE_FINGERPRINT != _environment_fingerprint():
+        load_persisted_installs()
 
 
 def backend_was_installed(name: str) -> bool:
     """Return True if the backend appears in the persisted install log."""
+    _sync_installed_state()
     return name in _INSTALLED_BACKENDS
 
 
-_REQ_FILE = Path(__file__).with_name("backend_requirements.json")
-
 def _get_backend_packages(name: str) -> list[str]:
-    if not _REQ_FILE.exists():
-        return []
-    with _REQ_FILE.open() as f:
-        reqs: dict[str, list[str]] = json.load(f)
-    return reqs.get(name, [])
+    return _registry().requirements(name)
 
 
+@functools.lru_cache(maxsize=None)
 def _get_distribution_name(package_spec: str) -> str:
     """Return the pip distribution name for the given requirement spec."""
-    try:
-        from packaging.requirements import Requirement
-
-        req = Requirement(package_spec)
-        name = req.name
-    except Exception:
-        # Fallback to a simple split if packaging is not available or parsing fails
-        name = package_spec.split("@")[0].strip().split()[0]
-
-    return name
+    return parse_distribution_name(package_spec)
 
 
 def get_gtts_languages():
@@ -234,7 +369,18 @@ def missing_backend_packages(name: str) -> list[str]:
     return missing
 
 def is_backend_installed(name: str) -> bool:
-    return not missing_backend_packages(name)
+    """Return True if the backend's packages are installed.
+
+    Answered from the installed-state snapshot; backends not covered by it
+    are checked once and remembered until the environment fingerprint
+    changes.
+    """
+    _sync_installed_state()
+    installed = _INSTALLED_STATE.get(name)
+    if installed is None:
+        installed = not missing_backend_packages(name)
+        _INSTALLED_STATE[name] = installed
+    return installed
 
 
 # ---------------- installation helpers -----------------
@@ -252,45 +398,140 @@ def _uv_available() -> bool:
     return which("uv") is not None
 
 
-def _install_backend_packages(packages: list[str], *, no_deps: bool = False) -> None:
-    """Install the given packages into the appropriate Python environment."""
-    if isinstance(packages, str):
-        packages = [packages]
+def _target_python() -> str:
+    """Return the interpreter backend packages are installed for."""
+    if install_utils._is_venv_active():
+        return sys.executable
+    install_utils._ensure_venv()
+    site_dir = install_utils._venv_site_packages()
+    if str(site_dir) not in sys.path:
+        sys.path.insert(0, str(site_dir))
+    return str(install_utils._venv_python())
 
-    # Mirror logic from install_utils.install_package_in_venv
-    subprocess.run([sys.executable, "-m", "ensurepip", "--upgrade"], check=True)
 
-    in_venv = install_utils._is_venv_active()
+def _pip_available(python_exe: str) -> bool:
+    """Return True if pip can be imported by ``python_exe``."""
+    if python_exe == sys.executable:
+        return importlib.util.find_spec("pip") is not None
+    return (install_utils._venv_site_packages() / "pip").is_dir()
 
-    if in_venv:
-        python_exe = sys.executable
-    else:
-        install_utils._ensure_venv()
-        python_exe = str(install_utils._venv_python())
-        site_dir = install_utils._venv_site_packages()
-        if str(site_dir) not in sys.path:
-            sys.path.insert(0, str(site_dir))
 
-    subprocess.run([str(python_exe), "-m", "ensurepip", "--upgrade"], check=True)
+def _run_install_command(cmd: list[str], on_output: Callable[[str], None] | None) -> None:
+    """Run ``cmd``, passing each output line to ``on_output`` if given."""
+    if on_output is None:
+        subprocess.check_call(cmd)
+        return
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    for line in proc.stdout:
+        line = line.rstrip()
+        if line:
+            on_output(line)
+    returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _install_backend_packages(
+    packages: list[str],
+    *,
+    no_deps: bool = False,
+    on_output: Callable[[str], None] | None = None,
+) -> None:
+    """Install the given packages into the appropriate Python environment.
+
+    ``uv`` is used when available; otherwise pip is bootstrapped with
+    ``ensurepip`` only if the target interpreter lacks it.
+    """
+    if isinstance(packages, str):
+        packages = [packages]
+
+    python_exe = _target_python()
 
     if _uv_available():
         cmd = ["uv", "pip", "install", "-p", str(python_exe)]
     else:
+        if not _pip_available(python_exe):
+            subprocess.run([str(python_exe), "-m", "ensurepip", "--upgrade"], check=True)
         cmd = [str(python_exe), "-m", "pip", "install"]
 
+    cmd += wheelhouse.install_args()
     if no_deps:
         cmd.append("--no-deps")
 
-    subprocess.check_call(cmd + packages)
+    _run_install_command(cmd + packages, on_output)
+
+def _install_set(name: str, missing: list[str]) -> tuple[list[str], bool]:
+    """Return the packages to install for ``name`` and whether to skip deps.
+
+    A lockfile already pins the full dependency closure, so its packages are
+    installed as-is without resolving.
+    """
+    locked = wheelhouse.locked_requirements(name)
+    if locked is not None:
+        return locked, True
+    return missing, name in _TORCH_BACKENDS
+
 
-def ensure_backend_installed(name: str) -> None:
-    """Install packages required for the given backend if missing."""
+def ensure_backend_installed(name: str) -> bool:
+    """Install packages required for the given backend if missing.
+
+    Returns True when packages were installed, so the caller can warm the
+    backend up with ``post_install.finalize`` and ``prefetch_models``.
+    """
     missing = missing_backend_packages(name)
     if missing:
-        no_deps = name in _TORCH_BACKENDS
-        _install_backend_packages(missing, no_deps=no_deps)
-        _log_action("install", name, missing)
+        packages, no_deps = _install_set(name, missing)
+        _install_backend_packages(packages, no_deps=no_deps)
+        _log_action("install", name, packages)
+        _INSTALLED_BACKENDS.add(name)
+    _INSTALLED_STATE[name] = True
+    if missing:
+        _write_snapshot()
+    return bool(missing)
+
+
+def ensure_backends_installed(
+    names: list[str], on_output: Callable[[str], None] | None = None
+) -> list[str]:
+    """Install the missing packages of several backends in one resolver run.
+
+    The union of the missing requirements is installed with a single
+    pip/uv invocation. Packages of ``_TORCH_BACKENDS`` and locked backends
+    are installed in a second ``--no-deps`` invocation so the existing torch
+    is reused. Returns the names of the backends that had packages installed.
+    """
+    missing: dict[str, list[str]] = {}
+    resolved: dict[str, None] = {}
+    no_deps: dict[str, None] = {}
+    for name in names:
+        packages = missing_backend_packages(name)
+        if packages:
+            packages, flag = _install_set(name, packages)
+            (no_deps if flag else resolved).update(dict.fromkeys(packages))
+        missing[name] = packages
+    no_deps = {p: None for p in no_deps if p not in resolved}
+
+    for packages, flag in ((resolved, False), (no_deps, True)):
+        if packages:
+            if on_output is not None:
+                on_output(f"Installing {len(packages)} package(s): {' '.join(packages)}")
+            _install_backend_packages(list(packages), no_deps=flag, on_output=on_output)
+
+    installed = [name for name, packages in missing.items() if packages]
+    for name in installed:
+        _log_action("install", name, missing[name])
         _INSTALLED_BACKENDS.add(name)
+    for name in names:
+        _INSTALLED_STATE[name] = True
+    if installed:
+        _write_snapshot()
+    return installed
 
 def uninstall_backend(name: str) -> None:
     """Uninstall packages for the given backend if present."""
@@ -300,14 +541,12 @@ def uninstall_backend(name: str) -> None:
 
     # Determine which packages are still required by other installed backends
     used_by_others: set[str] = set()
-    if _REQ_FILE.exists():
-        with _REQ_FILE.open() as f:
-            all_reqs: dict[str, list[str]] = json.load(f)
-        for other, reqs in all_reqs.items():
-            if other == name:
-                continue
-            if is_backend_installed(other):
-                used_by_others.update(_get_distribution_name(p) for p in reqs)
+    registry = _registry()
+    for other in registry.all_requirements():
+        if other == name:
+            continue
+        if is_backend_installed(other):
+            used_by_others.update(registry.distributions(other))
 
     uninstall_list: list[str] = []
     skipped: list[str] = []
@@ -322,6 +561,8 @@ def uninstall_backend(name: str) -> None:
         uninstall_package_from_venv(uninstall_list)
         _log_action("uninstall", name, [p for p in packages if _get_distribution_name(p) in uninstall_list])
         _INSTALLED_BACKENDS.discard(name)
+        _INSTALLED_STATE[name] = False
+        _write_snapshot()
 
     if skipped:
         _log_action("skip_uninstall", name, skipped)
@@ -333,5 +574,5 @@ def _log_action(action: str, name: str, packages: list[str]) -> None:
         f.write(f"{datetime.now().isoformat()} {action} {name}: {', '.join(packages)}\n")
 
 
-# Initialize installed backend set on import
-load_persisted_installs()
+# Let installed packages contribute backends before the UI reads the lists.
+REGISTRY.discover_plugins()
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 import argparse
+import json
+import time
 
-from . import BACKENDS, TRANSCRIBERS
+from . import BACKENDS, TRANSCRIBERS, transcribe_files
+from ..utils.audio_encode import is_available, negotiate, resolve_format, submit
+from ..utils.memory_governor import DEFAULT_IDLE_TIMEOUT, MemoryGovernor, resident, rss_mb
+from ..utils.output_index import apply_retention, open_index
+from ..utils.timer import StageTimer, recent_records
 
 app = FastAPI(title="Hybrid TTS API")
 
+DEMUCS_OUTPUT = Path("demucs_output")
+# Retention limits for ``DEMUCS_OUTPUT``, set by ``run_server``.
+_RETENTION: dict = {}
+
 
 @app.get("/", include_in_schema=False)
 def index() -> dict[str, str]:
@@ -24,6 +35,11 @@ class SynthesisRequest(BaseModel):
     rate: Optional[int] = None
     voice: Optional[str] = None
     lang: Optional[str] = None
+    # Output encoding: "wav", "flac", "ogg" (Opus) or "mp3". When unset, an
+    # audio type in the Accept header selects the format and the response
+    # is the audio itself.
+    format: Optional[str] = None
+    subtype: Optional[str] = None
 
 
 class SeparationRequest(BaseModel):
@@ -36,25 +52,105 @@ class TranscriptionRequest(BaseModel):
     audio: str
     backend: str = "whisper"
     model: Optional[str] = "openai/whisper-small"
+    batch_size: Optional[int] = None
+    vad: bool = False
+    speculative: bool = False
+    assistant_model: Optional[str] = None
+
+
+class BatchTranscriptionRequest(BaseModel):
+    audio: Union[str, List[str]]
+    manifest: str = "transcripts.jsonl"
+    model: Optional[str] = "openai/whisper-small"
+    batch_size: int = 8
+    num_workers: int = 4
+    return_timestamps: bool = False
+    vad: bool = False
+
+
+def _requested_format(req: SynthesisRequest, accept: str | None):
+    """Return ``(format, send_audio)`` for a synthesis request."""
+    if req.format:
+        try:
+            fmt = resolve_format(req.format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not is_available(fmt, req.subtype):
+            raise HTTPException(status_code=400, detail=f"{req.format} encoding is not available")
+        return fmt, False
+    fmt = negotiate(accept)
+    if fmt is None and accept and "audio/" in accept:
+        raise HTTPException(status_code=406, detail="No supported audio type in Accept")
+    return fmt, fmt is not None
 
 
 @app.post("/synthesize")
-def synthesize(req: SynthesisRequest):
+def synthesize(req: SynthesisRequest, request: Request):
     if req.backend not in BACKENDS:
         raise HTTPException(status_code=400, detail="Unknown backend")
+    fmt, send_audio = _requested_format(req, request.headers.get("accept"))
     output = Path("output_api.wav")
-    BACKENDS[req.backend](
-        req.text, output, rate=req.rate, voice=req.voice, lang=req.lang
-    )
-    return {"output": str(output)}
+    stages = StageTimer(backend=req.backend, source="api")
+    with stages.activate(), stages.stage("inference"):
+        result = BACKENDS[req.backend](
+            req.text, output, rate=req.rate, voice=req.voice, lang=req.lang
+        )
+    if isinstance(result, (str, Path)):
+        output = Path(result)
+    if fmt is not None:
+        with stages.stage("encode"):
+            output = submit(output, fmt, subtype=req.subtype).result()
+    try:
+        import soundfile as sf
+
+        stages.note(audio_duration=round(sf.info(str(output)).duration, 3))
+    except Exception:
+        pass
+    record = stages.log()
+    if send_audio:
+        return FileResponse(
+            output,
+            media_type=fmt.mime,
+            filename=output.name,
+            headers={"X-Timings": json.dumps(record, default=str)},
+        )
+    return {"output": str(output), "format": fmt.name if fmt else None, "timings": record}
+
+
+@app.get("/timings")
+def timings() -> list[dict]:
+    """Stage timings of recent jobs run by this server, oldest first."""
+    return recent_records()
+
+
+@app.get("/models")
+def models() -> dict:
+    """Models currently loaded by this server and the process RSS."""
+    now = time.monotonic()
+    return {
+        "resident": [
+            {
+                "backend": entry.backend,
+                "kind": entry.label,
+                "key": entry.describe(),
+                "idle_seconds": round(now - entry.last_used, 1),
+            }
+            for entry in resident()
+        ],
+        "rss_mb": rss_mb(),
+    }
 
 
 @app.post("/separate")
 def separate(req: SeparationRequest):
     if req.backend != "demucs":
         raise HTTPException(status_code=400, detail="Unsupported backend")
-    output_dir = Path("demucs_output")
-    stems = BACKENDS["demucs"](Path(req.audio), output_dir, model_name=req.model or "htdemucs")
+    stems = BACKENDS["demucs"](Path(req.audio), DEMUCS_OUTPUT, model_name=req.model or "htdemucs")
+    try:
+        open_index(DEMUCS_OUTPUT).add(stems, backend="demucs", text=req.audio)
+        apply_retention(DEMUCS_OUTPUT, keep=stems, **_RETENTION)
+    except Exception as e:
+        print(f"[WARN] Could not update output index: {e}")
     return {"stems": [str(p) for p in stems]}
 
 
@@ -62,21 +158,102 @@ def separate(req: SeparationRequest):
 def transcribe(req: TranscriptionRequest):
     if req.backend not in TRANSCRIBERS:
         raise HTTPException(status_code=400, detail="Unsupported backend")
-    text = TRANSCRIBERS[req.backend](Path(req.audio), model_name=req.model or "openai/whisper-small")
+    kwargs = {}
+    if req.batch_size:
+        kwargs["batch_size"] = req.batch_size
+    if req.vad:
+        kwargs["vad"] = True
+    if req.speculative or req.assistant_model:
+        kwargs["speculative"] = True
+        if req.assistant_model:
+            kwargs["assistant_model"] = req.assistant_model
+    text = TRANSCRIBERS[req.backend](
+        Path(req.audio), model_name=req.model or "openai/whisper-small", **kwargs
+    )
     return {"text": text}
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000) -> None:
-    """Run the FastAPI server using uvicorn."""
+@app.post("/transcribe_batch")
+def transcribe_batch(req: BatchTranscriptionRequest):
+    sources = [req.audio] if isinstance(req.audio, str) else req.audio
+    manifest = transcribe_files(
+        [Path(s) for s in sources],
+        Path(req.manifest),
+        model_name=req.model or "openai/whisper-small",
+        batch_size=req.batch_size,
+        num_workers=req.num_workers,
+        return_timestamps=req.return_timestamps,
+        vad=req.vad,
+    )
+    return {"manifest": str(manifest)}
+
+
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    *,
+    idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+    memory_limit_mb: float | None = None,
+    keep_days: float | None = None,
+    max_output_mb: float | None = None,
+) -> None:
+    """Run the FastAPI server using uvicorn.
+
+    Models left idle for ``idle_timeout`` seconds, or needed to bring the
+    process under ``memory_limit_mb``, are unloaded in the background.
+    Separated stems unused for ``keep_days``, or beyond ``max_output_mb``,
+    are removed from ``DEMUCS_OUTPUT`` at startup and after each separation.
+    """
     import uvicorn
 
-    uvicorn.run(app, host=host, port=port)
+    _RETENTION.update(
+        max_age_days=keep_days or None,
+        max_bytes=int(max_output_mb * 1024 * 1024) if max_output_mb else None,
+    )
+    apply_retention(DEMUCS_OUTPUT, scan=True, **_RETENTION)
+    governor = MemoryGovernor(idle_timeout, memory_limit_mb)
+    governor.start()
+    try:
+        uvicorn.run(app, host=host, port=port)
+    finally:
+        governor.stop()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the Hybrid TTS API server")
     parser.add_argument("--host", default="0.0.0.0", help="Bind address")
     parser.add_argument("--port", type=int, default=8000, help="Listening port")
+    parser.add_argument(
+        "--idle-minutes",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT / 60,
+        help="Unload models unused for this many minutes (0 keeps them)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=float,
+        default=0,
+        help="Unload least recently used models above this RSS in MiB (0 for no limit)",
+    )
+    parser.add_argument(
+        "--keep-days",
+        type=float,
+        default=0,
+        help="Delete separated stems unused for this many days (0 keeps them)",
+    )
+    parser.add_argument(
+        "--max-output-mb",
+        type=float,
+        default=0,
+        help="Delete least recently used stems above this size in MiB (0 for no limit)",
+    )
     args = parser.parse_args()
 
-    run_server(host=args.host, port=args.port)
+    run_server(
+        host=args.host,
+        port=args.port,
+        idle_timeout=args.idle_minutes * 60,
+        memory_limit_mb=args.memory_limit or None,
+        keep_days=args.keep_days or None,
+        max_output_mb=args.max_output_mb or None,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable
 
 # Bark is a heavy dependency that may not be installed by default.
 # Metadata in ``backend/metadata/bark.toml`` describes the package
@@ -13,6 +14,7 @@ def synthesize_to_file(
     *,
     voice: str | None = None,
     history_prompt: str | None = None,
+    on_chunk: Callable | None = None,
 ) -> Path:
     """Synthesize speech using the Bark library.
 
@@ -26,16 +28,34 @@ def synthesize_to_file(
         Voice identifier used by Bark. Defaults to the library's default voice.
     history_prompt: str | None, optional
         Optional history prompt to condition generation.
+    on_chunk: Callable | None, optional
+        When given, the text is generated sentence by sentence and
+        ``on_chunk(samples, sample_rate)`` is called after each sentence.
     """
     from bark import SAMPLE_RATE
     from bark.generation import generate_audio, preload_models
     import numpy as np
     import soundfile as sf
 
+    from ..utils.timer import stage
+
     # Bark requires models to be preloaded before generation.
-    preload_models()
+    with stage("model_load"):
+        preload_models()
+
+    prompt = history_prompt or voice
+    if on_chunk is None:
+        waveform = generate_audio(text, history_prompt=prompt)
+    else:
+        from ..utils.audio_stream import split_sentences
 
-    waveform = generate_audio(text, history_prompt=history_prompt or voice)
+        waveform = []
+        with stage("preprocess"):
+            sentences = split_sentences(text)
+        for sentence in sentences:
+            piece = generate_audio(sentence, history_prompt=prompt)
+            on_chunk(piece, SAMPLE_RATE)
+            waveform.append(piece)
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -44,5 +64,6 @@ def synthesize_to_file(
     if isinstance(waveform, list):
         waveform = np.concatenate(waveform)
 
-    sf.write(str(output_path), waveform, SAMPLE_RATE)
+    with stage("write"):
+        sf.write(str(output_path), waveform, SAMPLE_RATE)
     return output_path
@@ -1,6 +1,37 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import Callable
+
+from ..utils import memory_governor
+
+_REPO_ID = "ResembleAI/chatterbox"
+
+# Models by device, kept resident between calls, each with a lock: the
+# voice conditionals are stored on the model, so one generation runs per
+# model at a time.
+_MODELS: dict[str, tuple] = {}
+_LOAD_LOCK = threading.Lock()
+memory_governor.register("chatterbox", _MODELS, "model", _LOAD_LOCK)
+
+
+def _get_model(device: str) -> tuple:
+    from chatterbox import ChatterboxTTS
+
+    from ..utils.timer import note
+    from .model_store import is_stored, model_dir
+
+    with _LOAD_LOCK:
+        note(model_cache="hit" if device in _MODELS else "miss")
+        if device not in _MODELS:
+            if is_stored(_REPO_ID):
+                tts = ChatterboxTTS.from_local(model_dir(_REPO_ID), device)
+            else:
+                tts = ChatterboxTTS.from_pretrained(device)
+            _MODELS[device] = (tts, threading.Lock())
+        memory_governor.touch(_MODELS, device)
+        return _MODELS[device]
 
 
 def _chunk_text(text: str) -> list[str]:
@@ -45,12 +76,18 @@ def synthesize_to_file(
     cfg_weight: float = 0.5,
     temperature: float = 0.8,
     seed: int | None = None,
+    on_chunk: Callable | None = None,
 ) -> Path:
-    """Synthesize speech using the Chatterbox TTS library."""
-    from chatterbox import ChatterboxTTS
+    """Synthesize speech using the Chatterbox TTS library.
+
+    ``on_chunk(samples, sample_rate)`` is called with the audio of each text
+    chunk as soon as it has been generated.
+    """
     import torch
     import soundfile as sf
 
+    from ..utils.timer import stage
+
     if seed is not None:
         import random
 
@@ -65,27 +102,33 @@ def synthesize_to_file(
         else:
             device = "cpu"
 
-    tts = ChatterboxTTS.from_pretrained(device)
+    with stage("model_load"):
+        tts, lock = _get_model(device)
 
-    if voice:
-        tts.prepare_conditionals(voice, exaggeration=exaggeration)
-    else:
-        voices = list_voices()
-        if voices:
-            tts.prepare_conditionals(voices[0][1], exaggeration=exaggeration)
-        else:
-            raise RuntimeError("No voice provided and no default voices found")
+    with stage("preprocess"):
+        if not voice:
+            voices = list_voices()
+            if not voices:
+                raise RuntimeError("No voice provided and no default voices found")
+            voice = voices[0][1]
+        parts = _chunk_text(text)
 
     all_chunks = []
-    for part in _chunk_text(text):
-        part_chunks = [c for c in tts.generate(part, exaggeration=exaggeration, cfg_weight=cfg_weight, temperature=temperature)]
-        if not part_chunks:
-            raise RuntimeError("Chatterbox failed to generate audio")
-        all_chunks.extend(part_chunks)
+    with lock:
+        with stage("preprocess"):
+            tts.prepare_conditionals(voice, exaggeration=exaggeration)
+        for part in parts:
+            part_chunks = [c for c in tts.generate(part, exaggeration=exaggeration, cfg_weight=cfg_weight, temperature=temperature)]
+            if not part_chunks:
+                raise RuntimeError("Chatterbox failed to generate audio")
+            all_chunks.extend(part_chunks)
+            if on_chunk is not None:
+                on_chunk(torch.cat(part_chunks, dim=1).squeeze().cpu().numpy(), tts.sr)
     audio = torch.cat(all_chunks, dim=1).squeeze().cpu().numpy()
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(output_path), audio, tts.sr)
+    with stage("write"):
+        sf.write(str(output_path), audio, tts.sr)
     return output_path
 
 
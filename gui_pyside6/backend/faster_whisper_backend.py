@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ..utils import memory_governor
+
+_MODELS: dict[tuple[str, str, str], object] = {}
+memory_governor.register("faster_whisper", _MODELS)
+
+
+def _ct2_model_name(model_name: str) -> str:
+    """Map HuggingFace Whisper identifiers to faster-whisper model names.
+
+    ``openai/whisper-small`` becomes ``small`` so the same model selection
+    works for both engines. Other identifiers and local paths pass through.
+    """
+    prefix = "openai/whisper-"
+    if model_name.startswith(prefix):
+        return model_name[len(prefix):]
+    return model_name
+
+
+def _get_model(model_name: str, device: str, compute_type: str):
+    """Return a cached CTranslate2 Whisper model."""
+    key = (model_name, device, compute_type)
+    model = _MODELS.get(key)
+    if model is None:
+        from faster_whisper import WhisperModel
+
+        from .model_store import resolve
+
+        # Size names such as ``small`` are published as Systran/faster-whisper-*.
+        repo_id = f"Systran/faster-whisper-{model_name}" if "/" not in model_name else model_name
+        local = resolve(repo_id)
+        if local != repo_id:
+            model_name = local
+        model = _MODELS[key] = WhisperModel(model_name, device=device, compute_type=compute_type)
+    memory_governor.touch(_MODELS, key)
+    return model
+
+
+def transcribe_to_text(
+    audio_path: Path,
+    *,
+    model_name: str = "small",
+    return_timestamps: bool | None = None,
+    batch_size: int = 8,
+    vad: bool = False,
+    device: str | None = None,
+    compute_type: str | None = None,
+    beam_size: int = 5,
+) -> str:
+    """Transcribe speech from ``audio_path`` with faster-whisper.
+
+    Parameters
+    ----------
+    audio_path:
+        Path to an audio file decodable by ``faster_whisper``.
+    model_name:
+        faster-whisper model size (``small``, ``large-v3``), a converted
+        CTranslate2 model directory or an ``openai/whisper-*`` identifier.
+    return_timestamps:
+        Accepted for compatibility with the transformers backend. Segments
+        are always timestamped internally; only the text is returned.
+    batch_size:
+        Batch size for the batched inference pipeline when available. The
+        pipeline splits the audio at the speech found by the VAD, so it is
+        only used together with ``vad``.
+    vad:
+        Skip silence with faster-whisper's built-in VAD filter.
+    device:
+        ``cpu`` or ``cuda``. Defaults to CUDA when available.
+    compute_type:
+        CTranslate2 compute type. Defaults to ``int8`` on CPU and
+        ``float16`` on CUDA.
+    beam_size:
+        Beam width used during decoding.
+    Returns
+    -------
+    str
+        Transcribed text output.
+    """
+    if device is None:
+        try:
+            import ctranslate2
+
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:
+            device = "cpu"
+    if compute_type is None:
+        compute_type = "int8" if device == "cpu" else "float16"
+
+    model = _get_model(_ct2_model_name(model_name), device, compute_type)
+    runner = model
+    kwargs: dict = {"beam_size": beam_size, "vad_filter": vad}
+    # Without VAD (or clip timestamps) the batched pipeline has nothing to
+    # split long audio on and fails on clips of 30 s or more.
+    if batch_size > 1 and vad:
+        try:
+            from faster_whisper import BatchedInferencePipeline
+
+            runner = BatchedInferencePipeline(model=model)
+            kwargs["batch_size"] = batch_size
+        except ImportError:
+            pass
+
+    segments, _info = runner.transcribe(str(audio_path), **kwargs)
+    return " ".join(seg.text.strip() for seg in segments if seg.text.strip())
@@ -1,42 +1,73 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable
 import os
 import site
+import threading
 
+from ..utils import memory_governor
 
+# Resident between calls; the memory governor may drop entries at any time,
+# so lookups read each entry once with ``get``. Loading holds ``_LOAD_LOCK``
+# so concurrent first calls (batch workers, parallel jobs) load once; it is
+# re-entrant because loading a voice loads its pipeline.
 _MODELS: dict[tuple[str, bool], object] = {}
 _PIPELINES: dict[str, object] = {}
 _VOICES: dict[str, object] = {}
+_LOAD_LOCK = threading.RLock()
+memory_governor.register("kokoro", _MODELS, "model", _LOAD_LOCK)
+memory_governor.register("kokoro", _PIPELINES, "pipeline", _LOAD_LOCK)
+memory_governor.register("kokoro", _VOICES, "voice", _LOAD_LOCK)
 
 
 def _get_model(model_name: str, use_gpu: bool):
     from kokoro import KModel
     import torch
 
+    from ..utils.timer import note
+
     gpu = bool(use_gpu and torch.cuda.is_available())
     key = (model_name, gpu)
-    if key not in _MODELS:
-        from kokoro import model as kokoro_model
-        kokoro_model.KModel.REPO_ID = model_name
-        model = KModel().to("cuda" if gpu else "cpu").eval()
-        _MODELS[key] = model
-    return _MODELS[key]
+    with _LOAD_LOCK:
+        model = _MODELS.get(key)
+        note(model_cache="hit" if model is not None else "miss")
+        if model is None:
+            from kokoro import model as kokoro_model
+
+            from .model_store import is_stored, model_dir
+
+            kokoro_model.KModel.REPO_ID = model_name
+            local = model_dir(model_name)
+            weights = sorted(local.glob("*.pth")) if is_stored(model_name) else []
+            if weights:
+                model = KModel(config=str(local / "config.json"), model=str(weights[0]))
+            else:
+                model = KModel()
+            model = model.to("cuda" if gpu else "cpu").eval()
+            _MODELS[key] = model
+        memory_governor.touch(_MODELS, key)
+    return model
 
 
 def _get_pipeline(lang_code: str):
     from kokoro import KPipeline
 
-    if lang_code not in _PIPELINES:
-        _PIPELINES[lang_code] = KPipeline(lang_code=lang_code, model=False)
-    return _PIPELINES[lang_code]
+    with _LOAD_LOCK:
+        pipeline = _PIPELINES.get(lang_code)
+        if pipeline is None:
+            pipeline = _PIPELINES[lang_code] = KPipeline(lang_code=lang_code, model=False)
+        memory_governor.touch(_PIPELINES, lang_code)
+    return pipeline
 
 
 def _get_voice(voice_name: str):
-    if voice_name not in _VOICES:
-        pipeline = _get_pipeline(voice_name[0])
-        _VOICES[voice_name] = pipeline.load_voice(voice_name)
-    return _VOICES[voice_name]
+    with _LOAD_LOCK:
+        pack = _VOICES.get(voice_name)
+        if pack is None:
+            pack = _VOICES[voice_name] = _get_pipeline(voice_name[0]).load_voice(voice_name)
+        memory_governor.touch(_VOICES, voice_name)
+    return pack
 
 
 def synthesize_to_file(
@@ -48,12 +79,19 @@ def synthesize_to_file(
     model_name: str = "hexgrad/Kokoro-82M",
     use_gpu: bool | None = None,
     seed: int | None = None,
+    on_chunk: Callable | None = None,
 ) -> Path:
-    """Synthesize speech using the Kokoro TTS library."""
+    """Synthesize speech using the Kokoro TTS library.
+
+    ``on_chunk(samples, sample_rate)`` receives each segment produced by the
+    pipeline as soon as the model has rendered it.
+    """
     import torch
     import soundfile as sf
     import random
 
+    from ..utils.timer import stage
+
     if seed is not None:
         random.seed(seed)
         torch.manual_seed(seed)
@@ -62,15 +100,18 @@ def synthesize_to_file(
     if use_gpu is None:
         use_gpu = torch.cuda.is_available()
 
-    model = _get_model(model_name, use_gpu)
-    pipeline = _get_pipeline(voice[0])
-    pack = _get_voice(voice)
+    with stage("model_load"):
+        model = _get_model(model_name, use_gpu)
+        pipeline = _get_pipeline(voice[0])
+        pack = _get_voice(voice)
 
     audio_parts = []
     for _, ps, _ in pipeline(text, voice, speed):
         ref_s = pack[len(ps) - 1]
         audio = model(ps, ref_s, speed)
         audio_parts.append(audio.cpu())
+        if on_chunk is not None:
+            on_chunk(audio_parts[-1].numpy(), 24000)
 
     if not audio_parts:
         raise RuntimeError("Kokoro TTS did not return audio")
@@ -78,7 +119,8 @@ def synthesize_to_file(
     audio = torch.cat(audio_parts, dim=-1).squeeze().numpy()
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(output_path), audio, 24000)
+    with stage("write"):
+        sf.write(str(output_path), audio, 24000)
     return output_path
 
 
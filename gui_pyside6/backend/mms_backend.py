@@ -1,6 +1,32 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import Callable
+
+from ..utils import memory_governor
+
+# Loaded models by (repository, device), kept resident between calls. Each
+# entry carries a lock because the generation settings are model attributes.
+_MODELS: dict[tuple[str, str], tuple] = {}
+_LOAD_LOCK = threading.Lock()
+memory_governor.register("mms", _MODELS, "model", _LOAD_LOCK)
+
+
+def _get_model(repo: str, device: str) -> tuple:
+    from transformers import VitsModel, VitsTokenizer
+
+    from ..utils.timer import note
+
+    key = (repo, device)
+    with _LOAD_LOCK:
+        note(model_cache="hit" if key in _MODELS else "miss")
+        if key not in _MODELS:
+            model = VitsModel.from_pretrained(repo).to(device)
+            tokenizer = VitsTokenizer.from_pretrained(repo)
+            _MODELS[key] = (model, tokenizer, threading.Lock())
+        memory_governor.touch(_MODELS, key)
+        return _MODELS[key]
 
 
 def synthesize_to_file(
@@ -8,9 +34,11 @@ def synthesize_to_file(
     output_path: Path,
     *,
     language: str = "eng",
+    lang: str | None = None,
     speaking_rate: float = 1.0,
     noise_scale: float = 0.667,
     noise_scale_duration: float = 0.8,
+    on_chunk: Callable | None = None,
 ) -> Path:
     """Synthesize speech using the MMS TTS model from Facebook.
 
@@ -22,34 +50,58 @@ def synthesize_to_file(
         Destination WAV file.
     language: str, optional
         ISO 639-3 language code, by default "eng".
+    lang: str | None, optional
+        Alias of ``language`` matching the other backends.
     speaking_rate: float, optional
         Rate multiplier controlling speech speed.
     noise_scale: float, optional
         Noise scale parameter.
     noise_scale_duration: float, optional
         Noise scale duration parameter.
+    on_chunk: Callable | None, optional
+        Enables sentence mode: each sentence is synthesized separately and
+        ``on_chunk(samples, sample_rate)`` is called as it completes.
     """
-    from transformers import VitsModel, VitsTokenizer
     import torch
     import soundfile as sf
 
+    from ..utils.timer import stage
+    from .model_store import resolve
+
     device = "cuda" if torch.cuda.is_available() else "cpu"
 
-    model = VitsModel.from_pretrained(f"facebook/mms-tts-{language}").to(device)
-    tokenizer = VitsTokenizer.from_pretrained(f"facebook/mms-tts-{language}")
+    repo = resolve(f"facebook/mms-tts-{lang or language}")
+    with stage("model_load"):
+        model, tokenizer, lock = _get_model(repo, device)
+
+    def generate(part: str):
+        with stage("preprocess"):
+            inputs = tokenizer(text=part, return_tensors="pt").to(device)
+        with lock, torch.no_grad():
+            model.speaking_rate = speaking_rate
+            model.noise_scale = noise_scale
+            model.noise_scale_duration = noise_scale_duration
+            outputs = model(**inputs)
+        return outputs.waveform[0].cpu().numpy().squeeze()
 
-    model.speaking_rate = speaking_rate
-    model.noise_scale = noise_scale
-    model.noise_scale_duration = noise_scale_duration
+    if on_chunk is None:
+        waveform = generate(text)
+    else:
+        import numpy as np
 
-    inputs = tokenizer(text=text, return_tensors="pt").to(device)
-    with torch.no_grad():
-        outputs = model(**inputs)
+        from ..utils.audio_stream import split_sentences
 
-    waveform = outputs.waveform[0].cpu().numpy().squeeze()
+        with stage("preprocess"):
+            sentences = split_sentences(text)
+        pieces = []
+        for sentence in sentences:
+            pieces.append(generate(sentence))
+            on_chunk(pieces[-1], model.config.sampling_rate)
+        waveform = np.concatenate(pieces) if pieces else generate(text)
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(output_path), waveform, model.config.sampling_rate)
+    with stage("write"):
+        sf.write(str(output_path), waveform, model.config.sampling_rate)
     return output_path
 
 
@@ -0,0 +1,300 @@
+"""Local store for model weights under ``~/.hybrid_tts/models``.
+
+Each backend lists the Hugging Face repositories it needs under ``models`` in
+its ``backend/metadata/<backend>.toml``. ``prefetch_backend`` downloads them
+into the store (optionally from a mirror) and records the size and sha256 of
+every file in ``manifest.json``. Downloads are checked against the checksums
+the hub publishes for the repository (sha256 of LFS weights, git blob ids of
+other files); when that metadata cannot be fetched the manifest only guards
+local integrity, i.e. that the files have not changed since they were stored.
+Backends call ``resolve`` to load from the store when a model is present and
+fall back to the hub id otherwise.
+
+Air-gapped machines can receive a copy of another machine's store (or any
+directory of ``org--name`` model folders) with ``import_models``; files are
+checked against the source manifest when one is present.
+
+::
+
+    python -m gui_pyside6.backend.model_store prefetch whisper mms
+    python -m gui_pyside6.backend.model_store import /media/usb/models
+    python -m gui_pyside6.backend.model_store verify
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+MODELS_DIR = Path.home() / ".hybrid_tts" / "models"
+MIRROR_ENV = "HYBRID_TTS_MODEL_MIRROR"
+
+# Framework weights the backends never load.
+_IGNORE_PATTERNS = ["*.h5", "*.msgpack", "*.ot", "*.tflite", "onnx/*"]
+
+_LOCK = threading.Lock()
+
+# Parsed manifests by path with the file stamp they were read at, so
+# ``resolve`` on every model load does not re-read the JSON.
+_MANIFESTS: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+
+
+def _manifest_file(root: Path | None = None) -> Path:
+    return (root or MODELS_DIR) / "manifest.json"
+
+
+def load_manifest(root: Path | None = None) -> dict:
+    """Return the manifest of the store at ``root``.
+
+    The result is cached until the file changes; treat it as read-only.
+    """
+    path = _manifest_file(root)
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _MANIFESTS.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except Exception:
+        return {}
+    _MANIFESTS[path] = (stamp, manifest)
+    return manifest
+
+
+def _save_manifest(manifest: dict) -> None:
+    path = _manifest_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def model_dir(repo_id: str, root: Path | None = None) -> Path:
+    return (root or MODELS_DIR) / repo_id.replace("/", "--")
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _git_blob_sha1(path: Path) -> str:
+    """The git object id of ``path``, as the hub reports for non-LFS files."""
+    digest = hashlib.sha1(f"blob {path.stat().st_size}\0".encode("ascii"))
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _upstream_checksums(repo_id: str, endpoint: str | None) -> dict[str, dict] | None:
+    """Checksums the hub publishes for the files ``prefetch`` downloads.
+
+    Returns None when the metadata is unavailable (offline mirror, old
+    ``huggingface_hub``); the download is then only checked locally.
+    """
+    try:
+        from huggingface_hub import HfApi
+
+        info = HfApi(endpoint=endpoint).model_info(repo_id, files_metadata=True)
+    except Exception as e:
+        print(f"[WARN] Could not fetch checksums for {repo_id}: {e}")
+        return None
+    expected = {}
+    for sibling in info.siblings or []:
+        rel = sibling.rfilename
+        if any(fnmatch.fnmatch(rel, pattern) for pattern in _IGNORE_PATTERNS):
+            continue
+        lfs = sibling.lfs
+        sha256 = lfs.get("sha256") if isinstance(lfs, dict) else getattr(lfs, "sha256", None)
+        if sha256:
+            expected[rel] = {"sha256": sha256}
+        elif sibling.blob_id:
+            expected[rel] = {"git_sha1": sibling.blob_id}
+    return expected
+
+
+def _hash_tree(directory: Path) -> dict[str, dict]:
+    files = {}
+    for path in sorted(directory.rglob("*")):
+        if path.is_file() and ".cache" not in path.relative_to(directory).parts:
+            rel = path.relative_to(directory).as_posix()
+            files[rel] = {"size": path.stat().st_size, "sha256": _sha256(path)}
+    return files
+
+
+def _commit(repo_id: str, staging: Path, source: str, expected: dict | None = None) -> Path:
+    """Verify ``staging``, move it into place and record it in the manifest."""
+    files = _hash_tree(staging)
+    if expected is not None:
+        bad = sorted(
+            rel for rel, info in expected.items()
+            if (
+                rel not in files
+                or ("sha256" in info and files[rel]["sha256"] != info["sha256"])
+                or ("git_sha1" in info and _git_blob_sha1(staging / rel) != info["git_sha1"])
+            )
+        )
+        if bad:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise ValueError(f"Checksum mismatch for {repo_id}: {', '.join(bad)}")
+    target = model_dir(repo_id)
+    with _LOCK:
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(staging, target)
+        manifest = dict(load_manifest())
+        manifest[repo_id] = {
+            "files": files,
+            "source": source,
+            "stored": datetime.now().isoformat(timespec="seconds"),
+        }
+        _save_manifest(manifest)
+    return target
+
+
+def is_stored(repo_id: str) -> bool:
+    """Return True if every file of ``repo_id`` is present with its recorded size."""
+    entry = load_manifest().get(repo_id)
+    if not entry:
+        return False
+    base = model_dir(repo_id)
+    for rel, info in entry["files"].items():
+        try:
+            if (base / rel).stat().st_size != info["size"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def resolve(repo_id: str) -> str:
+    """Return the local directory of ``repo_id`` if stored, else ``repo_id``."""
+    return str(model_dir(repo_id)) if is_stored(repo_id) else repo_id
+
+
+def verify(repo_id: str) -> list[str]:
+    """Return the files of ``repo_id`` whose sha256 does not match the manifest.
+
+    This is a local integrity check against the checksums recorded when the
+    model was stored.
+    """
+    entry = load_manifest().get(repo_id)
+    if not entry:
+        return ["<not stored>"]
+    base = model_dir(repo_id)
+    bad = []
+    for rel, info in entry["files"].items():
+        path = base / rel
+        if not path.is_file() or _sha256(path) != info["sha256"]:
+            bad.append(rel)
+    return bad
+
+
+def prefetch(repo_id: str, *, endpoint: str | None = None, force: bool = False) -> Path:
+    """Download ``repo_id`` into the store unless it is already present.
+
+    ``endpoint`` (or ``HYBRID_TTS_MODEL_MIRROR``) points the download at a
+    Hugging Face mirror. The files are checked against the hub's checksums
+    before they are moved into the store.
+    """
+    if not force and is_stored(repo_id):
+        return model_dir(repo_id)
+    from huggingface_hub import snapshot_download
+
+    endpoint = endpoint or os.environ.get(MIRROR_ENV) or None
+    staging = model_dir(repo_id).with_name(model_dir(repo_id).name + ".partial")
+    print(f"[INFO] Downloading {repo_id} into {MODELS_DIR}")
+    snapshot_download(
+        repo_id,
+        local_dir=str(staging),
+        endpoint=endpoint,
+        ignore_patterns=_IGNORE_PATTERNS,
+    )
+    expected = _upstream_checksums(repo_id, endpoint)
+    return _commit(repo_id, staging, endpoint or "hub", expected)
+
+
+def import_models(source: str | Path, repo_ids: list[str] | None = None) -> list[Path]:
+    """Copy models from ``source`` (e.g. another machine's store) into the store.
+
+    ``source`` holds one ``org--name`` folder per repository. If it contains
+    a ``manifest.json`` the copied files must match its checksums.
+    """
+    source = Path(source)
+    source_manifest = load_manifest(source)
+    if repo_ids is None:
+        repo_ids = sorted(source_manifest) or [
+            p.name.replace("--", "/", 1) for p in sorted(source.iterdir())
+            if p.is_dir() and "--" in p.name
+        ]
+    imported = []
+    for repo_id in repo_ids:
+        src = model_dir(repo_id, source)
+        if not src.is_dir():
+            print(f"[WARN] {repo_id} not found in {source}")
+            continue
+        staging = model_dir(repo_id).with_name(model_dir(repo_id).name + ".partial")
+        if staging.exists():
+            shutil.rmtree(staging)
+        shutil.copytree(src, staging)
+        expected = source_manifest.get(repo_id, {}).get("files")
+        imported.append(_commit(repo_id, staging, f"import:{source}", expected))
+    return imported
+
+
+def backend_models(name: str) -> list[str]:
+    """Return the model repositories listed for backend ``name``."""
+    from . import _registry
+
+    return list(_registry().metadata(name).get("models", []))
+
+
+def prefetch_backend(name: str, *, endpoint: str | None = None) -> list[Path]:
+    return [prefetch(repo_id, endpoint=endpoint) for repo_id in backend_models(name)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Manage the local model store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fetch = sub.add_parser("prefetch", help="download the models of backends")
+    fetch.add_argument("backends", nargs="+")
+    fetch.add_argument("--endpoint", help="Hugging Face mirror URL")
+    imp = sub.add_parser("import", help="copy models from a directory")
+    imp.add_argument("source")
+    imp.add_argument("repo_ids", nargs="*")
+    sub.add_parser("verify", help="check stored files against their checksums")
+    args = parser.parse_args(argv)
+
+    if args.command == "prefetch":
+        for backend in args.backends:
+            for path in prefetch_backend(backend, endpoint=args.endpoint):
+                print(path)
+    elif args.command == "import":
+        for path in import_models(args.source, args.repo_ids or None):
+            print(path)
+    else:
+        failed = False
+        for repo_id in sorted(load_manifest()):
+            bad = verify(repo_id)
+            failed |= bool(bad)
+            print(f"{repo_id}: {'ok' if not bad else 'corrupt ' + ', '.join(bad)}")
+        raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
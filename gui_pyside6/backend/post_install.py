@@ -0,0 +1,173 @@
+"""Warm up freshly installed backends.
+
+The first import of a large package compiles every ``.py`` file it touches,
+which makes the first synthesis after an install look like a hang. After an
+install ``finalize`` byte-compiles the backend's packages in parallel and
+then imports each backend in a separate interpreter to check that it works.
+Both timings are appended to the install log as ``precompile`` and
+``smoke_test`` entries. ``prefetch_models`` then downloads the backend's
+model weights into the model store so the first request does not wait for
+them.
+"""
+from __future__ import annotations
+
+import compileall
+import functools
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
+
+# Repository root, so ``gui_pyside6`` is importable in the smoke-test
+# subprocesses.
+_ROOT = Path(__file__).resolve().parents[2]
+
+_SMOKE_TIMEOUT = 300
+
+
+def _top_level_names(dist: metadata.Distribution) -> list[str]:
+    """Return the importable top-level names provided by ``dist``."""
+    text = dist.read_text("top_level.txt")
+    if text:
+        return [n.strip() for n in text.splitlines() if n.strip()]
+    names: set[str] = set()
+    for f in dist.files or []:
+        parts = f.parts
+        if len(parts) > 1 and not parts[0].endswith((".dist-info", ".egg-info", ".data")):
+            names.add(parts[0])
+        elif len(parts) == 1 and parts[0].endswith(".py"):
+            names.add(parts[0][:-3])
+    return sorted(n for n in names if n.isidentifier())
+
+
+def package_dirs(distributions: list[str]) -> tuple[list[Path], list[str]]:
+    """Return the source directories and top-level modules of ``distributions``."""
+    dirs: list[Path] = []
+    modules: list[str] = []
+    for name in distributions:
+        try:
+            dist = metadata.distribution(name)
+        except metadata.PackageNotFoundError:
+            continue
+        for top in _top_level_names(dist):
+            path = Path(dist.locate_file(top))
+            if path.is_dir():
+                dirs.append(path)
+            modules.append(top)
+    return dirs, modules
+
+
+def precompile(dirs: list[Path]) -> float:
+    """Byte-compile ``dirs`` using all CPU cores and return the elapsed time."""
+    start = time.perf_counter()
+    for path in dirs:
+        compileall.compile_dir(str(path), quiet=1, workers=0)
+    return time.perf_counter() - start
+
+
+def _import_in_subprocess(module: str) -> tuple[str, float, str | None]:
+    code = (
+        "from gui_pyside6.utils.install_utils import inject_hybrid_site_packages;"
+        "inject_hybrid_site_packages();"
+        f"import importlib; importlib.import_module({module!r})"
+    )
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(_ROOT),
+            capture_output=True,
+            text=True,
+            timeout=_SMOKE_TIMEOUT,
+        )
+        error = proc.stderr.strip().splitlines()[-1] if proc.returncode else None
+    except subprocess.TimeoutExpired:
+        error = f"timed out after {_SMOKE_TIMEOUT}s"
+    return module, time.perf_counter() - start, error or None
+
+
+def smoke_test(modules: list[str], workers: int | None = None) -> dict[str, tuple[float, str | None]]:
+    """Import each module in its own interpreter, several at a time.
+
+    Returns ``{module: (seconds, error)}`` where ``error`` is ``None`` on
+    success.
+    """
+    workers = workers or min(len(modules), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_import_in_subprocess, modules)
+    return {module: (elapsed, error) for module, elapsed, error in results}
+
+
+def backend_module(name: str) -> str | None:
+    """Return the ``gui_pyside6.backend`` submodule implementing ``name``."""
+    from . import BACKENDS, TRANSCRIBERS, _call_backend
+
+    func = BACKENDS.get(name) or TRANSCRIBERS.get(name)
+    if isinstance(func, functools.partial) and func.func is _call_backend:
+        return f"gui_pyside6.backend.{func.args[0]}"
+    module = getattr(func, "__module__", None)
+    return module if module and module != "__main__" else None
+
+
+def finalize(names: list[str]) -> dict[str, tuple[float, str | None]]:
+    """Precompile and smoke-test the installed backends ``names``.
+
+    Returns the smoke-test results keyed by module name.
+    """
+    from . import _log_action, _registry, _write_snapshot
+
+    registry = _registry()
+    modules: dict[str, str] = {}
+    for name in names:
+        dirs, top_level = package_dirs(registry.distributions(name))
+        elapsed = precompile(dirs)
+        print(f"[INFO] Precompiled {name} in {elapsed:.1f}s")
+        _log_action("precompile", name, [f"{elapsed:.2f}s", f"{len(dirs)} dirs"])
+        module = backend_module(name)
+        for mod in ([module] if module else []) + top_level:
+            modules.setdefault(mod, name)
+
+    results = smoke_test(list(modules)) if modules else {}
+    for name in names:
+        checks = {m: r for m, r in results.items() if modules[m] == name}
+        failed = [f"{m} ({err})" for m, (_, err) in checks.items() if err]
+        elapsed = max((t for t, _ in checks.values()), default=0.0)
+        status = "failed " + "; ".join(failed) if failed else "ok"
+        print(f"[INFO] Smoke test {name}: {status} in {elapsed:.1f}s")
+        _log_action("smoke_test", name, [f"{elapsed:.2f}s", status])
+    # The log entries change the environment fingerprint; keep the snapshot
+    # valid for the next start.
+    _write_snapshot()
+    return results
+
+
+def prefetch_models(names: list[str]) -> list[str]:
+    """Download the model weights of ``names`` into the model store.
+
+    Returns the repositories that failed to download.
+    """
+    from . import _log_action, _write_snapshot
+    from .model_store import backend_models, prefetch
+
+    failed: list[str] = []
+    for name in names:
+        repos = backend_models(name)
+        if not repos:
+            continue
+        start = time.perf_counter()
+        errors = []
+        for repo_id in repos:
+            try:
+                prefetch(repo_id)
+            except Exception as e:
+                print(f"[WARN] Failed to prefetch {repo_id}: {e}")
+                errors.append(repo_id)
+        elapsed = time.perf_counter() - start
+        status = "failed " + ", ".join(errors) if errors else "ok"
+        _log_action("prefetch", name, [f"{elapsed:.2f}s", status])
+        failed.extend(errors)
+    _write_snapshot()
+    return failed
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Mapping
+
+# Entry point group third-party packages use to register backends. Each entry
+# point must resolve to a callable accepting the ``BackendRegistry``.
+PLUGIN_GROUP = "hybrid_tts.backends"
+
+# Seconds between checks of the requirement and metadata files for changes.
+_CHECK_INTERVAL = 2.0
+
+
+def parse_distribution_name(package_spec: str) -> str:
+    """Return the pip distribution name for the given requirement spec."""
+    try:
+        from packaging.requirements import Requirement
+
+        return Requirement(package_spec).name
+    except Exception:
+        # Fallback to a simple split if packaging is not available or parsing fails
+        return package_spec.split("@")[0].strip().split()[0]
+
+
+class BackendRegistry:
+    """Index of backend requirements, features, categories and metadata.
+
+    ``backend_requirements.json`` and the TOML files in ``metadata/`` are
+    parsed on first use and kept in memory, so lookups are dictionary hits.
+    The files are re-read when their modification times change. Backends
+    registered at runtime (``register``) or by plugins survive reloads.
+    """
+
+    def __init__(
+        self,
+        requirements_file: Path,
+        metadata_dir: Path,
+        *,
+        backends: dict[str, Callable],
+        transcribers: dict[str, Callable],
+        features: dict[str, set[str]],
+        categories: Mapping[str, list[str]],
+    ) -> None:
+        self.requirements_file = Path(requirements_file)
+        self.metadata_dir = Path(metadata_dir)
+        self.backends = backends
+        self.transcribers = transcribers
+        self.features = features
+        self.categories = categories
+        self._lock = threading.RLock()
+        self._stamp: tuple | None = None
+        self._loaded_path: Path | None = None
+        self._next_check = 0.0
+        self._requirements: dict[str, list[str]] = {}
+        self._distributions: dict[str, list[str]] = {}
+        self._metadata: dict[str, dict] = {}
+        self._registered_requirements: dict[str, list[str]] = {}
+        self._registered_metadata: dict[str, dict] = {}
+        self._plugins_loaded = False
+
+    # ---------------- loading -----------------
+
+    def _file_stamp(self) -> tuple:
+        stamps = []
+        for path in [self.requirements_file, self.metadata_dir, *self._metadata_files()]:
+            try:
+                st = path.stat()
+                stamps.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamps.append((str(path), None, None))
+        return tuple(stamps)
+
+    def _metadata_files(self) -> list[Path]:
+        if not self.metadata_dir.is_dir():
+            return []
+        return sorted(self.metadata_dir.glob("*.toml"))
+
+    def _load(self) -> None:
+        requirements: dict[str, list[str]] = {}
+        if self.requirements_file.exists():
+            try:
+                with self.requirements_file.open(encoding="utf-8") as f:
+                    requirements = {k: list(v) for k, v in json.load(f).items()}
+            except Exception as e:
+                print(f"[WARN] Failed to read {self.requirements_file}: {e}")
+        metadata: dict[str, dict] = {}
+        try:
+            import tomllib  # Python 3.11+
+
+            for path in self._metadata_files():
+                with path.open("rb") as f:
+                    metadata[path.stem] = tomllib.load(f)
+        except Exception:
+            pass
+
+        requirements.update(self._registered_requirements)
+        for name, data in self._registered_metadata.items():
+            metadata.setdefault(name, {}).update(data)
+        self._requirements = requirements
+        self._distributions = {
+            name: [parse_distribution_name(p) for p in pkgs]
+            for name, pkgs in requirements.items()
+        }
+        self._metadata = metadata
+
+    def _ensure_loaded(self) -> None:
+        now = time.monotonic()
+        if self._loaded_path == self.requirements_file and now < self._next_check:
+            return
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp != self._stamp or self._loaded_path != self.requirements_file:
+                self._load()
+                self._stamp = stamp
+                self._loaded_path = self.requirements_file
+            self._next_check = now + _CHECK_INTERVAL
+
+    def reload(self) -> None:
+        """Re-read requirement and metadata files unconditionally."""
+        with self._lock:
+            self._loaded_path = None
+            self._ensure_loaded()
+
+    # ---------------- lookups -----------------
+
+    def requirements(self, name: str) -> list[str]:
+        self._ensure_loaded()
+        return list(self._requirements.get(name, []))
+
+    def all_requirements(self) -> dict[str, list[str]]:
+        self._ensure_loaded()
+        return {k: list(v) for k, v in self._requirements.items()}
+
+    def distributions(self, name: str) -> list[str]:
+        """Return the distribution names of the backend's requirements."""
+        self._ensure_loaded()
+        return list(self._distributions.get(name, []))
+
+    def metadata(self, name: str) -> dict:
+        self._ensure_loaded()
+        return self._metadata.get(name, {})
+
+    def metadata_names(self) -> list[str]:
+        self._ensure_loaded()
+        return list(self._metadata)
+
+    def backend_features(self, name: str) -> set[str]:
+        return self.features.get(name, set())
+
+    def category(self, name: str) -> str | None:
+        for category, names in self.categories.items():
+            if name in names:
+                return category
+        if name in self.transcribers:
+            return "transcriber"
+        return None
+
+    # ---------------- registration -----------------
+
+    def register(
+        self,
+        name: str,
+        func: Callable,
+        *,
+        category: str = "tts",
+        features: set[str] | None = None,
+        requirements: list[str] | None = None,
+        metadata: dict | None = None,
+    ) -> None:
+        """Register a backend at runtime.
+
+        ``category`` is one of the keys of ``categories`` (``tts``, ``tool``,
+        ``experimental``) or ``transcriber``. ``func`` has the same signature
+        as the built-in backends of that category.
+        """
+        with self._lock:
+            if category == "transcriber":
+                self.transcribers[name] = func
+            else:
+                if category not in self.categories:
+                    raise ValueError(f"Unknown backend category: {category}")
+                self.backends[name] = func
+                if name not in self.categories[category]:
+                    self.categories[category].append(name)
+            self.features[name] = set(features or ())
+            if requirements is not None:
+                self._registered_requirements[name] = list(requirements)
+            if metadata:
+                self._registered_metadata[name] = dict(metadata)
+            # Fold the registration into the cached indexes.
+            self._loaded_path = None
+
+    def discover_plugins(self, group: str = PLUGIN_GROUP) -> list[str]:
+        """Load backends advertised through the ``group`` entry points.
+
+        Returns the names of the entry points that loaded successfully.
+        Discovery only runs once per registry.
+        """
+        if self._plugins_loaded:
+            return []
+        self._plugins_loaded = True
+        from importlib import metadata
+
+        loaded: list[str] = []
+        try:
+            entry_points = metadata.entry_points(group=group)
+        except Exception as e:
+            print(f"[WARN] Backend plugin discovery failed: {e}")
+            return loaded
+        for ep in entry_points:
+            try:
+                hook = ep.load()
+                hook(self)
+                loaded.append(ep.name)
+            except Exception as e:
+                print(f"[WARN] Failed to load backend plugin {ep.name}: {e}")
+        return loaded
+
+
+class MetadataView(Mapping):
+    """Read-only mapping of backend name to one metadata field."""
+
+    def __init__(self, registry: BackendRegistry, field: str, default: str = "") -> None:
+        self._registry = registry
+        self._field = field
+        self._default = default
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._registry.metadata_names():
+            raise KeyError(name)
+        return self._registry.metadata(name).get(self._field, self._default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registry.metadata_names())
+
+    def __len__(self) -> int:
+        return len(self._registry.metadata_names())
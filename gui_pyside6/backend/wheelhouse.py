@@ -0,0 +1,159 @@
+"""Pinned lockfiles and an offline wheelhouse for backend installs.
+
+Lockfiles live in ``backend/locks/<backend>.txt`` and are compiled from
+``backend_requirements.json`` with ``uv pip compile``. A wheelhouse is a
+directory of wheels downloaded from those lockfiles; when one is configured
+installs use ``--find-links <dir> --no-index`` and never touch the network.
+
+On a connected machine::
+
+    python -m gui_pyside6.backend.wheelhouse lock
+    python -m gui_pyside6.backend.wheelhouse build /srv/wheelhouse
+
+Then copy the directory to the offline machine and point
+``HYBRID_TTS_WHEELHOUSE`` (or the ``wheelhouse`` preference) at it.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from shutil import which
+from typing import Callable
+
+LOCK_DIR = Path(__file__).with_name("locks")
+WHEELHOUSE_ENV = "HYBRID_TTS_WHEELHOUSE"
+
+
+def lockfile_path(name: str) -> Path:
+    return LOCK_DIR / f"{name}.txt"
+
+
+def locked_requirements(name: str) -> list[str] | None:
+    """Return the pinned requirements of ``name`` or ``None`` without a lockfile."""
+    path = lockfile_path(name)
+    if not path.exists():
+        return None
+    packages = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            packages.append(line)
+    return packages
+
+
+def wheelhouse_dir() -> Path | None:
+    """Return the configured wheelhouse directory, if any."""
+    value = os.environ.get(WHEELHOUSE_ENV)
+    if not value:
+        from ..utils.preferences import load_preferences
+
+        value = load_preferences().get("wheelhouse")
+    if not value:
+        return None
+    path = Path(value).expanduser()
+    return path if path.is_dir() else None
+
+
+def install_args() -> list[str]:
+    """Return extra pip/uv arguments that restrict installs to the wheelhouse."""
+    path = wheelhouse_dir()
+    if path is None:
+        return []
+    return ["--find-links", str(path), "--no-index"]
+
+
+def compile_lockfile(
+    name: str,
+    packages: list[str],
+    *,
+    no_deps: bool = False,
+    python_version: str | None = None,
+) -> Path:
+    """Pin ``packages`` for backend ``name`` into its lockfile.
+
+    ``no_deps`` locks only the listed packages, matching how backends that
+    reuse the application's torch are installed.
+    """
+    if which("uv") is None:
+        raise RuntimeError("uv is required to compile lockfiles")
+    LOCK_DIR.mkdir(exist_ok=True)
+    out = lockfile_path(name)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / f"{name}.in"
+        src.write_text("\n".join(packages) + "\n", encoding="utf-8")
+        cmd = ["uv", "pip", "compile", str(src), "-o", str(out), "--quiet"]
+        cmd += ["--python-version", python_version or f"{sys.version_info.major}.{sys.version_info.minor}"]
+        if no_deps:
+            cmd.append("--no-deps")
+        subprocess.check_call(cmd)
+    return out
+
+
+def lock_backends(names: list[str] | None = None) -> list[Path]:
+    """Compile lockfiles for ``names`` (all backends with requirements by default)."""
+    from . import _TORCH_BACKENDS, _registry
+
+    requirements = _registry().all_requirements()
+    paths = []
+    for name in names or sorted(requirements):
+        packages = requirements.get(name)
+        if not packages:
+            continue
+        print(f"[INFO] Locking {name}")
+        paths.append(compile_lockfile(name, packages, no_deps=name in _TORCH_BACKENDS))
+    return paths
+
+
+def build_wheelhouse(
+    dest: str | Path,
+    names: list[str] | None = None,
+    *,
+    python_exe: str = sys.executable,
+    on_output: Callable[[str], None] | None = None,
+) -> Path:
+    """Download wheels for ``names`` into ``dest`` for offline installs.
+
+    Locked requirements are used where a lockfile exists, otherwise the raw
+    requirements from ``backend_requirements.json``.
+    """
+    from . import _TORCH_BACKENDS, _registry, _run_install_command
+
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    requirements = _registry().all_requirements()
+    for name in names or sorted(requirements):
+        locked = locked_requirements(name)
+        packages = locked if locked is not None else requirements.get(name, [])
+        if not packages:
+            continue
+        print(f"[INFO] Downloading wheels for {name}")
+        cmd = [python_exe, "-m", "pip", "download", "-d", str(dest)]
+        if locked is not None or name in _TORCH_BACKENDS:
+            cmd.append("--no-deps")
+        _run_install_command(cmd + packages, on_output)
+    return dest
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    lock = sub.add_parser("lock", help="compile per-backend lockfiles")
+    lock.add_argument("backends", nargs="*")
+    build = sub.add_parser("build", help="download wheels for offline installs")
+    build.add_argument("dest")
+    build.add_argument("backends", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.command == "lock":
+        for path in lock_backends(args.backends or None):
+            print(path)
+    else:
+        print(build_wheelhouse(args.dest, args.backends or None))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,106 @@
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
+
+from ..utils import memory_governor
+
+# Whisper operates on 30 second windows. Longer inputs are split into
+# windows of this length and decoded in batches by the pipeline.
+_CHUNK_LENGTH_S = 30.0
+# Sample rate expected by Whisper feature extractors.
+_SAMPLE_RATE = 16000
+_AUDIO_EXTENSIONS = {".wav", ".flac", ".mp3", ".ogg", ".opus", ".m4a", ".aac"}
+
+# Draft models for speculative decoding. A draft must share the target's
+# tokenizer; multilingual checkpoints before large-v3 all share one with
+# ``whisper-tiny``, while large-v2/v3 pair with their distilled versions.
+_DRAFT_MODELS = {
+    "openai/whisper-large-v2": "distil-whisper/distil-large-v2",
+    "openai/whisper-large-v3": "distil-whisper/distil-large-v3",
+}
+_DEFAULT_DRAFT_MODEL = "openai/whisper-tiny"
+
+_PIPELINES: dict[tuple[str, int], object] = {}
+_ASSISTANTS: dict[tuple[str, int], object] = {}
+memory_governor.register("whisper", _PIPELINES, "pipeline")
+memory_governor.register("whisper", _ASSISTANTS, "draft model")
+
+
+def _get_pipeline(model_name: str, device: int):
+    """Return a cached ASR pipeline for ``model_name`` on ``device``."""
+    key = (model_name, device)
+    asr = _PIPELINES.get(key)
+    if asr is None:
+        from transformers import pipeline
+
+        from .model_store import resolve
+
+        asr = _PIPELINES[key] = pipeline(
+            "automatic-speech-recognition", model=resolve(model_name), device=device
+        )
+    memory_governor.touch(_PIPELINES, key)
+    return asr
+
+
+def _get_assistant(model_name: str, device: int):
+    """Return a cached draft model used for assisted generation."""
+    key = (model_name, device)
+    model = _ASSISTANTS.get(key)
+    if model is None:
+        from transformers import AutoModelForSpeechSeq2Seq
+
+        from .model_store import resolve
+
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(resolve(model_name))
+        if device >= 0:
+            model = model.to(f"cuda:{device}")
+        model = _ASSISTANTS[key] = model.eval()
+    memory_governor.touch(_ASSISTANTS, key)
+    return model
+
+
+def _draft_model_for(model_name: str) -> str:
+    return _DRAFT_MODELS.get(model_name, _DEFAULT_DRAFT_MODEL)
+
+
+def _speculative_kwargs(
+    model_name: str, device: int, speculative: bool, assistant_model: str | None
+) -> dict:
+    """Return pipeline call arguments enabling speculative decoding.
+
+    The draft model proposes tokens and the target model verifies them in one
+    forward pass, so greedy output is identical to the target model alone.
+    """
+    if not speculative and not assistant_model:
+        return {}
+    draft = assistant_model or _draft_model_for(model_name)
+    if draft == model_name:
+        return {}
+    # Assisted generation only supports a batch size of one.
+    return {
+        "generate_kwargs": {"assistant_model": _get_assistant(draft, device)},
+        "batch_size": 1,
+    }
+
+
+def _audio_duration(audio_path: Path) -> float:
+    """Return the duration of ``audio_path`` in seconds or ``0.0`` if unknown."""
+    try:
+        import soundfile as sf
+
+        info = sf.info(str(audio_path))
+        return info.frames / float(info.samplerate)
+    except Exception:
+        try:
+            import torchaudio
+
+            info = torchaudio.info(str(audio_path))
+            return info.num_frames / float(info.sample_rate)
+        except Exception:
+            return 0.0
 
 
 def transcribe_to_text(
@@ -8,6 +108,11 @@ def transcribe_to_text(
     *,
     model_name: str = "openai/whisper-small",
     return_timestamps: bool | None = None,
+    chunk_length_s: float | None = None,
+    batch_size: int = 8,
+    vad: bool = False,
+    speculative: bool = False,
+    assistant_model: str | None = None,
 ) -> str:
     """Transcribe speech from ``audio_path`` using a Whisper model.
 
@@ -21,36 +126,353 @@ def transcribe_to_text(
         If ``None``, automatically enable timestamps when the input audio
         duration is greater than 30 seconds. Otherwise, explicitly pass
         ``True`` or ``False`` to control timestamp generation.
+    chunk_length_s:
+        Length of the windows long-form audio is split into. If ``None``,
+        audio longer than 30 seconds is chunked into 30 second windows and
+        shorter audio is processed in a single pass.
+    batch_size:
+        Number of chunks decoded together for long-form audio.
+    vad:
+        Detect speech with an energy based voice activity detector first and
+        only send the speech regions to the model.
+    speculative:
+        Use speculative decoding: a smaller draft model proposes tokens that
+        ``model_name`` verifies. Output matches the target model.
+    assistant_model:
+        HuggingFace identifier of the draft model. Implies ``speculative``.
+        Defaults to a distilled or tiny Whisper sharing the target tokenizer.
     Returns
     -------
     str
         Transcribed text output.
     """
-    from transformers import pipeline
+    if vad:
+        result = transcribe_segments(
+            audio_path,
+            model_name=model_name,
+            return_timestamps=bool(return_timestamps),
+            batch_size=batch_size,
+            speculative=speculative,
+            assistant_model=assistant_model,
+        )
+        return result["text"]
+
     import torch
 
+    duration = None
+    if return_timestamps is None or chunk_length_s is None:
+        duration = _audio_duration(audio_path)
     if return_timestamps is None:
-        duration = 0.0
-        try:
-            import soundfile as sf
-
-            info = sf.info(str(audio_path))
-            duration = info.frames / float(info.samplerate)
-        except Exception:
-            try:
-                import torchaudio
-
-                info = torchaudio.info(str(audio_path))
-                duration = info.num_frames / float(info.sample_rate)
-            except Exception:
-                duration = 0.0
-        return_timestamps = duration > 30.0
+        return_timestamps = duration > _CHUNK_LENGTH_S
+    if chunk_length_s is None and duration > _CHUNK_LENGTH_S:
+        chunk_length_s = _CHUNK_LENGTH_S
 
     device = 0 if torch.cuda.is_available() else -1
-    pipe = pipeline(
-        "automatic-speech-recognition", model=model_name, device=device
-    )
-    result = pipe(str(audio_path), return_timestamps=return_timestamps)
+    pipe = _get_pipeline(model_name, device)
+
+    call_kwargs: dict = {"return_timestamps": return_timestamps}
+    if chunk_length_s:
+        call_kwargs["chunk_length_s"] = chunk_length_s
+        call_kwargs["batch_size"] = max(1, int(batch_size))
+    call_kwargs.update(_speculative_kwargs(model_name, device, speculative, assistant_model))
+    result = pipe(str(audio_path), **call_kwargs)
     if isinstance(result, dict):
         return result.get("text", "")
     return str(result)
+
+
+def _collect_audio_files(sources: Path | str | Iterable[Path | str]) -> list[Path]:
+    """Expand directories in ``sources`` into a sorted list of audio files."""
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    files: list[Path] = []
+    for src in sources:
+        src = Path(src)
+        if src.is_dir():
+            files.extend(
+                sorted(
+                    p
+                    for p in src.rglob("*")
+                    if p.is_file() and p.suffix.lower() in _AUDIO_EXTENSIONS
+                )
+            )
+        else:
+            files.append(src)
+    return files
+
+
+def _resample(audio, orig_sr: int, target_sr: int):
+    """Resample a mono float32 array from ``orig_sr`` to ``target_sr``."""
+    import numpy as np
+
+    if orig_sr == target_sr or audio.size == 0:
+        return audio
+    try:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+
+        g = gcd(orig_sr, target_sr)
+        return resample_poly(audio, target_sr // g, orig_sr // g).astype(np.float32)
+    except ImportError:
+        n_out = int(round(audio.size * target_sr / orig_sr))
+        x_out = np.linspace(0, audio.size - 1, n_out)
+        return np.interp(x_out, np.arange(audio.size), audio).astype(np.float32)
+
+
+def _load_audio(audio_path: Path, sample_rate: int = _SAMPLE_RATE):
+    """Decode ``audio_path`` to a mono float32 array at ``sample_rate``."""
+    import numpy as np
+
+    try:
+        import soundfile as sf
+
+        data, sr = sf.read(str(audio_path), dtype="float32", always_2d=True)
+        audio = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+    except Exception:
+        # Formats libsndfile cannot decode (AAC, M4A) go through ffmpeg.
+        from transformers.pipelines.audio_utils import ffmpeg_read
+
+        audio = ffmpeg_read(Path(audio_path).read_bytes(), sample_rate)
+        sr = sample_rate
+    return np.ascontiguousarray(_resample(audio, sr, sample_rate), dtype=np.float32)
+
+
+def _speech_parts(audio) -> tuple[list[tuple[float, object]], float]:
+    """Split ``audio`` into speech regions.
+
+    Returns the ``(offset_seconds, samples)`` of each region and the number of
+    seconds of silence that were skipped.
+    """
+    from ..utils.vad import detect_speech_regions
+
+    regions = detect_speech_regions(audio, _SAMPLE_RATE)
+    parts = [(start / _SAMPLE_RATE, audio[start:end]) for start, end in regions]
+    kept = sum(end - start for start, end in regions)
+    return parts, (audio.size - kept) / _SAMPLE_RATE
+
+
+def _run_parts(
+    pipe, parts, *, batch_size: int, return_timestamps: bool, extra: dict | None = None
+) -> list:
+    """Run ``pipe`` over ``(offset, samples)`` parts and return raw results."""
+    if not parts:
+        return []
+    call_kwargs: dict = {"batch_size": batch_size, "return_timestamps": return_timestamps}
+    if any(samples.size > _CHUNK_LENGTH_S * _SAMPLE_RATE for _, samples in parts):
+        call_kwargs["chunk_length_s"] = _CHUNK_LENGTH_S
+    call_kwargs.update(extra or {})
+    inputs = [{"raw": samples, "sampling_rate": _SAMPLE_RATE} for _, samples in parts]
+    return list(pipe(inputs, **call_kwargs))
+
+
+def _to_segments(parts, results) -> list[dict]:
+    """Convert pipeline results to segments on the original timeline."""
+    segments: list[dict] = []
+    for (offset, samples), result in zip(parts, results):
+        if not isinstance(result, dict):
+            result = {"text": str(result)}
+        part_end = offset + samples.size / _SAMPLE_RATE
+        chunks = result.get("chunks")
+        if chunks:
+            for chunk in chunks:
+                start, end = (tuple(chunk.get("timestamp") or ()) + (None, None))[:2]
+                segments.append(
+                    {
+                        "start": offset + (start or 0.0),
+                        # Whisper leaves the end of a cut-off final chunk open.
+                        "end": offset + end if end is not None else part_end,
+                        "text": chunk.get("text", ""),
+                    }
+                )
+        else:
+            segments.append(
+                {"start": offset, "end": part_end, "text": result.get("text", "")}
+            )
+    return segments
+
+
+def _join_segments(segments: list[dict]) -> str:
+    return " ".join(s["text"].strip() for s in segments if s["text"].strip())
+
+
+def transcribe_segments(
+    audio_path: Path,
+    *,
+    model_name: str = "openai/whisper-small",
+    return_timestamps: bool = False,
+    batch_size: int = 8,
+    vad: bool = True,
+    speculative: bool = False,
+    assistant_model: str | None = None,
+) -> dict:
+    """Transcribe ``audio_path`` and return timestamped segments.
+
+    With ``vad`` enabled, silence is removed before inference and segment
+    timestamps are mapped back to positions in the original file.
+    ``speculative`` and ``assistant_model`` behave as in
+    :func:`transcribe_to_text`.
+
+    Returns
+    -------
+    dict
+        ``text``: the full transcript, ``segments``: a list of dictionaries
+        with ``start``, ``end`` (seconds) and ``text``, ``duration``: length
+        of the input in seconds and ``skipped``: seconds of audio that were
+        not sent to the model.
+    """
+    import torch
+
+    audio = _load_audio(Path(audio_path))
+    duration = audio.size / _SAMPLE_RATE
+    if vad:
+        parts, skipped = _speech_parts(audio)
+    else:
+        parts, skipped = [(0.0, audio)], 0.0
+    if duration:
+        print(
+            f"[INFO] VAD skipped {skipped:.1f}s of {duration:.1f}s "
+            f"({100.0 * skipped / duration:.0f}%)"
+        )
+
+    device = 0 if torch.cuda.is_available() else -1
+    pipe = _get_pipeline(model_name, device)
+    results = _run_parts(
+        pipe,
+        parts,
+        batch_size=max(1, int(batch_size)),
+        return_timestamps=return_timestamps,
+        extra=_speculative_kwargs(model_name, device, speculative, assistant_model),
+    )
+    segments = _to_segments(parts, results)
+    return {
+        "text": _join_segments(segments),
+        "segments": segments,
+        "duration": duration,
+        "skipped": skipped,
+    }
+
+
+def _decode(audio_path: Path, vad: bool):
+    audio = _load_audio(audio_path)
+    if vad:
+        return _speech_parts(audio)
+    return [(0.0, audio)], 0.0
+
+
+def transcribe_batch(
+    sources: Path | str | Iterable[Path | str],
+    manifest_path: Path,
+    *,
+    model_name: str = "openai/whisper-small",
+    batch_size: int = 8,
+    num_workers: int = 4,
+    prefetch_batches: int = 2,
+    return_timestamps: bool = False,
+    vad: bool = False,
+) -> Path:
+    """Transcribe many audio files and write the results to a JSONL manifest.
+
+    Files are grouped into batches of similar duration, probed on the
+    decode threads while the model loads. Decoding and resampling run in
+    the same thread pool, which stays ``prefetch_batches`` batches ahead of
+    the model, so inference does not wait on disk or ffmpeg.
+
+    Parameters
+    ----------
+    sources:
+        A directory, an audio file, or an iterable of either. Directories are
+        searched recursively for audio files.
+    manifest_path:
+        Destination JSONL file. One line is written per input file with the
+        ``audio`` path, ``duration`` in seconds and either ``text`` or
+        ``error``.
+    model_name:
+        HuggingFace model identifier.
+    batch_size:
+        Number of files passed to the pipeline at once.
+    num_workers:
+        Number of decode threads.
+    prefetch_batches:
+        How many batches to decode ahead of the one being transcribed.
+    return_timestamps:
+        Include timestamped ``segments`` in the manifest.
+    vad:
+        Skip silence with the voice activity detector. The decode threads run
+        detection and the manifest records the ``skipped`` seconds per file.
+    Returns
+    -------
+    Path
+        Path of the written manifest.
+    """
+    import torch
+
+    files = _collect_audio_files(sources)
+    batch_size = max(1, int(batch_size))
+    prefetch = max(1, int(prefetch_batches))
+    device = 0 if torch.cuda.is_available() else -1
+
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, num_workers)) as pool:
+        # The decode threads probe the durations while the model loads.
+        probed = pool.map(_audio_duration, files)
+        pipe = _get_pipeline(model_name, device)
+        durations = dict(zip(files, probed))
+        # Similar lengths in one batch keep padding, and wasted compute, low.
+        files.sort(key=lambda p: durations[p])
+        batches = [files[i : i + batch_size] for i in range(0, len(files), batch_size)]
+
+        with manifest_path.open("w", encoding="utf-8") as out:
+            pending: list[list] = []
+
+            def _submit(index: int) -> None:
+                if index < len(batches):
+                    pending.append([(p, pool.submit(_decode, p, vad)) for p in batches[index]])
+
+            def _write(record: dict) -> None:
+                out.write(json.dumps(record) + "\n")
+
+            for index in range(prefetch + 1):
+                _submit(index)
+            for index in range(len(batches)):
+                decoded = pending.pop(0)
+                _submit(index + prefetch + 1)
+
+                ready: list[tuple[Path, list, float]] = []
+                for path, future in decoded:
+                    try:
+                        parts, skipped = future.result()
+                    except Exception as e:
+                        _write({"audio": str(path), "duration": durations[path], "error": str(e)})
+                        continue
+                    ready.append((path, parts, skipped))
+                if not ready:
+                    continue
+
+                all_parts = [part for _, parts, _ in ready for part in parts]
+                try:
+                    results = _run_parts(
+                        pipe, all_parts, batch_size=batch_size, return_timestamps=return_timestamps
+                    )
+                except Exception as e:
+                    for path, _, _ in ready:
+                        _write({"audio": str(path), "duration": durations[path], "error": str(e)})
+                    continue
+
+                pos = 0
+                for path, parts, skipped in ready:
+                    segments = _to_segments(parts, results[pos : pos + len(parts)])
+                    pos += len(parts)
+                    record = {
+                        "audio": str(path),
+                        "duration": durations[path],
+                        "text": _join_segments(segments),
+                    }
+                    if vad:
+                        record["skipped"] = skipped
+                    if return_timestamps:
+                        record["segments"] = segments
+                    _write(record)
+                out.flush()
+    return manifest_path
@@ -0,0 +1,112 @@
+"""Compare Whisper transcription engines on the same audio clips.
+
+Run from the repository root::
+
+    python -m gui_pyside6.benchmarks.bench_whisper clip1.wav clip2.wav --model small
+
+Each engine transcribes every clip once to load its model (reported as
+``load``), then ``--repeat`` more times for the timed runs. The real-time
+factor (RTF) is processing time divided by audio duration; lower is faster.
+``same`` reports whether an engine produced the same transcripts as the
+first engine, which matters for speculative decoding where output must not
+change.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from ..backend import TRANSCRIBERS, ensure_backend_installed
+from ..backend.post_install import finalize
+from ..backend.whisper_backend import _audio_duration
+
+
+def _hf_model(name: str) -> str:
+    return name if "/" in name else f"openai/whisper-{name}"
+
+
+# Engine name -> (TRANSCRIBERS key, extra keyword arguments)
+ENGINES: dict[str, tuple[str, dict]] = {
+    "whisper": ("whisper", {}),
+    "whisper_speculative": ("whisper", {"speculative": True}),
+    "faster_whisper": ("faster_whisper", {}),
+}
+
+
+def run_benchmark(
+    clips: list[Path],
+    *,
+    model: str = "small",
+    engines: list[str] | None = None,
+    repeat: int = 1,
+) -> list[dict]:
+    """Time each engine on ``clips`` and return one result row per engine."""
+    engines = engines or list(ENGINES)
+    audio_seconds = sum(_audio_duration(c) for c in clips)
+    rows: list[dict] = []
+    for name in engines:
+        backend, extra = ENGINES[name]
+        if ensure_backend_installed(backend):
+            # Keep first-import compilation out of the load time.
+            finalize([backend])
+        func = TRANSCRIBERS[backend]
+        kwargs = {"model_name": _hf_model(model), **extra}
+
+        start = time.perf_counter()
+        texts = [func(clip, **kwargs) for clip in clips]
+        load = time.perf_counter() - start
+
+        timings = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            texts = [func(clip, **kwargs) for clip in clips]
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        rows.append(
+            {
+                "engine": name,
+                "model": model,
+                "clips": len(clips),
+                "audio_s": round(audio_seconds, 2),
+                "first_run_s": round(load, 3),
+                "best_s": round(best, 3),
+                "rtf": round(best / audio_seconds, 4) if audio_seconds else None,
+                "texts": texts,
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Whisper engines")
+    parser.add_argument("clips", nargs="+", type=Path, help="Audio files to transcribe")
+    parser.add_argument("--model", default="small", help="Whisper model size")
+    parser.add_argument(
+        "--engines", nargs="+", choices=sorted(ENGINES), help="Engines to compare"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per engine")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(args.clips, model=args.model, engines=args.engines, repeat=args.repeat)
+    baseline = rows[0]["best_s"] if rows else None
+    reference = rows[0]["texts"] if rows else None
+    print(
+        f"{'engine':<24}{'first run':>12}{'best':>10}{'RTF':>10}{'speedup':>10}{'same':>7}"
+    )
+    for row in rows:
+        speedup = baseline / row["best_s"] if baseline and row["best_s"] else 0.0
+        rtf = f"{row['rtf']:.3f}" if row["rtf"] is not None else "n/a"
+        row["same_output"] = row["texts"] == reference
+        print(
+            f"{row['engine']:<24}{row['first_run_s']:>11.2f}s{row['best_s']:>9.2f}s"
+            f"{rtf:>10}{speedup:>9.2f}x{'yes' if row['same_output'] else 'no':>7}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import importlib.util
 import os
 from PySide6 import QtWidgets
 from gui_pyside6.utils.install_utils import inject_hybrid_site_packages
@@ -8,12 +9,12 @@ from gui_pyside6.ui.main_window import MainWindow
 
 
 def main():
-    torch_missing = False
-    try:
-        import torch  # noqa: F401
-    except Exception:
-        if os.environ.get("UV_APP_DRY") != "1":
-            torch_missing = True
+    # Only look torch up; importing it here would delay the first paint by
+    # several seconds.
+    torch_missing = (
+        importlib.util.find_spec("torch") is None
+        and os.environ.get("UV_APP_DRY") != "1"
+    )
     app = QtWidgets.QApplication([])
     window = MainWindow(torch_missing=torch_missing)
     window.show()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from PySide6 import QtCore
+
+from ..utils.history_store import HistoryEntry, HistoryStore
+from ..utils.timer import summarize
+
+ModelBase = (
+    QtCore.QAbstractListModel
+    if isinstance(getattr(QtCore, "QAbstractListModel", None), type)
+    else object
+)
+
+_DISPLAY_ROLE = getattr(getattr(QtCore.Qt, "ItemDataRole", QtCore.Qt), "DisplayRole", 0)
+_TOOLTIP_ROLE = getattr(getattr(QtCore.Qt, "ItemDataRole", QtCore.Qt), "ToolTipRole", 3)
+_USER_ROLE = getattr(QtCore.Qt, "UserRole", 256)
+
+
+class HistoryModel(ModelBase):
+    """List model over a ``HistoryStore`` that loads rows page by page.
+
+    Only the rows the view has scrolled to are fetched (``canFetchMore`` /
+    ``fetchMore``), so opening a history with tens of thousands of entries
+    reads a single page. ``set_filter`` restricts the rows to a full-text
+    query and/or a backend.
+    """
+
+    PAGE_SIZE = 200
+
+    def __init__(self, store: HistoryStore, parent=None):
+        if ModelBase is object:
+            super().__init__()
+        else:
+            super().__init__(parent)
+        self.store = store
+        self._entries: list[HistoryEntry] = []
+        self._query: str | None = None
+        self._backend: str | None = None
+        self._exhausted = False
+        self.fetchMore()
+
+    def _call(self, name: str, *args):
+        method = getattr(super(), name, None)
+        if method is not None:
+            method(*args)
+
+    @staticmethod
+    def _root():
+        return QtCore.QModelIndex() if ModelBase is not object else None
+
+    # ---------------- Qt model interface -----------------
+
+    def rowCount(self, parent=None) -> int:
+        if parent is not None and hasattr(parent, "isValid") and parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        row = index.row() if hasattr(index, "row") else int(index)
+        if not 0 <= row < len(self._entries):
+            return None
+        entry = self._entries[row]
+        if role == _DISPLAY_ROLE:
+            return entry.label
+        if role == _TOOLTIP_ROLE:
+            tip = f"{entry.backend}: {entry.text[:200]}"
+            if entry.stages:
+                tip += "\n" + summarize(entry.stages)
+            return tip
+        if role == _USER_ROLE:
+            return entry
+        return None
+
+    def canFetchMore(self, parent=None) -> bool:
+        return not self._exhausted
+
+    def fetchMore(self, parent=None) -> None:
+        if self._exhausted:
+            return
+        after = self._entries[-1] if self._entries else None
+        page = self.store.page(self.PAGE_SIZE, after, self._query, self._backend)
+        if len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not page:
+            return
+        first = len(self._entries)
+        self._call("beginInsertRows", self._root(), first, first + len(page) - 1)
+        self._entries.extend(page)
+        self._call("endInsertRows")
+
+    # ---------------- helpers -----------------
+
+    def entry(self, row: int) -> HistoryEntry | None:
+        return self._entries[row] if 0 <= row < len(self._entries) else None
+
+    def set_filter(self, query: str | None = None, backend: str | None = None) -> None:
+        self._call("beginResetModel")
+        self._query = query or None
+        self._backend = backend or None
+        self._entries = []
+        self._exhausted = False
+        self._call("endResetModel")
+        self.fetchMore()
+
+    def forget_outputs(self, outputs) -> int:
+        """Delete the entries of removed ``outputs`` and reload the rows."""
+        removed = self.store.forget_outputs(outputs)
+        if removed:
+            self.set_filter(self._query, self._backend)
+        return removed
+
+    def add(self, backend: str, **fields) -> HistoryEntry:
+        """Record a new entry and show it at the top if it matches the filter."""
+        entry = self.store.add(backend, **fields)
+        if self._query or (self._backend and self._backend != backend):
+            # Let the store decide whether the new entry matches.
+            self.set_filter(self._query, self._backend)
+            return entry
+        self._call("beginInsertRows", self._root(), 0, 0)
+        self._entries.insert(0, entry)
+        self._call("endInsertRows")
+        return entry
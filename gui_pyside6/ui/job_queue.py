@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from ..utils.timer import StageTimer
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Jobs of one backend share its loaded model, which is rarely safe to use
+# from two threads at once, so backends run one job at a time unless the
+# ``backend_concurrency`` preference says otherwise.
+DEFAULT_BACKEND_LIMIT = 1
+
+_ids = itertools.count(1)
+
+
+def default_pool_size() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+@dataclass
+class Job:
+    backend: str
+    func: Callable
+    text: str
+    output: Path | None
+    kwargs: dict
+    id: int = field(default_factory=lambda: next(_ids))
+    state: str = QUEUED
+    progress: float | None = 0.0
+    result: object = None
+    error: object = None
+    elapsed: float = 0.0
+    started: float | None = None
+    stages: StageTimer | None = field(default=None, repr=False)
+    # "synthesis" for single texts, transcriptions and tool runs, "batch"
+    # for a whole batch file rendered by ``utils.batch_render``.
+    kind: str = "synthesis"
+    worker: object = field(default=None, repr=False)
+    # Set by ``JobQueue.cancel`` while the job runs. Only functions that poll
+    # it (long documents, batches) stop early; others run to completion.
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DONE, FAILED, CANCELLED)
+
+    def describe(self) -> str:
+        """One-line summary shown in the queue panel."""
+        text = str(self.text).replace("\n", " ")
+        if len(text) > 40:
+            text = text[:40] + "..."
+        if self.state == RUNNING:
+            if self.progress:
+                status = f"{self.progress:.0%}"
+            else:
+                status = f"running {time.time() - (self.started or time.time()):.0f}s"
+        elif self.state == DONE:
+            status = f"done in {self.elapsed:.1f}s"
+        else:
+            status = self.state
+        return f"#{self.id} {self.backend}: {text} [{status}]"
+
+
+class JobQueue:
+    """FIFO queue of backend jobs run on a bounded pool of workers.
+
+    At most ``pool_size`` jobs run at once and at most ``limits[backend]``
+    (``DEFAULT_BACKEND_LIMIT`` when unset) of them use the same backend. A
+    queued job whose backend is saturated does not block jobs of other
+    backends behind it.
+
+    ``worker_factory(func, text, output, kwargs)`` must return an object with
+    a ``finished`` signal emitting ``(result, error, elapsed)`` and a
+    ``start()`` method, i.e. a ``SynthesizeWorker``. ``on_changed(job)`` is
+    called whenever a job changes state and ``on_finished(job)`` once a job
+    has completed or failed.
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable,
+        *,
+        pool_size: int | None = None,
+        limits: dict[str, int] | None = None,
+        on_changed: Callable[[Job], None] | None = None,
+        on_finished: Callable[[Job], None] | None = None,
+    ):
+        self.worker_factory = worker_factory
+        self.pool_size = pool_size or default_pool_size()
+        self.limits = dict(limits or {})
+        self.on_changed = on_changed
+        self.on_finished = on_finished
+        self.jobs: list[Job] = []
+        self._pending: deque[Job] = deque()
+        self._running: dict[str, int] = {}
+
+    # ---------------- public API -----------------
+
+    def submit(
+        self,
+        backend: str,
+        func: Callable,
+        text: str,
+        output: Path | None,
+        kwargs: dict,
+        stages: StageTimer | None = None,
+        kind: str = "synthesis",
+        cancel_event: threading.Event | None = None,
+    ) -> Job:
+        job = Job(backend, func, text, output, kwargs, stages=stages, kind=kind)
+        if cancel_event is not None:
+            job.cancel_event = cancel_event
+        self.jobs.append(job)
+        self._pending.append(job)
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued job or ask a running one to stop.
+
+        A running job ends as cancelled once its function gives up after
+        seeing ``cancel_event``; functions that never poll it finish
+        normally.
+        """
+        for job in self._pending:
+            if job.id == job_id:
+                self._pending.remove(job)
+                job.cancel_event.set()
+                job.state = CANCELLED
+                job.progress = None
+                self._notify(job)
+                return True
+        job = self.get(job_id)
+        if job is not None and job.state == RUNNING:
+            job.cancel_event.set()
+            return True
+        return False
+
+    def set_progress(self, job_id: int, progress: float) -> None:
+        job = self.get(job_id)
+        if job is not None and job.state == RUNNING:
+            job.progress = max(0.0, min(1.0, float(progress)))
+            self._notify(job)
+
+    def get(self, job_id: int) -> Job | None:
+        return next((job for job in self.jobs if job.id == job_id), None)
+
+    def clear_finished(self) -> None:
+        for job in self.jobs:
+            if job.finished and job.worker is not None:
+                # Let the thread finish unwinding before dropping the last
+                # reference to it.
+                wait = getattr(job.worker, "wait", None)
+                if callable(wait):
+                    wait()
+                job.worker = None
+        self.jobs = [job for job in self.jobs if not job.finished]
+
+    def limit(self, backend: str) -> int:
+        return max(1, int(self.limits.get(backend, DEFAULT_BACKEND_LIMIT)))
+
+    @property
+    def running(self) -> int:
+        return sum(self._running.values())
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    # ---------------- scheduling -----------------
+
+    def _notify(self, job: Job) -> None:
+        if self.on_changed is not None:
+            self.on_changed(job)
+
+    def _next_job(self) -> Job | None:
+        for job in self._pending:
+            if self._running.get(job.backend, 0) < self.limit(job.backend):
+                return job
+        return None
+
+    def _dispatch(self) -> None:
+        while self.running < self.pool_size:
+            job = self._next_job()
+            if job is None:
+                return
+            self._pending.remove(job)
+            self._start(job)
+
+    def _start(self, job: Job) -> None:
+        job.state = RUNNING
+        job.progress = None
+        job.started = time.time()
+        self._running[job.backend] = self._running.get(job.backend, 0) + 1
+        self._notify(job)
+        worker = self.worker_factory(job.func, job.text, job.output, job.kwargs)
+        job.worker = worker
+        if job.stages is not None:
+            worker.stages = job.stages
+        worker.finished.connect(
+            lambda result, error, elapsed, job=job: self._finish(job, result, error, elapsed)
+        )
+        print(f"[INFO] Job #{job.id} started with {job.backend}")
+        worker.start()
+
+    def _finish(self, job: Job, result: object, error: object, elapsed: float) -> None:
+        if job.state != RUNNING:
+            return
+        self._running[job.backend] -= 1
+        job.result = result
+        job.error = error
+        job.elapsed = elapsed
+        if error and job.cancel_event.is_set():
+            job.state = CANCELLED
+        else:
+            job.state = FAILED if error else DONE
+        job.progress = None if error else 1.0
+        self._notify(job)
+        if self.on_finished is not None:
+            self.on_finished(job)
+        self._dispatch()
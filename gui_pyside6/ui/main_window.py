@@ -4,12 +4,14 @@ import sys
 import webbrowser
 from datetime import datetime
 import time
+import functools
 import os
 import logging
+import threading
+import uuid
 from typing import Optional
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import QUrl
-from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 
 from ..backend import (
     BACKENDS,
@@ -30,14 +32,24 @@ from ..utils.languages import find_qm_file
 from ..utils.create_base_filename import create_base_filename
 from ..utils.open_folder import open_folder
 from ..utils.preferences import load_preferences, save_preferences
-from ..utils.timer import Timer
-from ..utils.waveform_plot import plot_waveform_as_image
+from ..utils.timer import StageTimer, Timer
+from ..utils import memory_governor
+from ..utils.history_store import HistoryStore
+from ..utils.memory_governor import DEFAULT_IDLE_TIMEOUT, MemoryGovernor
+from ..utils.output_index import apply_retention, open_index
+from .history_model import HistoryModel
+from .job_queue import QUEUED, RUNNING, JobQueue
 from .preferences import PreferencesDialog
 
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path("outputs")
+# Outputs are stored as flat files in one directory per day unless the
+# preferences choose another layout of ``create_base_filename``.
+DEFAULT_OUTPUT_LAYOUT = "date"
 MAX_TEXT_LENGTH = 1000
+# Pause in typing, in milliseconds, after which the text is processed.
+TEXT_SETTLE_MS = 250
 WHISPER_MODELS = [
     "tiny",
     "base",
@@ -48,6 +60,47 @@ WHISPER_MODELS = [
     "large-v3",
 ]
 
+# Modules imported on a background thread once the window is shown so the
+# first waveform render does not stall the UI. Heavy modules are otherwise only
+# imported where they are used.
+WARM_UP_MODULES = [
+    "numpy",
+    "soundfile",
+    "gui_pyside6.utils.waveform_render",
+    "gui_pyside6.utils.peak_cache",
+]
+
+# Display names and TRANSCRIBERS keys of the engines that can run the
+# Whisper models above. CTranslate2 runs int8 on CPU.
+WHISPER_ENGINES = [
+    ("Transformers", "whisper"),
+    ("CTranslate2 (int8)", "faster_whisper"),
+]
+
+
+def _safe_connect(signal, slot):
+    try:
+        signal.connect(slot)
+    except Exception:
+        pass
+
+
+def _preload_modules(modules: list[str]) -> threading.Thread:
+    """Import ``modules`` on a daemon thread, ignoring failures."""
+
+    def run():
+        import importlib
+
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                logger.debug("Warm-up import of %s failed: %s", name, e)
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
 
 def _hf_whisper_model(name: Optional[str]) -> str:
     """Return a full HuggingFace model identifier for Whisper."""
@@ -59,17 +112,22 @@ def _hf_whisper_model(name: Optional[str]) -> str:
 class SynthesizeWorker(QtCore.QThread):
     finished = QtCore.Signal(object, object, float)
 
-    def __init__(self, func, text: str, output: Path | None, kwargs: dict):
+    def __init__(self, func, text: str, output: Path | None, kwargs: dict, stages=None):
         super().__init__()
         self.func = func
         self.text = text
         self.output = output
         self.kwargs = kwargs
+        # Stage timings of the job; backends add to it through
+        # ``utils.timer.stage`` and the rest of the call counts as inference.
+        self.stages = stages
 
     def run(self):
+        if self.stages is None:
+            self.stages = StageTimer()
         try:
             start = time.time()
-            with Timer():
+            with self.stages.activate(), Timer(), self.stages.stage("inference"):
                 if self.output is not None:
                     result = self.func(self.text, self.output, **self.kwargs)
                 else:
@@ -101,6 +159,48 @@ class InstallWorker(QtCore.QThread):
         self.finished.emit(self.backend, err)
 
 
+class BatchInstallWorker(QtCore.QThread):
+    """Install several backends with one resolver run, streaming pip/uv output."""
+
+    output = QtCore.Signal(str)
+    finished = QtCore.Signal(object, object)
+
+    def __init__(self, backends: list[str]):
+        super().__init__()
+        self.backends = list(backends)
+
+    def run(self):
+        from ..backend import ensure_backends_installed
+
+        try:
+            ensure_backends_installed(self.backends, on_output=self.output.emit)
+            err = None
+        except Exception as e:
+            err = e
+        self.finished.emit(self.backends, err)
+
+
+class PostInstallWorker(QtCore.QThread):
+    """Precompile, smoke-test and fetch the models of freshly installed backends."""
+
+    finished = QtCore.Signal(object, object)
+
+    def __init__(self, backends: list[str]):
+        super().__init__()
+        self.backends = list(backends)
+
+    def run(self):
+        from ..backend.post_install import finalize, prefetch_models
+
+        try:
+            results = finalize(self.backends)
+            failed = sorted(m for m, (_, err) in results.items() if err)
+            failed += prefetch_models(self.backends)
+        except Exception as e:
+            failed = [str(e)]
+        self.finished.emit(self.backends, failed)
+
+
 LabelBase = (
     QtWidgets.QLabel
     if isinstance(getattr(QtWidgets, "QLabel", object), type)
@@ -108,11 +208,108 @@ LabelBase = (
 )
 
 
+RunnableBase = (
+    QtCore.QRunnable
+    if isinstance(getattr(QtCore, "QRunnable", None), type)
+    else object
+)
+
+
+class PeakLoadSignals(getattr(QtCore, "QObject", object)):
+    loaded = QtCore.Signal(int, object, object)
+
+
+class PeakLoadTask(RunnableBase):
+    """Build or open the peak file of ``path`` on a ``QThreadPool`` thread.
+
+    ``is_current`` reports whether the widget still wants this load; it is
+    checked before starting and between decoded blocks so superseded loads
+    stop early.
+    """
+
+    def __init__(self, path, sidecar: bool, generation: int, is_current, signals):
+        super().__init__()
+        self.path = path
+        self.sidecar = sidecar
+        self.generation = generation
+        self.is_current = is_current
+        self.signals = signals
+
+    def run(self):
+        from ..utils.peak_cache import LoadCancelled, get_peaks
+
+        if not self.is_current(self.generation):
+            return
+        try:
+            peaks = get_peaks(
+                self.path,
+                sidecar=self.sidecar,
+                cancelled=lambda: not self.is_current(self.generation),
+            )
+            err = None
+        except LoadCancelled:
+            return
+        except Exception as e:
+            peaks, err = None, e
+        self.signals.loaded.emit(self.generation, peaks, err)
+
+
+class RetentionSignals(getattr(QtCore, "QObject", object)):
+    # Outputs removed by a cleanup on the retention thread.
+    removed = QtCore.Signal(object)
+
+
+class TextStatsSignals(getattr(QtCore, "QObject", object)):
+    loaded = QtCore.Signal(int, object, object)
+
+
+class TextStatsTask(RunnableBase):
+    """Compute ``TextStats`` of the editor text on a ``QThreadPool`` thread."""
+
+    def __init__(self, text: str, backend: str, generation: int, store, signals):
+        super().__init__()
+        self.text = text
+        self.backend = backend
+        self.generation = generation
+        self.store = store
+        self.signals = signals
+
+    def compute(self):
+        from ..utils.text_stats import backend_rtf, compute_stats
+
+        return compute_stats(
+            self.text,
+            long_threshold=MAX_TEXT_LENGTH,
+            rtf=backend_rtf(self.backend, self.store) if self.text.strip() else None,
+        )
+
+    def run(self):
+        try:
+            stats, err = self.compute(), None
+        except Exception as e:
+            stats, err = None, e
+        self.signals.loaded.emit(self.generation, stats, err)
+
+
 class WaveformWidget(LabelBase):
-    """Simple widget to display an audio waveform."""
+    """Widget that paints an audio waveform and the playback position.
+
+    The waveform comes either from samples (``set_audio_array``) or from a
+    memory-mapped peak pyramid (``set_audio_file``). The visible range is
+    reduced to one min/max/RMS column per pixel with NumPy and drawn with
+    ``QPainter``; columns are recomputed only when the width, the view or
+    the audio changes. The mouse wheel zooms around the cursor and
+    Shift+wheel scrolls.
+    """
 
     seekRequested = QtCore.Signal(int)
 
+    WAVE_COLOR = "orange"
+    RMS_COLOR = "#ffd27f"
+    BACKGROUND_COLOR = "black"
+    # Narrowest view as a fraction of the whole file.
+    MIN_VIEW = 1 / 4096
+
     def __init__(self, parent: QtWidgets.QWidget | None = None):
         if LabelBase is object:
             super().__init__()
@@ -120,42 +317,147 @@ class WaveformWidget(LabelBase):
             super().__init__(parent)
         if hasattr(self, "setAlignment"):
             self.setAlignment(QtCore.Qt.AlignCenter)
-        if hasattr(self, "setScaledContents"):
-            self.setScaledContents(True)
-        self._pixmap_orig = None
+        self._samples = None
+        # Spare capacity behind ``_samples`` while chunks are appended.
+        self._sample_buffer = None
+        self._peaks = None
+        self._columns_cache: tuple[tuple, tuple] | None = None
+        self._view = (0.0, 1.0)
         self._playback_ratio = 0.0
         self._duration_ms = 0
+        # Incremented on every new audio source; loads tagged with an older
+        # generation are stale and get cancelled or ignored.
+        self._generation = 0
+        self._loading = False
+        self._load_signals = None
+        # ``on_loaded`` of the pending ``set_audio_file`` and its start time.
+        self._on_loaded = None
+        self._load_started = 0.0
+
+    def has_waveform(self) -> bool:
+        return self._samples is not None or self._peaks is not None
+
+    def _sample_count(self) -> int:
+        if self._peaks is not None:
+            return self._peaks.n_samples
+        return 0 if self._samples is None else self._samples.size
+
+    def waveform_columns(self, width: int):
+        """Return ``(mins, maxs, rms)`` for the visible range in ``width`` columns."""
+        if not self.has_waveform():
+            return None
+        key = (width, self._view)
+        if self._columns_cache is None or self._columns_cache[0] != key:
+            total = self._sample_count()
+            start = int(self._view[0] * total)
+            end = max(start + 1, int(round(self._view[1] * total)))
+            if self._peaks is not None:
+                columns = self._peaks.columns(start, end, width)
+            else:
+                from ..utils.waveform_render import decimate
+
+                columns = decimate(self._samples[start:end], width)
+            self._columns_cache = (key, columns)
+        return self._columns_cache[1]
+
+    # ---------------- zoom and scroll -----------------
+
+    def view(self) -> tuple[float, float]:
+        """Return the visible range as fractions of the whole file."""
+        return self._view
 
-    def _update_scaled_pixmap(self):
-        if self._pixmap_orig is None:
+    def set_view(self, start: float, end: float):
+        length = min(1.0, max(self.MIN_VIEW, end - start))
+        start = min(max(0.0, start), 1.0 - length)
+        view = (start, start + length)
+        if view != self._view:
+            self._view = view
+            if hasattr(self, "update"):
+                self.update()
+
+    def zoom(self, factor: float, anchor: float = 0.5):
+        """Scale the visible length by ``1 / factor`` keeping ``anchor`` fixed.
+
+        ``anchor`` is the position inside the widget (0 = left, 1 = right).
+        """
+        start, end = self._view
+        length = end - start
+        pivot = start + anchor * length
+        new_length = min(1.0, max(self.MIN_VIEW, length / factor))
+        self.set_view(pivot - anchor * new_length, pivot + (1 - anchor) * new_length)
+
+    def scroll(self, fraction: float):
+        """Move the view by ``fraction`` of its visible length."""
+        start, end = self._view
+        shift = fraction * (end - start)
+        self.set_view(start + shift, end + shift)
+
+    def reset_view(self):
+        self.set_view(0.0, 1.0)
+
+    def wheelEvent(self, event):
+        delta = event.angleDelta().y() / 120
+        if not delta:
             return
-        pixmap = self._pixmap_orig
-        if hasattr(pixmap, "scaled"):
-            pixmap = pixmap.scaled(
-                self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-            )
-        self.setPixmap(pixmap)
+        if event.modifiers() & QtCore.Qt.ShiftModifier:
+            self.scroll(-0.1 * delta)
+        else:
+            pos = getattr(event, "position", lambda: None)()
+            x = pos.x() if pos else event.x()
+            self.zoom(1.25 ** delta, x / max(1, self.width()))
+        event.accept()
 
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._update_scaled_pixmap()
+    def _x_to_ratio(self, x: float) -> float:
+        start, end = self._view
+        return start + (x / max(1, self.width())) * (end - start)
+
+    # ---------------- painting -----------------
 
     def set_duration(self, duration_ms: int):
         self._duration_ms = duration_ms
 
     def paintEvent(self, event):
-        if LabelBase is not object:
-            super().paintEvent(event)
-            if self.pixmap() is None:
-                return
+        if LabelBase is object:
+            return
+        super().paintEvent(event)
+        width, height = self.width(), self.height()
+        if self._loading:
             painter = QtGui.QPainter(self)
+            painter.setPen(QtGui.QColor(self.WAVE_COLOR))
+            painter.drawText(self.rect(), QtCore.Qt.AlignCenter, "Loading waveform...")
+            painter.end()
+            return
+        columns = self.waveform_columns(width)
+        if columns is None:
+            return
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor(self.BACKGROUND_COLOR))
+        mins, maxs, rms = columns
+        mid = height / 2
+        scale = mid * 0.95
+        step = width / max(1, len(mins))
+        painter.setPen(QtGui.QColor(self.WAVE_COLOR))
+        painter.drawLines(
+            [
+                QtCore.QLineF(x * step, mid - hi * scale, x * step, mid - lo * scale)
+                for x, (lo, hi) in enumerate(zip(mins.tolist(), maxs.tolist()))
+            ]
+        )
+        painter.setPen(QtGui.QColor(self.RMS_COLOR))
+        painter.drawLines(
+            [
+                QtCore.QLineF(x * step, mid - r * scale, x * step, mid + r * scale)
+                for x, r in enumerate(rms.tolist())
+            ]
+        )
+        start, end = self._view
+        if start <= self._playback_ratio <= end:
             pen = QtGui.QPen(QtGui.QColor("red"))
             pen.setWidth(2)
             painter.setPen(pen)
-            x = int(self.width() * self._playback_ratio)
-            painter.drawLine(x, 0, x, self.height())
-        else:
-            return
+            x = int(width * (self._playback_ratio - start) / (end - start))
+            painter.drawLine(x, 0, x, height)
+        painter.end()
 
     def update_playback_position(self, position_ms: int, duration_ms: int):
         self._duration_ms = duration_ms
@@ -172,38 +474,136 @@ class WaveformWidget(LabelBase):
         if event.button() == QtCore.Qt.LeftButton and self._duration_ms > 0:
             pos = getattr(event, "position", lambda: None)()
             x = pos.x() if pos else event.x()
-            ratio = x / max(1, self.width())
-            position = int(ratio * self._duration_ms)
+            position = int(self._x_to_ratio(x) * self._duration_ms)
             self.seekRequested.emit(position)
             event.accept()
         super().mousePressEvent(event)
 
+    # ---------------- data -----------------
+
+    def is_loading(self) -> bool:
+        return self._loading
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _new_source(self):
+        """Invalidate pending loads and drop the current waveform."""
+        self._generation += 1
+        self._loading = False
+        self._notify_loaded(None)
+
+    def _notify_loaded(self, seconds: float | None) -> None:
+        callback, self._on_loaded = self._on_loaded, None
+        if callback is not None:
+            callback(seconds)
+
+    def clear(self):
+        self._new_source()
+        self._samples = None
+        self._peaks = None
+        self._columns_cache = None
+        self._view = (0.0, 1.0)
+        if hasattr(super(), "clear"):
+            super().clear()
+        if hasattr(self, "update"):
+            self.update()
+
     def set_audio_array(self, audio_array):
+        from ..utils.waveform_render import to_mono
+
+        self._new_source()
+        self._samples = to_mono(audio_array)
+        self._peaks = None
+        self._columns_cache = None
+        self._view = (0.0, 1.0)
+        if hasattr(self, "update"):
+            self.update()
+
+    def append_audio(self, audio_array):
+        """Extend the displayed samples, e.g. with a newly streamed chunk."""
         import numpy as np
 
-        arr = np.asarray(audio_array)
-        if arr.ndim > 1:
-            arr = arr.mean(axis=1)
-        img = plot_waveform_as_image(arr)
-        h, w, _ = img.shape
-        fmt = getattr(QtGui.QImage, "Format_RGBA8888", None)
-        if fmt is not None:
-            qimg = QtGui.QImage(img.data, w, h, fmt)
-        else:
-            qimg = QtGui.QImage()
-        self._pixmap_orig = QtGui.QPixmap.fromImage(qimg)
-        self._update_scaled_pixmap()
+        from ..utils.waveform_render import to_mono
 
-    def set_audio_file(self, path: str | Path):
+        if self._samples is None or self._peaks is not None:
+            self.set_audio_array(audio_array)
+            return
+        chunk = to_mono(audio_array)
+        size = self._samples.size
+        end = size + chunk.size
+        buf = self._sample_buffer
+        if buf is None or self._samples.base is not buf or buf.size < end:
+            # Grow geometrically so a long stream is copied O(log n) times.
+            buf = np.empty(max(2 * end, 1 << 16), dtype=self._samples.dtype)
+            buf[:size] = self._samples
+            self._sample_buffer = buf
+        buf[size:end] = chunk
+        self._samples = buf[:end]
+        self._columns_cache = None
+        if hasattr(self, "update"):
+            self.update()
+
+    def set_peaks(self, peaks):
+        """Display a ``PeakPyramid`` computed by ``utils.peak_cache``."""
+        self._loading = False
+        self._peaks = peaks
+        self._samples = None
+        self._columns_cache = None
+        self._view = (0.0, 1.0)
+        if hasattr(self, "update"):
+            self.update()
+
+    def set_audio_file(self, path: str | Path, *, sidecar: bool = True, on_loaded=None):
+        """Show ``path`` using its cached peak file, building it on first use.
+
+        The file is decoded on the global ``QThreadPool``; a placeholder is
+        shown until the peaks arrive and any load still running for a
+        previous file is cancelled. ``sidecar`` stores the peak file next to
+        the audio; otherwise it goes to the per-user cache so files the app
+        does not own are untouched. ``on_loaded(seconds)`` is called once
+        the waveform is shown, with the time the load took, or with None if
+        the load failed or was superseded.
+        """
+        self.clear()
+        generation = self._generation
+        self._on_loaded = on_loaded
+        self._load_started = time.perf_counter()
+        pool_cls = getattr(QtCore, "QThreadPool", None)
+        if RunnableBase is object or pool_cls is None:
+            # Qt without thread pools (e.g. test stubs): load synchronously.
+            self._load_peaks_sync(path, sidecar)
+            return
+        if self._load_signals is None:
+            self._load_signals = PeakLoadSignals()
+            self._load_signals.loaded.connect(self._on_peaks_loaded)
+        self._loading = True
+        if hasattr(self, "update"):
+            self.update()
+        task = PeakLoadTask(path, sidecar, generation, self._is_current, self._load_signals)
+        pool_cls.globalInstance().start(task)
+
+    def _load_peaks_sync(self, path, sidecar: bool):
         try:
-            import soundfile as sf
+            from ..utils.peak_cache import get_peaks
 
-            data, _ = sf.read(str(path))
+            peaks = get_peaks(path, sidecar=sidecar)
         except Exception as e:
             print(f"[WARN] Failed to load waveform from {path}: {e}")
             self.clear()
             return
-        self.set_audio_array(data)
+        self.set_peaks(peaks)
+        self._notify_loaded(time.perf_counter() - self._load_started)
+
+    def _on_peaks_loaded(self, generation: int, peaks, error):
+        if generation != self._generation:
+            return
+        if error is not None:
+            print(f"[WARN] Failed to load waveform: {error}")
+            self.clear()
+            return
+        self.set_peaks(peaks)
+        self._notify_loaded(time.perf_counter() - self._load_started)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -264,11 +664,7 @@ class MainWindow(QtWidgets.QMainWindow):
         top_row = QtWidgets.QHBoxLayout()
         main_layout.addLayout(top_row)
 
-        def safe_connect(signal, slot):
-            try:
-                signal.connect(slot)
-            except Exception:
-                pass
+        safe_connect = _safe_connect
 
         # Status label created early so signal handlers can reference it
         self.status = QtWidgets.QLabel()
@@ -389,17 +785,24 @@ class MainWindow(QtWidgets.QMainWindow):
                 return self.text_edit._stored_text
             return val
 
-        def _record_text():
-            val = self.text_edit.document().toPlainText()
-            logger.debug("_record_text captured text: %r", val)
-            self.text_edit._stored_text = str(val)
-
         self.text_edit.setPlainText = _set_plain
         self.text_edit.toPlainText = _to_plain
         self.text_edit.setPlaceholderText("Enter text to synthesize...")
-        safe_connect(self.text_edit.textChanged, _record_text)
+        # Keystrokes only restart this timer; the text is copied, the
+        # buttons refreshed and the statistics recomputed once typing pauses.
+        self._text_timer = None
+        timer_cls = getattr(QtCore, "QTimer", None)
+        if isinstance(timer_cls, type) and hasattr(timer_cls, "setSingleShot"):
+            self._text_timer = timer_cls(self)
+            self._text_timer.setSingleShot(True)
+            self._text_timer.setInterval(TEXT_SETTLE_MS)
+            safe_connect(self._text_timer.timeout, self._on_text_settled)
         safe_connect(self.text_edit.textChanged, self.on_text_changed)
         input_layout.addWidget(self.text_edit)
+        self.text_stats_label = QtWidgets.QLabel("")
+        input_layout.addWidget(self.text_stats_label)
+        self._stats_generation = 0
+        self._stats_signals = None
 
         self.audio_file: str | None = None
         self.load_audio_button = QtWidgets.QPushButton("Load Audio File")
@@ -470,7 +873,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.duration_label = QtWidgets.QLabel("00:00 / 00:00")
         player_row.addWidget(self.duration_label)
         self.waveform = WaveformWidget()
-        self.waveform._update_scaled_pixmap()
         player_row.addWidget(self.waveform)
         # Use stretch to scale waveform instead of fixed width
         player_row.setStretch(player_row.indexOf(self.waveform), 1)
@@ -504,6 +906,14 @@ class MainWindow(QtWidgets.QMainWindow):
         safe_connect(self.synth_button.clicked, self.on_synthesize)
         buttons_row.addWidget(self.synth_button)
 
+        self.batch_button = QtWidgets.QPushButton("Batch...")
+        if hasattr(self.batch_button, "setToolTip"):
+            self.batch_button.setToolTip(
+                "Render every line of a TXT, CSV or JSONL file with the current backend"
+            )
+        safe_connect(self.batch_button.clicked, self.on_batch)
+        buttons_row.addWidget(self.batch_button)
+
         self.process_button = QtWidgets.QPushButton("Process")
         self.process_button.setVisible(False)
         safe_connect(self.process_button.clicked, self.on_process)
@@ -560,40 +970,86 @@ class MainWindow(QtWidgets.QMainWindow):
         # Complex backend options placed consistently above History
         main_layout.addWidget(self.chatterbox_opts)
 
+        queue_group = QtWidgets.QGroupBox("Queue")
+        queue_layout = QtWidgets.QVBoxLayout(queue_group)
+        main_layout.addWidget(queue_group)
+
+        # Every synthesis, transcription and tool run goes through the job
+        # queue, so the buttons stay enabled while jobs run.
+        self.job_queue = JobQueue(
+            self._create_worker,
+            pool_size=self.prefs.get("max_parallel_jobs"),
+            limits=self.prefs.get("backend_concurrency"),
+            on_changed=self.on_job_changed,
+            on_finished=self.on_job_finished,
+        )
+        self.queue_list = QtWidgets.QListWidget()
+        extended = getattr(
+            getattr(QtWidgets, "QAbstractItemView", None), "ExtendedSelection", None
+        )
+        if extended is not None and hasattr(self.queue_list, "setSelectionMode"):
+            self.queue_list.setSelectionMode(extended)
+        queue_layout.addWidget(self.queue_list)
+        queue_buttons = QtWidgets.QHBoxLayout()
+        self.cancel_job_button = QtWidgets.QPushButton("Cancel Selected")
+        safe_connect(self.cancel_job_button.clicked, self.on_cancel_jobs)
+        queue_buttons.addWidget(self.cancel_job_button)
+        self.clear_jobs_button = QtWidgets.QPushButton("Clear Finished")
+        safe_connect(self.clear_jobs_button.clicked, self.on_clear_jobs)
+        queue_buttons.addWidget(self.clear_jobs_button)
+        queue_layout.addLayout(queue_buttons)
+        self._queue_tick_pending = False
+
+        # Loaded models stay resident between jobs until the governor
+        # unloads them for being idle or for memory pressure.
+        self.memory_governor = MemoryGovernor(
+            self._idle_minutes() * 60,
+            self.prefs.get("memory_limit_mb") or None,
+        )
+        memory_row = QtWidgets.QHBoxLayout()
+        self.memory_label = QtWidgets.QLabel("Loaded models: none")
+        memory_row.addWidget(self.memory_label)
+        self.unload_models_button = QtWidgets.QPushButton("Unload Models")
+        safe_connect(self.unload_models_button.clicked, self.on_unload_models)
+        memory_row.addWidget(self.unload_models_button)
+        queue_layout.addLayout(memory_row)
+        self._memory_timer = None
+        timer_cls = getattr(QtCore, "QTimer", None)
+        if isinstance(timer_cls, type) and hasattr(timer_cls, "setInterval"):
+            self._memory_timer = timer_cls(self)
+            self._memory_timer.setInterval(int(self.memory_governor.interval * 1000))
+            safe_connect(self._memory_timer.timeout, self.on_memory_tick)
+            self._memory_timer.start()
+
         history_group = QtWidgets.QGroupBox("History")
         history_layout = QtWidgets.QVBoxLayout(history_group)
         main_layout.addWidget(history_group)
 
-        self.history_list = QtWidgets.QListWidget()
-        supports_insert = True
-        try:
-            self.history_list.insertItem(0, "")
-            supports_insert = self.history_list.count() > 0
-            self.history_list.takeItem(0)
-        except Exception:
-            supports_insert = False
-
-        if not supports_insert:
-            if not isinstance(getattr(self.history_list, "items", None), list):
-                self.history_list.items = []
-
-            def _insert(idx, text, self=self.history_list):
-                self.items.insert(idx, text)
-
-            def _count(self=self.history_list):
-                return len(self.items)
-
-            def _take(idx, self=self.history_list):
-                if len(self.items) > idx:
-                    self.items.pop(idx)
-
-            self.history_list.insertItem = _insert
-            self.history_list.count = _count
-            self.history_list.takeItem = _take
-        safe_connect(self.history_list.itemActivated, self.on_history_play)
+        # History is persisted in SQLite and shown through a lazily
+        # populated model, so the list never scans the output directory.
+        self.history_model = HistoryModel(HistoryStore())
+        line_edit_cls = getattr(QtWidgets, "QLineEdit", None)
+        if line_edit_cls is not None:
+            self.history_search = line_edit_cls()
+            if hasattr(self.history_search, "setPlaceholderText"):
+                self.history_search.setPlaceholderText("Search history")
+            safe_connect(self.history_search.textChanged, self.on_history_search)
+            history_layout.addWidget(self.history_search)
+        if hasattr(QtWidgets, "QListView"):
+            self.history_list = QtWidgets.QListView()
+            self.history_list.setModel(self.history_model)
+            if hasattr(self.history_list, "setUniformItemSizes"):
+                self.history_list.setUniformItemSizes(True)
+            safe_connect(self.history_list.activated, self.on_history_play)
+        else:
+            self.history_list = QtWidgets.QLabel()
         history_layout.addWidget(self.history_list)
 
         whisper_form = QtWidgets.QFormLayout()
+        self.whisper_engine_combo = QtWidgets.QComboBox()
+        for label, engine in WHISPER_ENGINES:
+            self.whisper_engine_combo.addItem(label, engine)
+        whisper_form.addRow("Engine", self.whisper_engine_combo)
         self.whisper_model_combo = QtWidgets.QComboBox()
         self.whisper_model_combo.addItems(WHISPER_MODELS)
         index = getattr(self.whisper_model_combo, "findText", lambda *_: -1)("small")
@@ -608,6 +1064,10 @@ class MainWindow(QtWidgets.QMainWindow):
         whisper_form.addRow("Model", self.whisper_model_combo)
         self.whisper_ts_checkbox = QtWidgets.QCheckBox("Force timestamps")
         whisper_form.addRow("Return timestamps", self.whisper_ts_checkbox)
+        self.whisper_vad_checkbox = QtWidgets.QCheckBox("Skip silence (VAD)")
+        whisper_form.addRow("Voice activity", self.whisper_vad_checkbox)
+        self.whisper_spec_checkbox = QtWidgets.QCheckBox("Use draft model")
+        whisper_form.addRow("Speculative decoding", self.whisper_spec_checkbox)
         self.whisper_opts = QtWidgets.QGroupBox("Whisper Options")
         self.whisper_opts.setLayout(whisper_form)
         self.whisper_opts.setVisible(False)
@@ -616,20 +1076,34 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.api_process = None
         self.last_output: Path | None = None
-        self._synth_busy = False
-
-        self.audio_output = QAudioOutput()
-        self.player = QMediaPlayer()
-        if hasattr(self.player, "setAudioOutput"):
-            self.player.setAudioOutput(self.audio_output)
-        # Qt6 renamed the signal from stateChanged to playbackStateChanged
-        safe_connect(self.player.playbackStateChanged, self.on_player_state_changed)
-        safe_connect(self.player.durationChanged, self.on_duration_changed)
-        safe_connect(self.player.positionChanged, self.on_position_changed)
-        safe_connect(self.waveform.seekRequested, self.player.setPosition)
+        self._job_info: dict = {}
+        self._job_stages: StageTimer | None = None
+        self._history_pending: list = []
+        # Token and timer of the waveform being loaded for a finished job,
+        # and the job record waiting for that load to add its timing.
+        self._waveform_load: tuple | None = None
+        self._deferred_record: tuple | None = None
+        self._retention_thread: threading.Thread | None = None
+        self._retention_signals = None
+        # Streams of running jobs by job id, and the one being played.
+        self._streams: dict = {}
+        self._stream_player = None
+        # Ids of running jobs whose streams wait for the current one to end,
+        # and streams the user stopped with the Stop button.
+        self._stream_waiting: list[int] = []
+        self._stopped_streams: set = set()
+        self._streamed = False
+
+        # The media player is created on first use (or by the warm-up after
+        # the window is shown) so QtMultimedia is not loaded before first paint.
+        self._player = None
+        self._audio_output = None
+        self._volume = 1.0
+        safe_connect(self.waveform.seekRequested, lambda pos: self.player.setPosition(pos))
         safe_connect(self.volume_slider.valueChanged, self.on_volume_changed)
         self.on_volume_changed(self.volume_slider.value())
         self.cb_voice_path: str | None = None
+        self.start_output_retention()
 
         # Status label placed at bottom of layout
         main_layout.addWidget(self.status)
@@ -645,6 +1119,39 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._torch_missing:
             QtCore.QTimer.singleShot(0, self._prompt_install_torch)
 
+        timer = getattr(QtCore, "QTimer", None)
+        if timer is not None and hasattr(timer, "singleShot"):
+            timer.singleShot(0, self._warm_up)
+
+    def _warm_up(self):
+        """Load deferred modules after the window has been painted."""
+        _preload_modules(WARM_UP_MODULES)
+        self._ensure_player()
+
+    def _ensure_player(self):
+        if self._player is None:
+            from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+
+            self._audio_output = QAudioOutput()
+            self._player = QMediaPlayer()
+            if hasattr(self._player, "setAudioOutput"):
+                self._player.setAudioOutput(self._audio_output)
+            # Qt6 renamed the signal from stateChanged to playbackStateChanged
+            _safe_connect(self._player.playbackStateChanged, self.on_player_state_changed)
+            _safe_connect(self._player.durationChanged, self.on_duration_changed)
+            _safe_connect(self._player.positionChanged, self.on_position_changed)
+            self._audio_output.setVolume(self._volume)
+        return self._player
+
+    @property
+    def player(self):
+        return self._ensure_player()
+
+    @property
+    def audio_output(self):
+        self._ensure_player()
+        return self._audio_output
+
     def on_synthesize(self):
         backend = self.backend_combo.currentText()
         if backend in TRANSCRIBERS:
@@ -674,19 +1181,132 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._run_backend(backend)
 
+    def on_batch(self):
+        backend = self.backend_combo.currentText()
+        if backend not in BACKENDS or backend in TOOL_BACKENDS:
+            if hasattr(self.status, "setText"):
+                self.status.setText("Batch mode needs a text-to-speech backend.")
+            return
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Open Batch File", "", "Batch files (*.txt *.csv *.jsonl)"
+        )
+        if path:
+            self.start_batch(path, backend)
+
+    def start_batch(self, source: str | Path, backend: str):
+        """Queue a job rendering every line of ``source`` with ``backend``.
+
+        The voice, language, rate and seed selected in the window are the
+        defaults for lines that do not set their own.
+        """
+        from ..utils.batch_render import render_batch
+
+        try:
+            if not is_backend_installed(backend) and ensure_backend_installed(backend):
+                self._start_post_install([backend])
+        except Exception as e:
+            if hasattr(self.status, "setText"):
+                self.status.setText(f"Install failed: {e}")
+            return
+        defaults = self._build_backend_kwargs(
+            backend,
+            self.voice_combo.currentData(),
+            self.lang_combo.currentData(),
+            self.rate_spin.value(),
+            self.seed_spin.value() or None,
+        )
+        out_dir = OUTPUT_DIR / f"batch_{datetime.now():%Y%m%d_%H%M%S}"
+        holder: list = []
+        cancel_event = threading.Event()
+
+        def on_progress(done: int, total: int):
+            # Runs on the worker thread; the queue panel picks it up on its
+            # next refresh.
+            if holder and total:
+                holder[0].progress = done / total
+
+        func = functools.partial(
+            render_batch,
+            backend=backend,
+            workers=self.prefs.get("batch_workers", 2),
+            defaults=defaults,
+            output_format=self._output_format(backend),
+            subtype=self.prefs.get("output_subtype") or None,
+            on_progress=on_progress,
+            cancelled=cancel_event.is_set,
+        )
+        print(f"[INFO] Queued batch {source} with {backend}")
+        job = self.job_queue.submit(
+            backend,
+            func,
+            str(source),
+            out_dir / "manifest.jsonl",
+            {},
+            kind="batch",
+            cancel_event=cancel_event,
+        )
+        holder.append(job)
+
+    def _on_batch_finished(self, job) -> None:
+        from ..utils.batch_render import read_manifest
+
+        if job.error:
+            if hasattr(self.status, "setText"):
+                self.status.setText(f"Batch failed: {job.error}")
+            print(f"[ERROR] {job.error}")
+            return
+        rows = read_manifest(job.result)
+        rendered = [row for row in rows if "error" not in row]
+        for row in rendered:
+            self.history_model.add(
+                job.backend,
+                text=row["text"],
+                output=row["output"],
+                voice=row.get("voice") or job.kwargs.get("voice"),
+                duration=row.get("duration"),
+                elapsed=row.get("elapsed"),
+                stages=row.get("timings"),
+            )
+            self._index_call(
+                "add",
+                row["output"],
+                backend=job.backend,
+                text=row["text"],
+                duration=row.get("duration"),
+            )
+        self._index_call("add", job.result, backend=job.backend, kind="file")
+        self.apply_output_retention(keep=[row["output"] for row in rendered] + [job.result])
+        if rendered:
+            self.last_output = Path(rendered[-1]["output"])
+            self.play_button.setEnabled(True)
+        msg = f"Batch rendered {len(rendered)} of {len(rows)} lines; manifest {job.result}"
+        print(f"[INFO] {msg}")
+        if hasattr(self.status, "setText"):
+            self.status.setText(msg)
+
+    def _selected_whisper_engine(self) -> str:
+        engine = getattr(self.whisper_engine_combo, "currentData", lambda: None)()
+        return engine if isinstance(engine, str) and engine in TRANSCRIBERS else "whisper"
+
     def _run_backend(self, backend: str):
+        if backend == "whisper":
+            backend = self._selected_whisper_engine()
         features = BACKEND_FEATURES.get(backend, set())
         voices: list | None = []
 
-        if not is_backend_installed(backend):
-            try:
-                ensure_backend_installed(backend)
-            except Exception as e:
-                if hasattr(self.status, "setText"):
-                    self.status.setText(f"Install failed: {e}")
-                self.update_synthesize_enabled()
-                return
+        stages = StageTimer(backend=backend)
+        try:
+            with stages.stage("install_check"):
+                installed = not is_backend_installed(backend) and ensure_backend_installed(backend)
+            if installed:
+                self._start_post_install([backend])
+        except Exception as e:
+            if hasattr(self.status, "setText"):
+                self.status.setText(f"Install failed: {e}")
+            self.update_synthesize_enabled()
+            return
 
+        long_document = False
         if "file" in features:
             if not self.audio_file or not Path(self.audio_file).is_file():
                 if hasattr(self.status, "setText"):
@@ -702,16 +1322,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.update_synthesize_enabled()
                 return
 
-            if len(text) > MAX_TEXT_LENGTH:
-                reply = QtWidgets.QMessageBox.question(
-                    self,
-                    "Long Input",
-                    f"The text is {len(text)} characters long. Continue?",
-                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                )
-                if reply != QtWidgets.QMessageBox.Yes:
-                    self.update_synthesize_enabled()
-                    return
+            # Long texts are rendered in checkpointed chunks so a failure
+            # late in the document does not lose the finished part.
+            long_document = len(text) > MAX_TEXT_LENGTH and backend in BACKENDS
 
         output = self._generate_output_path(text, backend)
         if backend in TRANSCRIBERS:
@@ -725,12 +1338,11 @@ class MainWindow(QtWidgets.QMainWindow):
         if backend not in lookup:
             if hasattr(self.status, "setText"):
                 self.status.setText(f"Unknown backend: {backend}")
-            self._synth_busy = False
             self.update_synthesize_enabled()
             return
 
         kwargs = self._build_backend_kwargs(backend, voice_id, lang_code, rate, seed)
-        self._start_backend_worker(backend, text, output, kwargs)
+        self._start_backend_worker(backend, text, output, kwargs, stages, long_document=long_document)
 
     def _build_backend_kwargs(
         self,
@@ -765,7 +1377,7 @@ class MainWindow(QtWidgets.QMainWindow):
             kwargs["lang"] = lang
         if "seed" in features and seed is not None:
             kwargs["seed"] = seed
-        if backend == "whisper":
+        if backend in ("whisper", "faster_whisper"):
             model_name = self.whisper_model_combo.currentText()
             kwargs["model_name"] = _hf_whisper_model(model_name)
             if (
@@ -773,21 +1385,264 @@ class MainWindow(QtWidgets.QMainWindow):
                 and self.whisper_ts_checkbox.isChecked()
             ):
                 kwargs["return_timestamps"] = True
+            if (
+                hasattr(self, "whisper_vad_checkbox")
+                and self.whisper_vad_checkbox.isChecked()
+            ):
+                kwargs["vad"] = True
+            if (
+                backend == "whisper"
+                and hasattr(self, "whisper_spec_checkbox")
+                and self.whisper_spec_checkbox.isChecked()
+            ):
+                kwargs["speculative"] = True
         return kwargs
 
     def _start_backend_worker(
-        self, backend: str, text: str, output: Path | None, kwargs: dict
+        self,
+        backend: str,
+        text: str,
+        output: Path | None,
+        kwargs: dict,
+        stages: StageTimer | None = None,
+        *,
+        long_document: bool = False,
     ) -> None:
         lookup = TRANSCRIBERS if backend in TRANSCRIBERS else BACKENDS
         func = lookup[backend]
         print(f"[INFO] Synthesizing with {backend}...")
-        logger.debug("_start_backend_worker busy flag %s -> True", self._synth_busy)
-        self._synth_busy = True
+        cancel_event = holder = None
+        if long_document:
+            func, cancel_event, holder = self._document_func(backend, func)
+        output_format = self._output_format(backend)
+        if output_format is not None:
+            from ..utils.audio_encode import encoding
+
+            func = encoding(func, output_format, self.prefs.get("output_subtype") or None)
+        stream = None
+        if self._stream_enabled(backend, long_document):
+            from ..utils.audio_stream import AudioStream
+
+            stream = AudioStream()
+            kwargs = {**kwargs, "on_chunk": stream.push}
+        job = self.job_queue.submit(
+            backend, func, text, output, kwargs, stages, cancel_event=cancel_event
+        )
+        if holder is not None:
+            holder.append(job)
+        if stream is not None and not job.finished:
+            # Played once the job runs; see ``on_job_changed``. A job the
+            # queue started right away ran before the stream was known.
+            self._streams[job.id] = stream
+            if job.state == RUNNING:
+                self._queue_stream(job.id)
+        if job.state == QUEUED and hasattr(self.status, "setText"):
+            self.status.setText(f"Queued job #{job.id} ({self.job_queue.pending} waiting)")
         self.update_synthesize_enabled()
-        logger.debug("_start_backend_worker busy flag now %s", self._synth_busy)
-        self.worker = SynthesizeWorker(func, text, output, kwargs)
-        self.worker.finished.connect(self.on_synthesize_finished)
-        self.worker.start()
+
+    def _output_format(self, backend: str) -> str | None:
+        """Format to encode ``backend``'s output to, None to keep it as written."""
+        fmt = self.prefs.get("output_format", "wav")
+        if (
+            backend not in BACKENDS
+            or backend in TOOL_BACKENDS
+            or (fmt == "wav" and not self.prefs.get("output_subtype"))
+        ):
+            return None
+        return fmt
+
+    def _document_func(self, backend: str, func):
+        """Wrap ``func`` to render a long text in resumable chunks.
+
+        Returns the wrapped function, the event that cancels it between
+        chunks and a list that must receive the job for progress updates.
+        """
+        from ..utils.long_document import render_document
+
+        cancel_event = threading.Event()
+        holder: list = []
+
+        def on_progress(done: int, total: int):
+            # Runs on the worker thread, like the batch progress callback.
+            if holder and total:
+                holder[0].progress = done / total
+
+        func = functools.partial(
+            render_document,
+            func=func,
+            backend=backend,
+            cancelled=cancel_event.is_set,
+            on_progress=on_progress,
+        )
+        return func, cancel_event, holder
+
+    def _stream_enabled(self, backend: str, long_document: bool = False) -> bool:
+        # Long documents can stream with any backend: each finished chunk
+        # is played while the next one renders.
+        return (
+            ("stream" in BACKEND_FEATURES.get(backend, set()) or long_document)
+            and self.prefs.get("stream_playback", True)
+            and self.autoplay_check.isChecked()
+        )
+
+    def _queue_stream(self, job_id: int) -> None:
+        """Play the stream of a job that started running.
+
+        A stream that is still playing is never cut off; the new one waits
+        until it has been played to the end.
+        """
+        if job_id not in self._stream_waiting:
+            self._stream_waiting.append(job_id)
+        if self._stream_player is None or self._stream_player.finished:
+            self._play_next_stream()
+
+    def _play_next_stream(self) -> None:
+        self._stream_player = None
+        while self._stream_waiting:
+            # Jobs that finished meanwhile have dropped their stream.
+            stream = self._streams.get(self._stream_waiting.pop(0))
+            if stream is not None:
+                self._play_stream(stream)
+                if self._stream_player is not None:
+                    return
+
+    def _play_stream(self, stream) -> None:
+        """Play ``stream`` as it arrives."""
+        import numpy as np
+
+        from ..utils.audio_stream import StreamPlayer
+
+        first = [True]
+
+        def on_chunks(chunks):
+            if first[0]:
+                first[0] = False
+                self.waveform.set_audio_array(np.concatenate(chunks))
+                if hasattr(self.status, "setText"):
+                    self.status.setText("Playing while generating...")
+            else:
+                self.waveform.append_audio(np.concatenate(chunks))
+
+        self._stream_player = StreamPlayer(
+            stream, volume=self._volume, on_chunks=on_chunks, on_finished=self._play_next_stream
+        )
+        if not self._stream_player.start():
+            self._stream_player = None
+
+    def _create_worker(self, func, text, output, kwargs):
+        # Resolved at call time so tests can replace SynthesizeWorker.
+        return SynthesizeWorker(func, text, output, kwargs)
+
+    def refresh_queue_panel(self) -> None:
+        """Sync the queue list with the jobs, keeping the user's selection.
+
+        Items are keyed by the job id in ``UserRole`` and updated in place;
+        items of cleared jobs are removed and new jobs appended.
+        """
+        count = getattr(self.queue_list, "count", None)
+        add = getattr(self.queue_list, "addItem", None)
+        rows = count() if callable(count) else None
+        if not isinstance(rows, int) or not callable(add):
+            return
+        jobs = {job.id: job for job in self.job_queue.jobs}
+        seen = set()
+        for row in reversed(range(rows)):
+            item = self.queue_list.item(row)
+            job = jobs.get(item.data(QtCore.Qt.UserRole))
+            if job is None:
+                self.queue_list.takeItem(row)
+                continue
+            seen.add(job.id)
+            text = job.describe()
+            if item.text() != text:
+                item.setText(text)
+        for job_id, job in jobs.items():
+            if job_id not in seen:
+                item = QtWidgets.QListWidgetItem(job.describe())
+                item.setData(QtCore.Qt.UserRole, job_id)
+                add(item)
+        # Refresh the elapsed time of running jobs once a second.
+        timer = getattr(QtCore, "QTimer", None)
+        if self.job_queue.running and not self._queue_tick_pending and hasattr(timer, "singleShot"):
+            self._queue_tick_pending = True
+            timer.singleShot(1000, self._on_queue_tick)
+
+    def _on_queue_tick(self) -> None:
+        self._queue_tick_pending = False
+        self.refresh_queue_panel()
+
+    def on_job_changed(self, job) -> None:
+        if job.state == RUNNING and job.id in self._streams:
+            self._queue_stream(job.id)
+        self.refresh_queue_panel()
+
+    def on_job_finished(self, job) -> None:
+        self.update_memory_label()
+        if job.kind == "batch":
+            self._on_batch_finished(job)
+            return
+        stream = self._streams.pop(job.id, None)
+        if stream is not None:
+            stream.finish()
+        player = self._stream_player
+        stopped = stream is not None and stream in self._stopped_streams
+        self._stopped_streams.discard(stream)
+        self._streamed = stopped or bool(
+            stream is not None and player is not None and player.stream is stream and player.started
+        )
+        self._job_info = {
+            "backend": job.backend,
+            "text": str(job.text),
+            "voice": job.kwargs.get("voice"),
+        }
+        self._job_stages = job.stages
+        try:
+            self.on_synthesize_finished(job.result, job.error, job.elapsed)
+        finally:
+            self._streamed = False
+            self._job_stages = None
+
+    def on_cancel_jobs(self) -> None:
+        selected = getattr(self.queue_list, "selectedItems", None)
+        if not callable(selected):
+            return
+        for item in selected():
+            self.job_queue.cancel(item.data(QtCore.Qt.UserRole))
+
+    def on_clear_jobs(self) -> None:
+        self.job_queue.clear_finished()
+        self.refresh_queue_panel()
+
+    def _idle_minutes(self) -> float:
+        """Minutes before an idle model is unloaded; 0 keeps models loaded."""
+        return self.prefs.get("model_idle_minutes", DEFAULT_IDLE_TIMEOUT / 60)
+
+    def update_memory_label(self) -> None:
+        if not hasattr(self.memory_label, "setText"):
+            return
+        text = f"Loaded models: {memory_governor.summary()}"
+        rss = memory_governor.rss_mb()
+        if rss is not None:
+            text += f" · {rss:.0f} MiB"
+        self.memory_label.setText(text)
+        if hasattr(self.memory_label, "setToolTip"):
+            now = time.monotonic()
+            self.memory_label.setToolTip(
+                "\n".join(
+                    f"{entry.describe()} (idle {now - entry.last_used:.0f}s)"
+                    for entry in memory_governor.resident()
+                )
+            )
+
+    def on_memory_tick(self) -> None:
+        self.memory_governor.check()
+        self.update_memory_label()
+
+    def on_unload_models(self) -> None:
+        dropped = memory_governor.unload()
+        self.update_memory_label()
+        if hasattr(self.status, "setText"):
+            self.status.setText(f"Unloaded {len(dropped)} models")
 
     def on_api_server_toggle(self):
         self.api_button.setEnabled(False)
@@ -801,6 +1656,14 @@ class MainWindow(QtWidgets.QMainWindow):
                     "gui_pyside6.backend.api_server",
                     "--port",
                     str(port),
+                    "--idle-minutes",
+                    str(self._idle_minutes()),
+                    "--memory-limit",
+                    str(self.prefs.get("memory_limit_mb", 0)),
+                    "--keep-days",
+                    str(self.prefs.get("output_keep_days", 0)),
+                    "--max-output-mb",
+                    str(self.prefs.get("output_max_mb", 0)),
                 ]
             )
             self.api_button.setText("Stop API Server")
@@ -827,6 +1690,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.last_output and self.last_output.exists():
             self.player.setSource(QUrl.fromLocalFile(str(self.last_output)))
             self.player.play()
+            self._index_call("touch", self.last_output)
             self.stop_button.setEnabled(True)
         else:
             if hasattr(self.status, "setText"):
@@ -834,9 +1698,200 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_stop_playback(self):
         self.player.stop()
+        # Jobs keep rendering, but their files are not auto-played afterwards.
+        waiting, self._stream_waiting = self._stream_waiting, []
+        self._stopped_streams.update(
+            self._streams[job_id] for job_id in waiting if job_id in self._streams
+        )
+        if self._stream_player is not None:
+            self._stopped_streams.add(self._stream_player.stream)
+            self._stream_player.stop()
+            self._stream_player = None
+
+    def on_history_search(self, text: str):
+        self.history_model.set_filter(text.strip())
+
+    def _record_history(self, output=None, *, transcript: str | None = None, elapsed: float | None = None):
+        """Queue an output of the finished job for ``_flush_history``."""
+        self._history_pending.append((output, transcript, elapsed))
+
+    @staticmethod
+    def _audio_duration(path) -> float | None:
+        try:
+            import soundfile as sf
+
+            return sf.info(str(path)).duration
+        except Exception:
+            return None
+
+    def _flush_history(self, stages: StageTimer | None, pending: list, info: dict) -> None:
+        """Add the job's ``pending`` outputs to the persistent history with its timings."""
+        if not pending:
+            return
+        backend = str(info.get("backend") or self.backend_combo.currentText())
+        durations = [
+            self._audio_duration(output) if output is not None else None
+            for output, _, _ in pending
+        ]
+        if stages is not None and any(durations):
+            # Tools such as Demucs return several files of the input length.
+            stages.note(audio_duration=round(max(d for d in durations if d), 3))
+        record = stages.record() if stages is not None else None
+        for (output, transcript, elapsed), duration in zip(pending, durations):
+            self.history_model.add(
+                backend,
+                text=transcript if transcript is not None else info.get("text", ""),
+                output=output,
+                voice=info.get("voice"),
+                kind="transcript" if transcript is not None else "audio",
+                duration=duration,
+                elapsed=elapsed,
+                stages=record,
+            )
+            if output is not None:
+                self._index_call(
+                    "add",
+                    output,
+                    backend=backend,
+                    kind="audio" if duration is not None else "file",
+                    text=info.get("text", ""),
+                    duration=duration,
+                )
+        self.apply_output_retention(keep=[output for output, _, _ in pending if output is not None])
 
-    def on_history_play(self, item):
-        path = Path(item.text())
+    def _output_index(self, path):
+        """The index of ``OUTPUT_DIR`` if ``path`` lies inside it, else None."""
+        try:
+            Path(path).resolve().relative_to(OUTPUT_DIR.resolve())
+        except ValueError:
+            return None
+        return open_index(OUTPUT_DIR)
+
+    def _index_call(self, method: str, path, **kwargs) -> None:
+        """Update the output index; failures never affect the job."""
+        try:
+            index = self._output_index(path)
+            if index is not None:
+                getattr(index, method)(path, **kwargs)
+        except Exception as e:
+            print(f"[WARN] Could not update output index: {e}")
+
+    def _retention_limits(self) -> dict:
+        max_mb = self.prefs.get("output_max_mb") or 0
+        return {
+            "max_age_days": self.prefs.get("output_keep_days") or None,
+            "max_bytes": int(max_mb * 1024 * 1024) if max_mb else None,
+        }
+
+    def _retention_keep(self, keep=()) -> list:
+        """``keep`` plus the outputs in use: the last output and the player source."""
+        kept = [*keep]
+        if self.last_output is not None:
+            kept.append(self.last_output)
+        try:
+            source = self._player.source().toLocalFile() if self._player is not None else None
+        except Exception:
+            source = None
+        if isinstance(source, str) and source:
+            kept.append(source)
+        return kept
+
+    def apply_output_retention(self, *, scan: bool = False, keep=()) -> list:
+        """Remove old outputs from ``OUTPUT_DIR`` per the retention preferences.
+
+        Outputs in ``keep`` and those in use are never removed. History
+        entries of the removed files are dropped (on the GUI thread when
+        called from the retention thread). Returns the removed files.
+        """
+        limits = self._retention_limits()
+        if not limits["max_age_days"] and limits["max_bytes"] is None:
+            return []
+        try:
+            removed = apply_retention(OUTPUT_DIR, scan=scan, keep=self._retention_keep(keep), **limits)
+        except Exception as e:
+            print(f"[WARN] Output cleanup failed: {e}")
+            return []
+        if removed:
+            if threading.current_thread() is threading.main_thread():
+                self._on_outputs_removed(removed)
+            elif self._retention_signals is not None:
+                self._retention_signals.removed.emit(removed)
+        return removed
+
+    def _on_outputs_removed(self, removed) -> None:
+        """Drop the history entries of outputs removed by cleanup."""
+        outputs = set()
+        for path in removed:
+            # History records paths as written, usually relative to the cwd.
+            outputs.add(str(path))
+            try:
+                outputs.add(os.path.relpath(path))
+            except ValueError:
+                pass
+        self.history_model.forget_outputs(outputs)
+
+    def start_output_retention(self) -> None:
+        """Index existing outputs and apply the retention policy in the background.
+
+        The first scan of a large output directory walks the whole tree, so
+        it runs on a thread; later cleanups are queries on the index.
+        """
+        limits = self._retention_limits()
+        if not limits["max_age_days"] and limits["max_bytes"] is None:
+            return
+        if self._retention_thread is not None and self._retention_thread.is_alive():
+            return
+        if self._retention_signals is None:
+            self._retention_signals = RetentionSignals()
+            _safe_connect(self._retention_signals.removed, self._on_outputs_removed)
+        self._retention_thread = threading.Thread(
+            target=self.apply_output_retention,
+            kwargs={"scan": True},
+            name="output-retention",
+            daemon=True,
+        )
+        self._retention_thread.start()
+
+    def _show_waveform(self, path: Path, stages: StageTimer | None) -> None:
+        if stages is None:
+            self.waveform.set_audio_file(path)
+            return
+        # Peaks load on a thread pool; the "waveform" stage is the time
+        # until they are shown.
+        token = object()
+        self._waveform_load = (token, stages)
+        self.waveform.set_audio_file(
+            path, on_loaded=lambda seconds: self._on_waveform_loaded(token, stages, seconds)
+        )
+
+    def _on_waveform_loaded(self, token, stages: StageTimer, seconds: float | None) -> None:
+        if seconds is not None:
+            stages.add("waveform", seconds)
+        if self._waveform_load is not None and self._waveform_load[0] is token:
+            self._waveform_load = None
+        if self._deferred_record is not None and self._deferred_record[0] is token:
+            finish = self._deferred_record[1]
+            self._deferred_record = None
+            finish()
+
+    def _finish_job_record(
+        self, stages: StageTimer | None, pending: list, info: dict, status_msg: str | None
+    ) -> None:
+        """Store and log the record of a finished job and show its status."""
+        self._flush_history(stages, pending, info)
+        if stages is not None:
+            stages.log()
+            if status_msg and stages.stages:
+                status_msg = f"{status_msg} ({stages.summary()})"
+        if status_msg and hasattr(self.status, "setText"):
+            self.status.setText(status_msg)
+
+    def on_history_play(self, index):
+        row = index.row() if hasattr(index, "row") else int(index)
+        entry = self.history_model.entry(row)
+        if entry is None or not entry.output:
+            return
+        path = Path(entry.output)
         if path.exists():
             self.last_output = path
             if path.exists():
@@ -845,7 +1900,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.on_play_output()
 
     def on_synthesize_finished(self, output: object, error: object, elapsed: float):
-        logger.debug("on_synthesize_finished called with busy=%s", self._synth_busy)
+        stages = self._job_stages
+        status_msg = None
         if error:
             msg = str(error)
             if len(msg) > 200:
@@ -853,6 +1909,8 @@ class MainWindow(QtWidgets.QMainWindow):
             if hasattr(self.status, "setText"):
                 self.status.setText(f"Error: {msg}")
             print(f"[ERROR] {error}")
+            if stages is not None:
+                stages.note(error=msg)
         else:
             self.transcript_view.setVisible(False)
             if isinstance(output, str) and not Path(output).exists():
@@ -861,10 +1919,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.transcript_view.setVisible(True)
                 # ensure the group box is shown when text output is returned
                 self.transcript_group.setVisible(True)
-                if hasattr(self.status, "setText"):
-                    self.status.setText("Transcription complete")
-                summary = transcript[:30].replace("\n", " ")
-                self.history_list.insertItem(0, f"Transcribed: {summary}")
+                status_msg = "Transcription complete"
+                self._record_history(transcript=transcript, elapsed=elapsed)
                 output_desc = transcript
                 self.last_output = None
             else:
@@ -879,9 +1935,9 @@ class MainWindow(QtWidgets.QMainWindow):
                         # insert newest paths at the top and load each as it becomes selected
                         for p in reversed(paths):
                             self.last_output = p
-                            self.history_list.insertItem(0, str(p))
+                            self._record_history(p, elapsed=elapsed)
                             if p.exists():
-                                self.waveform.set_audio_file(p)
+                                self._show_waveform(p, stages)
                                 self.player.setSource(QUrl.fromLocalFile(str(p)))
                         self.last_output = first
                     else:
@@ -890,34 +1946,35 @@ class MainWindow(QtWidgets.QMainWindow):
                     p = Path(output)
                     self.last_output = p
                     output_desc = p
-                    self.history_list.insertItem(0, str(p))
+                    self._record_history(p, elapsed=elapsed)
                 else:
                     self.last_output = None
 
                 print(f"[INFO] Output saved to {output_desc}")
-                if hasattr(self.status, "setText"):
-                    self.status.setText(f"Saved to {output_desc}")
+                status_msg = f"Saved to {output_desc}"
                 if self.last_output and self.last_output.exists():
                     self.play_button.setEnabled(True)
-                if self.autoplay_check.isChecked() and self.last_output:
+                # Streamed jobs have already been played chunk by chunk.
+                if self.autoplay_check.isChecked() and self.last_output and not self._streamed:
                     self.on_play_output()
                 if self.last_output and self.last_output.exists():
-                    self.waveform.set_audio_file(self.last_output)
+                    self._show_waveform(self.last_output, stages)
                     self.player.setSource(QUrl.fromLocalFile(str(self.last_output)))
-            count_fn = getattr(self.history_list, "count", None)
-            take_fn = getattr(self.history_list, "takeItem", None)
-            if callable(count_fn) and callable(take_fn):
-                try:
-                    if count_fn() > 10:
-                        take_fn(10)
-                except Exception:
-                    pass
-        logger.debug("on_synthesize_finished busy flag %s -> False", self._synth_busy)
-        self._synth_busy = False
+        pending, self._history_pending = self._history_pending, []
+        finish = functools.partial(self._finish_job_record, stages, pending, self._job_info, status_msg)
+        load = self._waveform_load
+        if stages is not None and load is not None and load[1] is stages:
+            # Logged and stored once the waveform timing is known.
+            self._deferred_record = (load[0], finish)
+            if status_msg and hasattr(self.status, "setText"):
+                self.status.setText(status_msg)
+        else:
+            finish()
         self.update_synthesize_enabled()
-        logger.debug("on_synthesize_finished busy flag now %s", self._synth_busy)
 
     def on_player_state_changed(self, state):
+        from PySide6.QtMultimedia import QMediaPlayer
+
         if state == QMediaPlayer.StoppedState:
             self.stop_button.setEnabled(False)
 
@@ -930,8 +1987,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.waveform.update_playback_position(position, self.player.duration())
 
     def update_position_label(self):
-        pos = self.player.position()
-        dur = self.player.duration()
+        if self._player is None:
+            return
+        pos = self._player.position()
+        dur = self._player.duration()
         self.duration_label.setText(
             f"{self._ms_to_mmss(pos)} / {self._ms_to_mmss(dur)}"
         )
@@ -941,7 +2000,11 @@ class MainWindow(QtWidgets.QMainWindow):
             volume = max(0, min(100, int(value))) / 100
         except Exception:
             return
-        self.audio_output.setVolume(volume)
+        self._volume = volume
+        if self._audio_output is not None:
+            self._audio_output.setVolume(volume)
+        if self._stream_player is not None:
+            self._stream_player.set_volume(volume)
         if hasattr(self.volume_label, "setText"):
             self.volume_label.setText(f"{int(volume*100)}%")
 
@@ -961,7 +2024,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.audio_file = file_path
             self.load_audio_button.setText(Path(file_path).name)
 
-            self.waveform.set_audio_file(file_path)
+            self.waveform.set_audio_file(file_path, sidecar=False)
             self.player.setSource(QUrl.fromLocalFile(file_path))
 
             self.update_synthesize_enabled()
@@ -1010,6 +2073,10 @@ class MainWindow(QtWidgets.QMainWindow):
             self.synth_button.setVisible(
                 backend not in TRANSCRIBERS and backend not in TOOL_BACKENDS
             )
+            if hasattr(self.batch_button, "setVisible"):
+                self.batch_button.setVisible(
+                    backend not in TRANSCRIBERS and backend not in TOOL_BACKENDS
+                )
             self.process_button.setVisible(backend in TOOL_BACKENDS)
             self.transcribe_button.setVisible(backend in TRANSCRIBERS)
         if hasattr(self.status, "setText"):
@@ -1129,7 +2196,8 @@ class MainWindow(QtWidgets.QMainWindow):
         layout = getattr(parent, "layout", lambda: None)()
         if layout is not None and hasattr(layout, "invalidate"):
             layout.invalidate()
-        self.waveform._update_scaled_pixmap()
+        if hasattr(self.waveform, "update"):
+            self.waveform.update()
 
         self.chatterbox_opts.setVisible(backend == "chatterbox")
         self.whisper_opts.setVisible(backend == "whisper")
@@ -1137,6 +2205,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # they will be shown again when a transcription completes
         self.transcript_group.setVisible(backend == "whisper")
         self.update_synthesize_enabled()
+        # The synthesis time estimate depends on the backend.
+        self.refresh_text_stats()
         self._last_backend = backend
 
     def _generate_output_path(self, text: str, backend: str) -> Path:
@@ -1145,7 +2215,16 @@ class MainWindow(QtWidgets.QMainWindow):
         features = BACKEND_FEATURES.get(backend, set())
         if "file" in features and Path(text).exists():
             snippet = Path(text).stem[:15]
-        base = create_base_filename(snippet, str(OUTPUT_DIR), backend, date)
+        # Jobs queued within the same second with the same snippet would
+        # otherwise share an output path.
+        snippet = f"{snippet}_{uuid.uuid4().hex[:6]}"
+        base = create_base_filename(
+            snippet,
+            str(OUTPUT_DIR),
+            backend,
+            date,
+            self.prefs.get("output_layout", DEFAULT_OUTPUT_LAYOUT),
+        )
         if backend == "demucs":
             return Path(base)
         ext = ".mp3" if backend == "gtts" else ".wav"
@@ -1163,6 +2242,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self.install_worker.finished.connect(self.on_install_finished)
         self.install_worker.start()
 
+    def install_backends(self, backends: list[str]):
+        """Install ``backends`` in the background, showing output in the status bar."""
+        self.install_button.setEnabled(False)
+        self.status.setText(f"Installing {', '.join(backends)}...")
+        self.batch_install_worker = BatchInstallWorker(backends)
+        self.batch_install_worker.output.connect(self.status.setText)
+        self.batch_install_worker.finished.connect(self.on_batch_install_finished)
+        self.batch_install_worker.start()
+
+    def on_batch_install_finished(self, backends: list[str], error: object):
+        if error:
+            self.status.setText(f"Install error: {error}")
+        else:
+            import importlib
+
+            importlib.invalidate_caches()
+            self.status.setText(f"Installed {', '.join(backends)}")
+            self._start_post_install(backends)
+        self.update_install_status()
+        self.on_backend_changed(self.backend_combo.currentText())
+        self.update_synthesize_enabled()
+
     def on_install_finished(self, backend: str, error: object):
         if error:
             self.status.setText(f"Install error: {error}")
@@ -1171,10 +2272,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
             importlib.invalidate_caches()
             self.status.setText(f"{backend} installed")
+            self._start_post_install([backend])
         self.update_install_status()
         self.on_backend_changed(backend)
         self.update_synthesize_enabled()
 
+    def _start_post_install(self, backends: list[str]):
+        """Warm up installed backends in the background."""
+        worker = PostInstallWorker(backends)
+        if not hasattr(worker, "start"):
+            return
+        self.post_install_worker = worker
+        worker.finished.connect(self.on_post_install_finished)
+        worker.start()
+
+    def on_post_install_finished(self, backends: list[str], failed: list[str]):
+        if failed:
+            self.status.setText(f"Post-install check failed: {', '.join(failed)}")
+        else:
+            self.status.setText(f"{', '.join(backends)} ready")
+
     def update_install_status(self):
         if self.backend_combo is None:
             return
@@ -1189,7 +2306,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.install_button.setText("Install Backend")
         self.update_synthesize_enabled()
 
-    def update_synthesize_enabled(self):
+    def update_synthesize_enabled(self, *, text: str | None = None):
+        """Enable the action buttons when there is input for the backend.
+
+        ``text`` is the editor text when the caller has just copied it, so
+        the document is not copied again.
+        """
         if self.backend_combo is None:
             return
         if os.environ.get("HYBRID_TTS_ALWAYS_ENABLE") == "1":
@@ -1210,54 +2332,87 @@ class MainWindow(QtWidgets.QMainWindow):
         if file_required:
             text_present = bool(self.audio_file) and Path(self.audio_file).is_file()
         else:
-            text = ""
-            if hasattr(self.text_edit, "toPlainText"):
-                val = self.text_edit.toPlainText()
-                try:
-                    log_len = len(val or "")
-                except TypeError:
-                    log_len = len(str(val or ""))
-                logger.debug(
-                    "update_synthesize_enabled read text: %r (len=%d)",
-                    val,
-                    log_len,
-                )
-                if val is not None:
-                    text = str(val)
+            if text is None:
+                text = ""
+                if hasattr(self.text_edit, "toPlainText"):
+                    val = self.text_edit.toPlainText()
+                    if val is not None:
+                        text = str(val)
             if not text.strip() and hasattr(self.text_edit, "_stored_text"):
-                stored = str(getattr(self.text_edit, "_stored_text", ""))
-                logger.debug(
-                    "update_synthesize_enabled using _stored_text: %r (len=%d)",
-                    stored,
-                    len(stored),
-                )
-                text = stored
-            logger.debug(
-                "update_synthesize_enabled final text length: %d", len(text)
-            )
-            text_present = bool(text.strip())
-        busy = getattr(self, "_synth_busy", False)
-        logger.debug("synth_btn state text_present=%s, busy=%s", text_present, busy)
+                text = str(getattr(self.text_edit, "_stored_text", ""))
+            # Only the length is logged: the text may be a whole book.
+            logger.debug("update_synthesize_enabled text length: %d", len(text))
+            text_present = not text.isspace() and bool(text)
+        logger.debug("synth_btn state text_present=%s", text_present)
         if backend in TRANSCRIBERS:
-            self.transcribe_button.setEnabled(text_present and not busy)
+            self.transcribe_button.setEnabled(text_present)
         else:
-            self.synth_button.setEnabled(text_present and not busy)
-        self.process_button.setEnabled(
-            text_present and not busy and backend in TOOL_BACKENDS
-        )
+            self.synth_button.setEnabled(text_present)
+        self.process_button.setEnabled(text_present and backend in TOOL_BACKENDS)
 
     def on_text_changed(self):
-        logger.debug("textChanged emitted")
-        QtCore.QTimer.singleShot(0, self.update_synthesize_enabled)
+        if self._text_timer is not None:
+            self._text_timer.start()
+        else:
+            QtCore.QTimer.singleShot(0, self._on_text_settled)
+
+    def _on_text_settled(self):
+        document = getattr(self.text_edit, "document", None)
+        text = None
+        if callable(document):
+            text = self.text_edit._stored_text = str(document().toPlainText())
+        self.update_synthesize_enabled(text=text)
+        self.refresh_text_stats()
+
+    def refresh_text_stats(self) -> None:
+        """Recompute the statistics under the editor on the thread pool."""
+        self._stats_generation += 1
+        backend = self.backend_combo.currentText() if self.backend_combo is not None else ""
+        if "file" in BACKEND_FEATURES.get(backend, set()):
+            if hasattr(self.text_stats_label, "setText"):
+                self.text_stats_label.setText("")
+            return
+        history = getattr(self, "history_model", None)
+        pool_cls = getattr(QtCore, "QThreadPool", None)
+        threaded = RunnableBase is not object and pool_cls is not None
+        if threaded and self._stats_signals is None:
+            self._stats_signals = TextStatsSignals()
+            self._stats_signals.loaded.connect(self._on_text_stats)
+        task = TextStatsTask(
+            str(getattr(self.text_edit, "_stored_text", "")),
+            backend,
+            self._stats_generation,
+            history.store if history is not None else None,
+            self._stats_signals,
+        )
+        if not threaded:
+            # Qt without thread pools (e.g. test stubs): compute in place.
+            self._on_text_stats(task.generation, task.compute(), None)
+            return
+        pool_cls.globalInstance().start(task)
+
+    def _on_text_stats(self, generation: int, stats, error) -> None:
+        if generation != self._stats_generation or not hasattr(self.text_stats_label, "setText"):
+            return
+        if error is not None:
+            print(f"[WARN] Failed to compute text statistics: {error}")
+            return
+        self.text_stats_label.setText(stats.describe())
 
     def on_preferences(self):
         dlg = PreferencesDialog(self.prefs, self)
         if dlg.exec():
             self.prefs.update(dlg.get_preferences())
+            if getattr(dlg, "install_requested", None):
+                self.install_backends(dlg.install_requested)
             save_preferences(self.prefs)
             self.autoplay_check.setChecked(self.prefs.get("autoplay", True))
+            self.job_queue.pool_size = self.prefs.get("max_parallel_jobs") or self.job_queue.pool_size
+            self.memory_governor.idle_timeout = self._idle_minutes() * 60
+            self.memory_governor.rss_limit_mb = self.prefs.get("memory_limit_mb") or None
             global OUTPUT_DIR
             OUTPUT_DIR = Path(self.prefs.get("output_dir", "outputs"))
+            self.start_output_retention()
             self.update_install_status()
 
             new_lang = self.prefs.get("ui_lang", "en")
@@ -1301,8 +2456,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _run_torch_installer(self):
         script = Path(__file__).resolve().parent.parent / "install_torch.py"
-        self._synth_busy = True
-        self.update_synthesize_enabled()
         if hasattr(self, "torch_button"):
             self.torch_button.setEnabled(False)
         self.status.setText("Installing PyTorch...")
@@ -1311,10 +2464,8 @@ class MainWindow(QtWidgets.QMainWindow):
             subprocess.run([sys.executable, str(script)], check=True)
         except subprocess.CalledProcessError as e:
             self.status.setText(f"Install failed: {e}")
-            self._synth_busy = False
             if hasattr(self, "torch_button"):
                 self.torch_button.setEnabled(True)
-            self.update_synthesize_enabled()
             return
 
         self.status.setText("Restarting app")
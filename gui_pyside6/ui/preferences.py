@@ -3,9 +3,13 @@ from __future__ import annotations
 from PySide6 import QtWidgets, QtCore
 
 from ..backend import available_backends, is_backend_installed, uninstall_backend
+from ..utils.audio_encode import available_formats
+from ..utils.create_base_filename import LAYOUTS
 from ..utils.languages import get_available_languages
+from ..utils.memory_governor import DEFAULT_IDLE_TIMEOUT
 from ..utils.preferences import load_preferences
 from ..utils.open_folder import open_log_dir
+from .job_queue import default_pool_size
 
 
 class PreferencesDialog(QtWidgets.QDialog):
@@ -13,6 +17,9 @@ class PreferencesDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle("Preferences")
         self.prefs = prefs or load_preferences()
+        # Backends the user asked to install; the main window installs them
+        # in one batch after the dialog closes.
+        self.install_requested: list[str] = []
 
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -20,6 +27,10 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.autoplay_box.setChecked(self.prefs.get("autoplay", True))
         layout.addWidget(self.autoplay_box)
 
+        self.stream_box = QtWidgets.QCheckBox("Start playback while generating")
+        self.stream_box.setChecked(self.prefs.get("stream_playback", True))
+        layout.addWidget(self.stream_box)
+
         port_row = QtWidgets.QHBoxLayout()
         port_label = QtWidgets.QLabel("API server port")
         self.port_spin = QtWidgets.QSpinBox()
@@ -29,6 +40,55 @@ class PreferencesDialog(QtWidgets.QDialog):
         port_row.addWidget(self.port_spin)
         layout.addLayout(port_row)
 
+        jobs_row = QtWidgets.QHBoxLayout()
+        jobs_label = QtWidgets.QLabel("Parallel jobs")
+        self.jobs_spin = QtWidgets.QSpinBox()
+        self.jobs_spin.setRange(1, 32)
+        self.jobs_spin.setValue(self.prefs.get("max_parallel_jobs") or default_pool_size())
+        jobs_row.addWidget(jobs_label)
+        jobs_row.addWidget(self.jobs_spin)
+        layout.addLayout(jobs_row)
+
+        batch_row = QtWidgets.QHBoxLayout()
+        batch_label = QtWidgets.QLabel("Batch workers")
+        self.batch_spin = QtWidgets.QSpinBox()
+        self.batch_spin.setRange(1, 32)
+        self.batch_spin.setValue(self.prefs.get("batch_workers", 2))
+        batch_row.addWidget(batch_label)
+        batch_row.addWidget(self.batch_spin)
+        layout.addLayout(batch_row)
+
+        idle_row = QtWidgets.QHBoxLayout()
+        idle_label = QtWidgets.QLabel("Unload idle models after (minutes, 0 = never)")
+        self.idle_spin = QtWidgets.QSpinBox()
+        self.idle_spin.setRange(0, 24 * 60)
+        self.idle_spin.setValue(int(self.prefs.get("model_idle_minutes", DEFAULT_IDLE_TIMEOUT / 60)))
+        idle_row.addWidget(idle_label)
+        idle_row.addWidget(self.idle_spin)
+        layout.addLayout(idle_row)
+
+        memory_row = QtWidgets.QHBoxLayout()
+        memory_label = QtWidgets.QLabel("Memory limit for models (MiB, 0 = none)")
+        self.memory_spin = QtWidgets.QSpinBox()
+        self.memory_spin.setRange(0, 1 << 20)
+        self.memory_spin.setSingleStep(512)
+        self.memory_spin.setValue(int(self.prefs.get("memory_limit_mb", 0)))
+        memory_row.addWidget(memory_label)
+        memory_row.addWidget(self.memory_spin)
+        layout.addLayout(memory_row)
+
+        format_row = QtWidgets.QHBoxLayout()
+        format_label = QtWidgets.QLabel("Output format")
+        self.format_combo = QtWidgets.QComboBox()
+        for fmt in available_formats():
+            self.format_combo.addItem(fmt.label, fmt.name)
+        idx = self.format_combo.findData(self.prefs.get("output_format", "wav"))
+        if idx >= 0:
+            self.format_combo.setCurrentIndex(idx)
+        format_row.addWidget(format_label)
+        format_row.addWidget(self.format_combo)
+        layout.addLayout(format_row)
+
         out_row = QtWidgets.QHBoxLayout()
         out_label = QtWidgets.QLabel("Output directory")
         self.out_edit = QtWidgets.QLineEdit()
@@ -40,6 +100,37 @@ class PreferencesDialog(QtWidgets.QDialog):
         out_row.addWidget(out_browse)
         layout.addLayout(out_row)
 
+        layout_row = QtWidgets.QHBoxLayout()
+        layout_label = QtWidgets.QLabel("Output layout")
+        self.layout_combo = QtWidgets.QComboBox()
+        for name, label in zip(LAYOUTS, ("Folder per clip", "Files by date", "Files by hash prefix")):
+            self.layout_combo.addItem(label, name)
+        idx = self.layout_combo.findData(self.prefs.get("output_layout", "date"))
+        if idx >= 0:
+            self.layout_combo.setCurrentIndex(idx)
+        layout_row.addWidget(layout_label)
+        layout_row.addWidget(self.layout_combo)
+        layout.addLayout(layout_row)
+
+        keep_row = QtWidgets.QHBoxLayout()
+        keep_label = QtWidgets.QLabel("Delete outputs unused for (days, 0 = never)")
+        self.keep_spin = QtWidgets.QSpinBox()
+        self.keep_spin.setRange(0, 3650)
+        self.keep_spin.setValue(int(self.prefs.get("output_keep_days", 0)))
+        keep_row.addWidget(keep_label)
+        keep_row.addWidget(self.keep_spin)
+        layout.addLayout(keep_row)
+
+        size_row = QtWidgets.QHBoxLayout()
+        size_label = QtWidgets.QLabel("Output size limit (MiB, 0 = none)")
+        self.size_spin = QtWidgets.QSpinBox()
+        self.size_spin.setRange(0, 1 << 24)
+        self.size_spin.setSingleStep(1024)
+        self.size_spin.setValue(int(self.prefs.get("output_max_mb", 0)))
+        size_row.addWidget(size_label)
+        size_row.addWidget(self.size_spin)
+        layout.addLayout(size_row)
+
         lang_row = QtWidgets.QHBoxLayout()
         lang_label = QtWidgets.QLabel("UI language")
         self.lang_combo = QtWidgets.QComboBox()
@@ -55,10 +146,14 @@ class PreferencesDialog(QtWidgets.QDialog):
         layout.addLayout(lang_row)
 
         self.backend_list = QtWidgets.QListWidget()
+        self.backend_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         layout.addWidget(self.backend_list)
         self.refresh_backends()
 
         btn_row = QtWidgets.QHBoxLayout()
+        self.install_btn = QtWidgets.QPushButton("Install Selected")
+        self.install_btn.clicked.connect(self.on_install)
+        btn_row.addWidget(self.install_btn)
         self.uninstall_btn = QtWidgets.QPushButton("Uninstall Selected")
         self.uninstall_btn.clicked.connect(self.on_uninstall)
         btn_row.addWidget(self.uninstall_btn)
@@ -84,6 +179,15 @@ class PreferencesDialog(QtWidgets.QDialog):
             self.backend_list.addItem(item)
             item.setSelected(False)
 
+    def on_install(self) -> None:
+        self.install_requested = [
+            item.data(QtCore.Qt.UserRole)
+            for item in self.backend_list.selectedItems()
+            if not is_backend_installed(item.data(QtCore.Qt.UserRole))
+        ]
+        if self.install_requested:
+            self.accept()
+
     def on_uninstall(self) -> None:
         for item in self.backend_list.selectedItems():
             backend = item.data(QtCore.Qt.UserRole)
@@ -96,8 +200,17 @@ class PreferencesDialog(QtWidgets.QDialog):
     def get_preferences(self) -> dict:
         return {
             "autoplay": self.autoplay_box.isChecked(),
+            "stream_playback": self.stream_box.isChecked(),
             "api_port": self.port_spin.value(),
+            "max_parallel_jobs": self.jobs_spin.value(),
+            "batch_workers": self.batch_spin.value(),
+            "model_idle_minutes": self.idle_spin.value(),
+            "memory_limit_mb": self.memory_spin.value(),
+            "output_format": self.format_combo.currentData() or "wav",
             "output_dir": self.out_edit.text() or "outputs",
+            "output_layout": self.layout_combo.currentData() or "date",
+            "output_keep_days": self.keep_spin.value(),
+            "output_max_mb": self.size_spin.value(),
             "ui_lang": self.lang_combo.currentData() or "en",
         }
 
@@ -0,0 +1,253 @@
+"""Encode synthesized audio to compressed formats.
+
+Backends write WAV (gTTS and Edge TTS write MP3). ``encode_file`` converts
+such a file to FLAC, Ogg Opus, MP3 or WAV with libsndfile, copying the
+audio block by block. ``submit`` runs it on a small shared thread pool so
+encoding stays bounded however many jobs or batch workers finish at once.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from math import gcd
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from .timer import stage
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    name: str
+    major: str
+    subtype: str
+    suffix: str
+    mime: str
+    label: str
+
+
+FORMATS: dict[str, AudioFormat] = {
+    "wav": AudioFormat("wav", "WAV", "PCM_16", ".wav", "audio/wav", "WAV (uncompressed)"),
+    "flac": AudioFormat("flac", "FLAC", "PCM_16", ".flac", "audio/flac", "FLAC (lossless)"),
+    "ogg": AudioFormat("ogg", "OGG", "OPUS", ".ogg", "audio/ogg", "Ogg Opus"),
+    "mp3": AudioFormat("mp3", "MP3", "MPEG_LAYER_III", ".mp3", "audio/mpeg", "MP3"),
+}
+
+# Other names clients use for the formats above, as ``format`` values or
+# ``Accept`` media types.
+_ALIASES = {
+    "opus": "ogg",
+    "audio/opus": "ogg",
+    "audio/mp3": "mp3",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-flac": "flac",
+}
+
+# Sample rates the Opus encoder accepts; other rates are resampled to 48 kHz.
+OPUS_RATES = (8000, 12000, 16000, 24000, 48000)
+
+_BLOCK_FRAMES = 1 << 16
+
+_POOL: ThreadPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def resolve_format(name: str) -> AudioFormat:
+    """Look up a format by name, suffix or media type."""
+    key = name.strip().lower().lstrip(".")
+    key = _ALIASES.get(key, key)
+    for fmt in FORMATS.values():
+        if key in (fmt.name, fmt.mime):
+            return fmt
+    raise ValueError(f"Unknown audio format: {name}")
+
+
+def is_available(fmt: AudioFormat, subtype: str | None = None) -> bool:
+    """Whether the installed libsndfile can write ``fmt``."""
+    try:
+        import soundfile as sf
+
+        return fmt.major in sf.available_formats() and (
+            subtype or fmt.subtype
+        ) in sf.available_subtypes(fmt.major)
+    except Exception:
+        return False
+
+
+def available_formats() -> list[AudioFormat]:
+    return [fmt for fmt in FORMATS.values() if is_available(fmt)]
+
+
+def negotiate(accept: str | None) -> AudioFormat | None:
+    """Pick the format an HTTP ``Accept`` header prefers.
+
+    Returns None when the header names no audio type this module can write,
+    e.g. ``application/json`` or ``*/*``.
+    """
+    if not accept:
+        return None
+    choices = []
+    for order, part in enumerate(accept.split(",")):
+        media, *params = [p.strip() for p in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if media == "audio/*":
+            media = "audio/flac"
+        try:
+            fmt = resolve_format(media)
+        except ValueError:
+            continue
+        if quality > 0 and is_available(fmt):
+            choices.append((-quality, order, fmt))
+    return min(choices, key=lambda c: c[:2])[2] if choices else None
+
+
+def _resample_blocks(blocks: Iterable, orig_sr: int, target_sr: int) -> Iterator:
+    """Resample ``(frames, channels)`` float32 blocks as they are read.
+
+    Each step resamples the frames received so far, aligned to the
+    resampling ratio, with ``pad`` frames of context on both sides, and
+    keeps only the middle. The filter never reaches past the context, so the
+    output matches resampling the whole signal at once while memory stays
+    bounded by the block size. Uses ``scipy.signal.resample_poly`` and falls
+    back to linear interpolation without SciPy.
+    """
+    import numpy as np
+
+    try:
+        from scipy.signal import resample_poly
+    except ImportError:
+        resample_poly = None
+
+    g = gcd(orig_sr, target_sr)
+    up, down = target_sr // g, orig_sr // g
+    # resample_poly's filter spans 10 * max(up, down) upsampled samples on
+    # each side; the context is that many input frames, rounded to ``down``
+    # so block starts stay aligned with output samples.
+    reach = 10 * max(up, down) // up + 2
+    pad = -(-reach // down) * down
+
+    def segment(frames, n_in: int, n_out: int):
+        if resample_poly is not None:
+            out = resample_poly(frames, up, down, axis=0)
+        else:
+            pos = np.arange(frames.shape[0] * up // down) * down / up
+            x_in = np.arange(frames.shape[0])
+            out = np.stack([np.interp(pos, x_in, frames[:, c]) for c in range(frames.shape[1])], axis=1)
+        start = pad * up // down
+        return out[start:start + n_out].astype(np.float32)
+
+    history = pending = None
+    for block in blocks:
+        if history is None:
+            history = np.zeros((pad, block.shape[1]), dtype=np.float32)
+            pending = block[:0]
+        pending = np.concatenate([pending, block])
+        n = (pending.shape[0] - pad) // down * down
+        if n <= 0:
+            continue
+        yield segment(np.concatenate([history, pending[:n + pad]]), n, n * up // down)
+        history = np.concatenate([history, pending[:n]])[-pad:]
+        pending = pending[n:]
+    if pending is not None and pending.shape[0]:
+        n = pending.shape[0]
+        tail = np.zeros((pad, pending.shape[1]), dtype=np.float32)
+        yield segment(np.concatenate([history, pending, tail]), n, -(-n * up // down))
+
+
+def encode_file(
+    source: str | Path,
+    fmt: str | AudioFormat,
+    *,
+    subtype: str | None = None,
+    dest: str | Path | None = None,
+    keep_source: bool = False,
+) -> Path:
+    """Write ``source`` in ``fmt`` and return the new file.
+
+    Parameters
+    ----------
+    source:
+        Audio file readable by libsndfile.
+    fmt:
+        Target format: a ``FORMATS`` key, media type or ``AudioFormat``.
+    subtype:
+        libsndfile subtype, e.g. ``PCM_24`` for FLAC or ``VORBIS`` for Ogg;
+        the format's default when None.
+    dest:
+        Output file, by default ``source`` with the format's suffix.
+    keep_source:
+        Keep ``source`` after encoding; it is deleted by default.
+    """
+    import soundfile as sf
+
+    fmt = resolve_format(fmt) if isinstance(fmt, str) else fmt
+    source = Path(source)
+    dest = Path(dest) if dest is not None else source.with_suffix(fmt.suffix)
+    if source.suffix.lower() == fmt.suffix and dest == source and subtype is None:
+        return source
+    subtype = subtype or fmt.subtype
+    tmp = dest.with_name(f"{dest.stem}.part{dest.suffix}")
+    with sf.SoundFile(str(source)) as src:
+        rate = src.samplerate
+        resample = fmt.subtype == "OPUS" and rate not in OPUS_RATES
+        try:
+            with sf.SoundFile(
+                str(tmp),
+                "w",
+                samplerate=48000 if resample else rate,
+                channels=src.channels,
+                format=fmt.major,
+                subtype=subtype,
+            ) as out:
+                blocks = src.blocks(blocksize=_BLOCK_FRAMES, dtype="float32", always_2d=True)
+                if resample:
+                    blocks = _resample_blocks(blocks, rate, 48000)
+                for block in blocks:
+                    out.write(block)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    os.replace(tmp, dest)
+    if not keep_source and dest != source:
+        source.unlink(missing_ok=True)
+    return dest
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(
+                max_workers=max(1, min(4, os.cpu_count() or 1)), thread_name_prefix="encode"
+            )
+        return _POOL
+
+
+def submit(source: str | Path, fmt: str | AudioFormat, **kwargs) -> Future:
+    """Run ``encode_file`` on the shared encoder pool."""
+    return _pool().submit(encode_file, source, fmt, **kwargs)
+
+
+def encoding(func: Callable, fmt: str, subtype: str | None = None) -> Callable:
+    """Wrap a synthesis function so the file it writes is encoded to ``fmt``.
+
+    The wrapper returns the encoded path and times the work as the
+    ``encode`` stage of the active ``StageTimer``.
+    """
+
+    def synthesize(text: str, output: Path, **kwargs) -> Path:
+        result = func(text, output, **kwargs)
+        path = Path(result) if isinstance(result, (str, Path)) else Path(output)
+        with stage("encode"):
+            return submit(path, fmt, subtype=subtype).result()
+
+    return synthesize
@@ -0,0 +1,242 @@
+"""Progressive playback of audio that is still being synthesized.
+
+Backends that produce audio piece by piece accept an ``on_chunk(samples,
+sample_rate)`` callback. ``AudioStream.push`` is such a callback: it runs on
+the synthesis thread and only appends to a lock-protected ring buffer.
+``StreamPlayer`` lives on the GUI thread, polls the stream from a ``QTimer``
+and feeds a ``QAudioSink`` as soon as the first chunk arrives, so playback
+starts after the first sentence instead of after the whole file.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import Callable
+
+import numpy as np
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;:])\s+|\n{2,}")
+
+
+def split_sentences(text: str, max_chars: int = 280) -> list[str]:
+    """Split ``text`` at sentence boundaries into pieces of at most ``max_chars``."""
+    pieces: list[str] = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = " ".join(sentence.split())
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+
+class RingBuffer:
+    """Thread-safe FIFO of float32 samples backed by a circular array.
+
+    The buffer grows instead of blocking when the producer is ahead of the
+    consumer, so a slow or missing audio device never stalls synthesis.
+    """
+
+    def __init__(self, capacity: int = 1 << 20):
+        self._data = np.zeros(max(1, capacity), dtype=np.float32)
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def drained(self) -> bool:
+        """True once the buffer is closed and every sample has been read."""
+        with self._lock:
+            return self._closed and self._size == 0
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._data.size
+        while capacity < needed:
+            capacity *= 2
+        data = np.zeros(capacity, dtype=np.float32)
+        data[: self._size] = self._peek(self._size)
+        self._data = data
+        self._start = 0
+
+    def _peek(self, n: int) -> np.ndarray:
+        end = self._start + n
+        if end <= self._data.size:
+            return self._data[self._start:end].copy()
+        head = self._data[self._start:]
+        return np.concatenate([head, self._data[: n - head.size]])
+
+    def write(self, samples: np.ndarray) -> None:
+        samples = np.asarray(samples, dtype=np.float32).ravel()
+        with self._lock:
+            if self._closed:
+                raise ValueError("write to a closed ring buffer")
+            if self._size + samples.size > self._data.size:
+                self._grow(self._size + samples.size)
+            capacity = self._data.size
+            pos = (self._start + self._size) % capacity
+            first = min(samples.size, capacity - pos)
+            self._data[pos:pos + first] = samples[:first]
+            self._data[: samples.size - first] = samples[first:]
+            self._size += samples.size
+
+    def read(self, n: int) -> np.ndarray:
+        """Remove and return up to ``n`` samples."""
+        with self._lock:
+            n = min(max(0, n), self._size)
+            out = self._peek(n)
+            self._start = (self._start + n) % self._data.size
+            self._size -= n
+            return out
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+
+
+class AudioStream:
+    """Audio pushed by a backend while it synthesizes.
+
+    Samples go to ``buffer`` for playback; the chunks themselves are kept
+    until ``take_chunks`` so the GUI can extend the waveform.
+    """
+
+    def __init__(self):
+        self.buffer = RingBuffer()
+        self.sample_rate: int | None = None
+        self._chunks: list[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def push(self, samples, sample_rate: int) -> None:
+        """``on_chunk`` callback; may be called from any thread."""
+        from .waveform_render import to_mono
+
+        chunk = to_mono(samples)
+        with self._lock:
+            if self.sample_rate is None:
+                self.sample_rate = int(sample_rate)
+            elif int(sample_rate) != self.sample_rate:
+                raise ValueError(
+                    f"chunk sample rate {sample_rate} differs from stream rate {self.sample_rate}"
+                )
+            self._chunks.append(chunk)
+        self.buffer.write(chunk)
+
+    def take_chunks(self) -> list[np.ndarray]:
+        """Return the chunks pushed since the previous call."""
+        with self._lock:
+            chunks, self._chunks = self._chunks, []
+        return chunks
+
+    def finish(self) -> None:
+        """Mark the end of the stream; playback stops once the buffer drains."""
+        self.buffer.close()
+
+
+class StreamPlayer:
+    """Play an ``AudioStream`` through ``QAudioSink`` from the GUI thread.
+
+    ``on_chunks(chunks)`` receives newly arrived chunks on every poll and
+    ``on_finished()`` is called after the last sample has been played.
+    """
+
+    INTERVAL_MS = 20
+
+    def __init__(
+        self,
+        stream: AudioStream,
+        *,
+        volume: float = 1.0,
+        on_chunks: Callable[[list[np.ndarray]], None] | None = None,
+        on_finished: Callable[[], None] | None = None,
+    ):
+        self.stream = stream
+        self.volume = volume
+        self.on_chunks = on_chunks
+        self.on_finished = on_finished
+        self.started = False
+        self.finished = False
+        self._sink = None
+        self._device = None
+        self._timer = None
+
+    def start(self) -> bool:
+        """Begin polling the stream. Returns False if Qt has no timer."""
+        from PySide6 import QtCore
+
+        timer_cls = getattr(QtCore, "QTimer", None)
+        if not isinstance(timer_cls, type):
+            return False
+        self._timer = timer_cls()
+        self._timer.setInterval(self.INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start()
+        return True
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._sink is not None:
+            self._sink.stop()
+            self._sink = None
+            self._device = None
+
+    def set_volume(self, volume: float) -> None:
+        """Change the volume, also while playing."""
+        self.volume = volume
+        if self._sink is not None:
+            self._sink.setVolume(volume)
+
+    def _open_sink(self) -> None:
+        from PySide6.QtMultimedia import QAudioFormat, QAudioSink, QMediaDevices
+
+        fmt = QAudioFormat()
+        fmt.setSampleRate(self.stream.sample_rate)
+        fmt.setChannelCount(1)
+        fmt.setSampleFormat(QAudioFormat.Int16)
+        self._sink = QAudioSink(QMediaDevices.defaultAudioOutput(), fmt)
+        self._sink.setVolume(self.volume)
+        self._device = self._sink.start()
+        self.started = True
+
+    def _tick(self) -> None:
+        if self.finished:
+            return
+        chunks = self.stream.take_chunks()
+        if chunks and self.on_chunks is not None:
+            self.on_chunks(chunks)
+        if self._sink is None and self.stream.sample_rate:
+            try:
+                self._open_sink()
+            except Exception as e:
+                print(f"[WARN] Streaming playback unavailable: {e}")
+                self._finish()
+                return
+        if self._sink is not None:
+            frames = self._sink.bytesFree() // 2
+            if frames:
+                samples = self.stream.buffer.read(frames)
+                if samples.size:
+                    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+                    self._device.write(pcm.tobytes())
+        queued = 0 if self._sink is None else self._sink.bufferSize() - self._sink.bytesFree()
+        if self.stream.buffer.drained and queued <= 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        self.finished = True
+        self.stop()
+        if self.on_finished is not None:
+            self.on_finished()
@@ -0,0 +1,314 @@
+"""Render many lines of text to audio files in one run.
+
+The input is a TXT file (one line per clip), a CSV file with a ``text``
+column or a JSONL file of objects with a ``text`` key (or plain strings).
+CSV and JSONL rows may also set ``voice``, ``lang``, ``rate`` and
+``filename``. Lines are rendered on a thread pool against the backend's
+resident model and every result is appended to a JSONL manifest with the
+output path, audio duration and stage timings.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from .audio_encode import submit
+from .timer import StageTimer
+
+BATCH_SUFFIXES = (".txt", ".csv", ".jsonl")
+
+
+@dataclass
+class BatchItem:
+    index: int
+    text: str
+    voice: str | None = None
+    lang: str | None = None
+    rate: int | None = None
+    filename: str | None = None
+
+
+def _rate(value) -> int | None:
+    """Parse a row's ``rate``; ValueError for anything but a whole number."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid rate: {value!r}")
+
+
+def _item(index: int, row: dict) -> BatchItem | None:
+    text = str(row.get("text") or "").strip()
+    if not text:
+        return None
+    return BatchItem(
+        index,
+        text,
+        voice=row.get("voice") or None,
+        lang=row.get("lang") or None,
+        rate=_rate(row.get("rate")),
+        filename=row.get("filename") or None,
+    )
+
+
+def load_items(path: str | Path, errors: list[dict] | None = None) -> list[BatchItem]:
+    """Read the lines to render from a TXT, CSV or JSONL file.
+
+    Rows with invalid fields (e.g. a ``rate`` that is not a number) are not
+    returned. They are appended to ``errors`` as manifest records with an
+    ``error`` key when a list is given, and otherwise skipped with a warning.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    rows: list[dict] = []
+    with path.open("r", encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            reader = csv.DictReader(f)
+            if reader.fieldnames and "text" not in reader.fieldnames:
+                # Headerless CSV: the first column holds the text.
+                f.seek(0)
+                rows = [{"text": r[0]} for r in csv.reader(f) if r]
+            else:
+                rows = list(reader)
+        elif suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    value = json.loads(line)
+                    rows.append(value if isinstance(value, dict) else {"text": value})
+        else:
+            rows = [{"text": line} for line in f]
+    items: list[BatchItem] = []
+    index = 0
+    for row in rows:
+        try:
+            item = _item(index, row)
+        except ValueError as e:
+            record = {"index": index, "text": str(row.get("text") or "").strip(), "error": str(e)}
+            if errors is None:
+                print(f"[WARN] Skipping line {index + 1}: {e}")
+            else:
+                errors.append(record)
+            index += 1
+            continue
+        if item is not None:
+            items.append(item)
+            index += 1
+    return items
+
+
+def item_kwargs(backend: str, item: BatchItem, defaults: dict | None = None) -> dict:
+    """Backend keyword arguments for ``item``, overriding ``defaults``."""
+    from ..backend import BACKEND_FEATURES
+
+    features = BACKEND_FEATURES.get(backend, set())
+    kwargs = dict(defaults or {})
+    if item.voice and "voice" in features:
+        kwargs["voice"] = item.voice
+    if item.lang and "lang" in features:
+        kwargs["lang"] = item.lang
+    if item.rate is not None and "rate" in features:
+        kwargs["rate"] = f"{item.rate - 200:+d}%" if backend == "edge_tts" else item.rate
+    return kwargs
+
+
+def output_name(item: BatchItem) -> str:
+    if item.filename:
+        # Only the name is used so rows cannot write outside the output folder.
+        name = Path(item.filename).name
+        return name if Path(name).suffix else f"{name}.wav"
+    slug = re.sub(r"[^\w]+", "_", item.text[:30]).strip("_").lower() or "clip"
+    return f"{item.index + 1:04d}_{slug}.wav"
+
+
+def _audio_duration(path: Path) -> float | None:
+    try:
+        import soundfile as sf
+
+        return round(sf.info(str(path)).duration, 3)
+    except Exception:
+        return None
+
+
+def _render_one(
+    func: Callable,
+    backend: str,
+    item: BatchItem,
+    output: Path,
+    kwargs: dict,
+    output_format: str | None = None,
+    subtype: str | None = None,
+) -> dict:
+    stages = StageTimer(backend=backend, batch_index=item.index)
+    start = time.time()
+    row = {**asdict(item), "output": str(output)}
+    try:
+        with stages.activate():
+            with stages.stage("inference"):
+                result = func(item.text, output, **kwargs)
+            if isinstance(result, (str, Path)):
+                row["output"] = str(result)
+            if output_format is not None:
+                with stages.stage("encode"):
+                    row["output"] = str(
+                        submit(row["output"], output_format, subtype=subtype).result()
+                    )
+    except Exception as e:
+        row["error"] = str(e)
+    else:
+        duration = _audio_duration(Path(row["output"]))
+        row["duration"] = duration
+        if duration:
+            stages.note(audio_duration=duration)
+    row["elapsed"] = round(time.time() - start, 3)
+    row["timings"] = stages.record()
+    return row
+
+
+def batch_concurrency(backend: str) -> int | None:
+    """Lines ``backend`` may render at once; None when it is thread-safe."""
+    from ..backend import BACKEND_FEATURES
+
+    return None if "threadsafe" in BACKEND_FEATURES.get(backend, set()) else 1
+
+
+def render_batch(
+    source: str | Path,
+    manifest_path: str | Path,
+    *,
+    backend: str,
+    workers: int = 2,
+    defaults: dict | None = None,
+    output_dir: str | Path | None = None,
+    func: Callable | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+    output_format: str | None = None,
+    subtype: str | None = None,
+) -> Path:
+    """Render every line of ``source`` with ``backend`` and write a manifest.
+
+    Parameters
+    ----------
+    source:
+        TXT, CSV or JSONL file, see ``load_items``.
+    manifest_path:
+        JSONL file receiving one record per line as it completes: the item
+        fields, ``output``, ``duration``, ``elapsed``, ``timings`` and
+        ``error`` for failed lines and rows with invalid fields.
+    backend:
+        Name of a text-to-speech backend in ``BACKENDS``.
+    workers:
+        Number of lines rendered at once. All workers share the backend's
+        resident model, so backends without the ``threadsafe`` feature are
+        limited to one worker (see ``batch_concurrency``).
+    defaults:
+        Keyword arguments for every line; per-line values take precedence.
+    output_dir:
+        Folder for the audio files, by default the manifest's folder.
+    func:
+        Synthesis function to call instead of ``BACKENDS[backend]``.
+    on_progress:
+        Called with ``(done, total)`` after each line, on the calling thread.
+    cancelled:
+        Polled before each line starts; remaining lines are skipped once it
+        returns True.
+    output_format, subtype:
+        Encode every clip with ``utils.audio_encode`` (e.g. ``"flac"``)
+        instead of keeping the backend's output.
+
+    Returns
+    -------
+    Path
+        The manifest path.
+    """
+    if func is None:
+        from ..backend import BACKENDS
+
+        func = BACKENDS[backend]
+    invalid: list[dict] = []
+    items = load_items(source, invalid)
+    cap = batch_concurrency(backend)
+    workers = max(1, int(workers))
+    if cap is not None and workers > cap:
+        print(f"[INFO] {backend} is not thread-safe; rendering {cap} line at a time")
+        workers = cap
+    manifest_path = Path(manifest_path)
+    output_dir = Path(output_dir) if output_dir is not None else manifest_path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def run(item: BatchItem) -> dict | None:
+        if cancelled is not None and cancelled():
+            return None
+        kwargs = item_kwargs(backend, item, defaults)
+        return _render_one(
+            func, backend, item, output_dir / output_name(item), kwargs, output_format, subtype
+        )
+
+    done = rendered = 0
+    total = len(items) + len(invalid)
+    print(f"[INFO] Rendering {len(items)} lines with {backend} on {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers) as pool, manifest_path.open(
+        "w", encoding="utf-8"
+    ) as manifest:
+        for row in invalid:
+            manifest.write(json.dumps(row, ensure_ascii=False) + "\n")
+        futures = [pool.submit(run, item) for item in items]
+        for future in as_completed(futures):
+            row = future.result()
+            done += 1
+            # Lines skipped after cancellation return None.
+            if row is not None:
+                rendered += "error" not in row
+                manifest.write(json.dumps(row, ensure_ascii=False) + "\n")
+                manifest.flush()
+            if on_progress is not None:
+                on_progress(done, len(items))
+    print(f"[INFO] Batch finished: {rendered} of {total} lines rendered, manifest {manifest_path}")
+    return manifest_path
+
+
+def read_manifest(path: str | Path) -> list[dict]:
+    with Path(path).open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Render a TXT/CSV/JSONL file of lines to audio")
+    parser.add_argument("source", help="Input file")
+    parser.add_argument("--backend", default="pyttsx3")
+    parser.add_argument("--out", default="outputs/batch", help="Output folder")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--voice")
+    parser.add_argument("--lang")
+    parser.add_argument("--format", help="Encode clips as wav, flac, ogg (Opus) or mp3")
+    args = parser.parse_args(argv)
+
+    defaults = item_kwargs(args.backend, BatchItem(-1, "", voice=args.voice, lang=args.lang))
+    out = Path(args.out)
+    render_batch(
+        args.source,
+        out / "manifest.jsonl",
+        backend=args.backend,
+        workers=args.workers,
+        defaults=defaults,
+        output_format=args.format,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,55 @@
+import hashlib
 import os
 import re
 from typing import Optional
 
+# How outputs are arranged below the output directory:
+#   per_clip  <output>/<base>/<base>, one directory per clip
+#   date      <output>/YYYY/MM/DD/<base>
+#   hash      <output>/ab/cd/<base>, sharded by a hash of the name
+LAYOUTS = ("per_clip", "date", "hash")
+DEFAULT_LAYOUT = "per_clip"
+
+
+def shard_dirs(base: str, date: str, layout: str) -> tuple[str, ...]:
+    """Directories between the output directory and the file ``base``."""
+    if layout == "per_clip":
+        return (base,)
+    if layout == "date":
+        day = date[:10].split("-")
+        if len(day) == 3 and all(part.isdigit() for part in day):
+            return tuple(day)
+        return ("undated",)
+    if layout == "hash":
+        digest = hashlib.sha1(base.encode("utf-8")).hexdigest()
+        return (digest[:2], digest[2:4])
+    raise ValueError(f"Unknown output layout: {layout}")
+
 
 def _create_base_filename(
-    title: Optional[str], output_path: str, model: str, date: str
+    title: Optional[str],
+    output_path: str,
+    model: str,
+    date: str,
+    layout: str = DEFAULT_LAYOUT,
 ) -> str:
     base = f"{date}__{model}__{replace_path_sep(title)}"
-    return os.path.join(output_path, base, base)
+    return os.path.join(output_path, *shard_dirs(base, date, layout), base)
 
 
 def create_base_filename(
-    title: Optional[str], output_path: str, model: str, date: str
+    title: Optional[str],
+    output_path: str,
+    model: str,
+    date: str,
+    layout: str = DEFAULT_LAYOUT,
 ) -> str:
-    base_filename = _create_base_filename(title, output_path, model, date)
+    base_filename = _create_base_filename(title, output_path, model, date, layout)
 
     base_directory = os.path.dirname(base_filename)
-    os.makedirs(base_directory, exist_ok=True)
+    # Shared shard directories exist after the first clip of the day/prefix.
+    if not os.path.isdir(base_directory):
+        os.makedirs(base_directory, exist_ok=True)
 
     return base_filename
 
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+HISTORY_DB = Path.home() / ".hybrid_tts" / "history.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    backend TEXT NOT NULL,
+    voice TEXT,
+    text TEXT NOT NULL DEFAULT '',
+    output TEXT,
+    kind TEXT NOT NULL DEFAULT 'audio',
+    duration REAL,
+    elapsed REAL,
+    stages TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_created ON entries (created DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_entries_backend ON entries (backend, created DESC);
+CREATE INDEX IF NOT EXISTS idx_entries_output ON entries (output);
+"""
+
+# External-content FTS5 index over the input text, kept in sync by triggers.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    text, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    id: int
+    created: float
+    backend: str
+    voice: str | None
+    text: str
+    output: str | None
+    kind: str
+    duration: float | None
+    elapsed: float | None
+    # ``StageTimer.record()`` of the job that produced the entry.
+    stages: dict | None = field(default=None, compare=False)
+
+    @property
+    def label(self) -> str:
+        """Text shown in the history list."""
+        if self.kind == "transcript":
+            return f"Transcribed: {self.text[:30].replace(chr(10), ' ')}"
+        return self.output or self.text[:30]
+
+
+class HistoryStore:
+    """Persistent synthesis history in SQLite.
+
+    Entries are indexed by creation time and backend, and the input text is
+    searchable through FTS5 when the SQLite build provides it (falling back
+    to ``LIKE`` otherwise). The connection is shared between threads behind
+    a lock.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or HISTORY_DB)
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        if "stages" not in columns:
+            # Databases created before stage timings were recorded.
+            self._conn.execute("ALTER TABLE entries ADD COLUMN stages TEXT")
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add(
+        self,
+        backend: str,
+        *,
+        text: str = "",
+        output: str | Path | None = None,
+        voice: str | None = None,
+        kind: str = "audio",
+        duration: float | None = None,
+        elapsed: float | None = None,
+        created: float | None = None,
+        stages: dict | None = None,
+    ) -> HistoryEntry:
+        row = (
+            created if created is not None else time.time(),
+            backend,
+            voice,
+            text,
+            str(output) if output is not None else None,
+            kind,
+            duration,
+            elapsed,
+        )
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO entries (created, backend, voice, text, output, kind, duration, elapsed, stages)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*row, json.dumps(stages) if stages is not None else None),
+            )
+        return HistoryEntry(cur.lastrowid, *row, stages=stages)
+
+    def delete(self, entry_id: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+
+    def forget_outputs(self, outputs: Iterable[str | Path]) -> int:
+        """Delete the entries of ``outputs``, e.g. files removed by cleanup.
+
+        Outputs are matched by the path string they were recorded with.
+        Returns the number of deleted entries.
+        """
+        keys = [(str(output),) for output in outputs]
+        with self._lock, self._conn:
+            cur = self._conn.executemany("DELETE FROM entries WHERE output = ?", keys)
+        return max(cur.rowcount, 0)
+
+    def _where(self, query: str | None, backend: str | None) -> tuple[str, list]:
+        clauses, params = [], []
+        if backend:
+            clauses.append("backend = ?")
+            params.append(backend)
+        if query:
+            if self.has_fts:
+                clauses.append("id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)")
+                # Quote each term so user input cannot break the FTS syntax.
+                params.append(" ".join('"' + t.replace('"', '""') + '"*' for t in query.split()))
+            else:
+                clauses.append("text LIKE ?")
+                params.append(f"%{query}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, query: str | None = None, backend: str | None = None) -> int:
+        where, params = self._where(query, backend)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM entries{where}", params).fetchone()[0]
+
+    def page(
+        self,
+        limit: int,
+        after: HistoryEntry | None = None,
+        query: str | None = None,
+        backend: str | None = None,
+    ) -> list[HistoryEntry]:
+        """Return up to ``limit`` entries older than ``after``, newest first.
+
+        Paging continues from the last entry of the previous page through
+        the ``created`` index, so deep pages cost the same as the first.
+        """
+        where, params = self._where(query, backend)
+        if after is not None:
+            where += (" AND " if where else " WHERE ") + "(created, id) < (?, ?)"
+            params += [after.created, after.id]
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, created, backend, voice, text, output, kind, duration, elapsed, stages"
+                f" FROM entries{where} ORDER BY created DESC, id DESC LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [
+            HistoryEntry(*row[:-1], stages=json.loads(row[-1]) if row[-1] else None)
+            for row in rows
+        ]
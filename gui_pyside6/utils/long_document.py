@@ -0,0 +1,285 @@
+"""Render book-length text in checkpointed chunks.
+
+The text is split into paragraphs, and paragraphs that are too long are
+split at sentence boundaries. Each chunk is rendered to its own file in a
+checkpoint folder under ``~/.hybrid_tts/checkpoints``, and
+``progress.json`` lists the chunks that are finished. The folder name is
+derived from the text, the backend and its settings, so rendering the same
+document again after a crash, an error or a cancel skips the chunks that
+are already on disk. Once every chunk exists the final file is assembled
+block by block, so the whole recording is never held in memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Callable
+
+from .timer import note, stage
+
+CHECKPOINT_DIR = Path.home() / ".hybrid_tts" / "checkpoints"
+
+DEFAULT_CHUNK_CHARS = 800
+
+# Silence inserted after a chunk that ends a paragraph, in seconds.
+PARAGRAPH_PAUSE = 0.35
+
+_BLOCK_FRAMES = 1 << 16
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+class RenderCancelled(Exception):
+    """Raised when a document render stops early; its checkpoints are kept."""
+
+
+def split_document(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> list[tuple[str, bool]]:
+    """Split ``text`` into ``(chunk, ends_paragraph)`` pairs.
+
+    Paragraphs up to ``max_chars`` long become one chunk. Longer ones are
+    packed sentence by sentence into chunks of at most ``max_chars``.
+    """
+    from .audio_stream import split_sentences
+
+    chunks: list[tuple[str, bool]] = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            chunks.append((paragraph, True))
+            continue
+        current = ""
+        parts: list[str] = []
+        for sentence in split_sentences(paragraph, max_chars):
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                parts.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            parts.append(current)
+        chunks.extend((part, i == len(parts) - 1) for i, part in enumerate(parts))
+    return chunks
+
+
+def checkpoint_key(text: str, backend: str, kwargs: dict, max_chars: int) -> str:
+    """Identify a render by everything that changes its audio."""
+    settings = {
+        k: v for k, v in sorted(kwargs.items())
+        if isinstance(v, (str, int, float, bool, type(None)))
+    }
+    payload = json.dumps([backend, max_chars, settings, text], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_progress(folder: Path) -> dict:
+    try:
+        return json.loads((folder / "progress.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_progress(folder: Path, progress: dict) -> None:
+    tmp = folder / "progress.json.tmp"
+    tmp.write_text(json.dumps(progress, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, folder / "progress.json")
+
+
+def _completed(folder: Path, progress: dict) -> dict[int, Path]:
+    done = {}
+    for entry in progress.get("completed", []):
+        path = folder / entry["file"]
+        if path.is_file():
+            done[int(entry["index"])] = path
+    return done
+
+
+def _feed(path: Path, on_chunk: Callable) -> None:
+    import soundfile as sf
+
+    try:
+        data, sr = sf.read(str(path), dtype="float32")
+        on_chunk(data, sr)
+    except Exception as e:
+        # Playback is a convenience; never fail the render over it.
+        print(f"[WARN] Cannot stream {path.name}: {e}")
+
+
+def _open_output(path: Path, sample_rate: int, channels: int):
+    import soundfile as sf
+
+    tmp = path.with_name(f"{path.stem}.part{path.suffix}")
+    try:
+        return sf.SoundFile(str(tmp), "w", samplerate=sample_rate, channels=channels), tmp, path
+    except Exception as e:
+        if path.suffix.lower() == ".wav":
+            raise
+        # Older libsndfile builds cannot write MP3; keep the audio as WAV.
+        print(f"[WARN] Cannot write {path.suffix} files ({e}); saving WAV instead")
+        path = path.with_suffix(".wav")
+        tmp = path.with_name(f"{path.stem}.part.wav")
+        return sf.SoundFile(str(tmp), "w", samplerate=sample_rate, channels=channels), tmp, path
+
+
+def assemble(parts: list[tuple[Path, bool]], output: str | Path, pause: float = PARAGRAPH_PAUSE) -> Path:
+    """Concatenate the chunk files in ``parts`` into ``output``.
+
+    ``parts`` holds ``(path, ends_paragraph)`` pairs; ``pause`` seconds of
+    silence follow each paragraph except the last. Audio is copied in
+    blocks, so memory use does not grow with the document. The output is
+    written to a ``.part`` file first and renamed when complete.
+
+    Returns
+    -------
+    Path
+        The written file, which is a WAV file when ``output``'s format
+        cannot be written.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    out = tmp = None
+    try:
+        for i, (path, ends_paragraph) in enumerate(parts):
+            with sf.SoundFile(str(path)) as src:
+                if out is None:
+                    out, tmp, output = _open_output(output, src.samplerate, src.channels)
+                elif src.samplerate != out.samplerate:
+                    raise ValueError(
+                        f"{path.name} has sample rate {src.samplerate}, expected {out.samplerate}"
+                    )
+                for block in src.blocks(blocksize=_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                    if block.shape[1] != out.channels:
+                        block = np.repeat(block.mean(axis=1, keepdims=True), out.channels, axis=1)
+                    out.write(block)
+            if ends_paragraph and pause > 0 and i < len(parts) - 1:
+                out.write(np.zeros((int(pause * out.samplerate), out.channels), dtype="float32"))
+    except BaseException:
+        if out is not None:
+            out.close()
+            tmp.unlink(missing_ok=True)
+        raise
+    if out is None:
+        raise ValueError("no chunks to assemble")
+    out.close()
+    os.replace(tmp, output)
+    return output
+
+
+def render_document(
+    text: str,
+    output: str | Path,
+    *,
+    func: Callable,
+    backend: str,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    checkpoint_root: str | Path | None = None,
+    cancelled: Callable[[], bool] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    on_chunk: Callable | None = None,
+    keep_checkpoints: bool = False,
+    **kwargs,
+) -> Path:
+    """Render ``text`` chunk by chunk with ``func`` and assemble ``output``.
+
+    Parameters
+    ----------
+    text:
+        The whole document.
+    output:
+        Final audio file.
+    func:
+        Backend synthesis function, called as ``func(chunk, path, **kwargs)``.
+    backend:
+        Backend name, part of the checkpoint key.
+    max_chars:
+        Longest chunk passed to the backend.
+    checkpoint_root:
+        Folder holding checkpoint folders, ``CHECKPOINT_DIR`` by default.
+    cancelled:
+        Polled before each chunk; when it returns True ``RenderCancelled``
+        is raised and the finished chunks stay on disk for the next run.
+    on_progress:
+        Called with ``(done, total)`` chunks after each chunk.
+    on_chunk:
+        Streaming callback ``(samples, sample_rate)``. Backends with the
+        ``stream`` feature receive it directly; otherwise it gets each chunk
+        once rendered, and chunks restored from a checkpoint are replayed.
+    keep_checkpoints:
+        Keep the checkpoint folder after the output has been assembled.
+    **kwargs:
+        Backend options, also part of the checkpoint key.
+
+    Returns
+    -------
+    Path
+        The assembled file.
+    """
+    from ..backend import BACKEND_FEATURES
+
+    output = Path(output)
+    chunks = split_document(text, max_chars)
+    if not chunks:
+        raise ValueError("document has no text")
+    root = Path(checkpoint_root) if checkpoint_root is not None else CHECKPOINT_DIR
+    folder = root / checkpoint_key(text, backend, kwargs, max_chars)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    progress = _load_progress(folder)
+    done = _completed(folder, progress)
+    progress = {
+        "backend": backend,
+        "output": str(output),
+        "total": len(chunks),
+        "completed": [
+            entry for entry in progress.get("completed", []) if int(entry["index"]) in done
+        ],
+    }
+    _save_progress(folder, progress)
+    note(chunks=len(chunks), resumed_chunks=len(done))
+    if done:
+        print(f"[INFO] Resuming {backend} document at chunk {len(done) + 1} of {len(chunks)} ({folder})")
+    else:
+        print(f"[INFO] Rendering {backend} document in {len(chunks)} chunks ({folder})")
+
+    streams = on_chunk is not None and "stream" in BACKEND_FEATURES.get(backend, set())
+    suffix = output.suffix or ".wav"
+    for index, (chunk, _) in enumerate(chunks):
+        if index in done:
+            if on_chunk is not None:
+                _feed(done[index], on_chunk)
+            continue
+        if cancelled is not None and cancelled():
+            raise RenderCancelled(
+                f"cancelled after {len(done)} of {len(chunks)} chunks; render again to resume"
+            )
+        name = f"chunk_{index + 1:05d}{suffix}"
+        part = folder / f"chunk_{index + 1:05d}.part{suffix}"
+        call_kwargs = {**kwargs, "on_chunk": on_chunk} if streams else kwargs
+        result = func(chunk, part, **call_kwargs)
+        if isinstance(result, (str, Path)) and Path(result) != part:
+            part = Path(result)
+        os.replace(part, folder / name)
+        done[index] = folder / name
+        progress["completed"].append({"index": index, "file": name, "chars": len(chunk)})
+        _save_progress(folder, progress)
+        if on_chunk is not None and not streams:
+            _feed(done[index], on_chunk)
+        if on_progress is not None:
+            on_progress(len(done), len(chunks))
+
+    with stage("write"):
+        result = assemble(
+            [(done[i], ends_paragraph) for i, (_, ends_paragraph) in enumerate(chunks)], output
+        )
+    if not keep_checkpoints:
+        shutil.rmtree(folder, ignore_errors=True)
+    return result
+
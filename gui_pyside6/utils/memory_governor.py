@@ -0,0 +1,256 @@
+"""Unload resident models that sit idle or push memory over a limit.
+
+Backends keep their loaded models in module-level dictionaries so repeated
+calls skip loading. They register those dictionaries with ``register`` and
+call ``touch`` whenever they use an entry. ``_call_backend`` marks a backend
+as in use for the duration of each call (``in_use``) so its models are never
+unloaded mid-generation.
+
+``MemoryGovernor.check`` drops entries unused for longer than
+``idle_timeout`` and, while the process RSS exceeds ``rss_limit_mb``, the
+least recently used remaining entries. Dropping an entry only removes the
+cache's reference; memory is returned once ``torch_clear_memory`` has run
+and no running call still holds the model.
+"""
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+# Seconds between checks when the governor runs on its own thread.
+DEFAULT_INTERVAL = 30.0
+DEFAULT_IDLE_TIMEOUT = 15 * 60.0
+
+_LOCK = threading.Lock()
+# (backend, label, cache, cache lock) for every registered cache.
+_CACHES: list[tuple[str, str, dict, object]] = []
+_LAST_USED: dict[tuple[int, object], float] = {}
+_BUSY: dict[str, int] = {}
+
+
+@dataclass
+class Resident:
+    backend: str
+    label: str
+    key: object
+    last_used: float
+
+    def describe(self) -> str:
+        key = self.key if not isinstance(self.key, tuple) else "/".join(map(str, self.key))
+        return f"{self.backend} {self.label} {key}"
+
+
+def register(backend: str, cache: dict, label: str = "model", lock=None) -> None:
+    """Let the governor unload entries of ``cache``.
+
+    ``lock`` is the lock the backend holds while it fills ``cache``; the
+    governor takes it before removing an entry.
+    """
+    with _LOCK:
+        if not any(entry[2] is cache for entry in _CACHES):
+            _CACHES.append((backend, label, cache, lock))
+
+
+def touch(cache: dict, key) -> None:
+    """Record that ``cache[key]`` was just used."""
+    _LAST_USED[(id(cache), key)] = time.monotonic()
+
+
+class _InUse:
+    def __init__(self, backend: str):
+        self.backend = backend
+
+    def __enter__(self):
+        with _LOCK:
+            _BUSY[self.backend] = _BUSY.get(self.backend, 0) + 1
+        return self
+
+    def __exit__(self, *exc):
+        with _LOCK:
+            _BUSY[self.backend] -= 1
+            if not _BUSY[self.backend]:
+                del _BUSY[self.backend]
+        return False
+
+
+def in_use(backend: str) -> _InUse:
+    """Context manager keeping ``backend``'s models resident while it runs."""
+    return _InUse(backend)
+
+
+def is_busy(backend: str) -> bool:
+    return _BUSY.get(backend, 0) > 0
+
+
+def resident() -> list[Resident]:
+    """Loaded entries of all registered caches, least recently used first."""
+    now = time.monotonic()
+    with _LOCK:
+        caches = list(_CACHES)
+    entries = []
+    for backend, label, cache, _ in caches:
+        for key in list(cache):
+            # Entries loaded before the backend called ``touch`` count as
+            # used now, so they get a full idle period.
+            last = _LAST_USED.setdefault((id(cache), key), now)
+            entries.append(Resident(backend, label, key, last))
+    return sorted(entries, key=lambda r: r.last_used)
+
+
+def summary() -> str:
+    """Short residency line for the GUI, e.g. ``"kokoro (3), mms (1)"``."""
+    counts: dict[str, int] = {}
+    for entry in resident():
+        counts[entry.backend] = counts.get(entry.backend, 0) + 1
+    return ", ".join(f"{backend} ({n})" for backend, n in counts.items()) or "none"
+
+
+def _find(entry: Resident) -> tuple[dict, object] | None:
+    with _LOCK:
+        for backend, label, cache, lock in _CACHES:
+            if backend == entry.backend and label == entry.label and entry.key in cache:
+                return cache, lock
+    return None
+
+
+def _drop(entry: Resident) -> bool:
+    found = _find(entry)
+    if found is None:
+        return False
+    cache, lock = found
+    if lock is not None and not lock.acquire(timeout=0):
+        # The backend is loading a model right now; try again next check.
+        return False
+    try:
+        if cache.pop(entry.key, None) is None:
+            return False
+    finally:
+        if lock is not None:
+            lock.release()
+    _LAST_USED.pop((id(cache), entry.key), None)
+    return True
+
+
+def clear_memory() -> None:
+    """Return freed memory to the system, without importing torch for it."""
+    if "torch" in sys.modules:
+        from .torch_clear_memory import torch_clear_memory
+
+        torch_clear_memory()
+    else:
+        gc.collect()
+
+
+def unload(backend: str | None = None) -> list[Resident]:
+    """Unload every idle entry, or those of ``backend``; busy backends are kept."""
+    dropped = [
+        entry
+        for entry in resident()
+        if (backend is None or entry.backend == backend)
+        and not is_busy(entry.backend)
+        and _drop(entry)
+    ]
+    if dropped:
+        clear_memory()
+    return dropped
+
+
+def rss_mb() -> float | None:
+    """Resident set size of this process in MiB, if it can be measured."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1 << 20)
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class MemoryGovernor:
+    """Apply the idle timeout and RSS limit to the resident models.
+
+    ``idle_timeout`` is in seconds and ``rss_limit_mb`` in MiB; 0 or None
+    disables either rule. The GUI calls ``check`` from a timer; the API
+    server uses ``start`` to run it on a daemon thread every ``interval``
+    seconds. ``on_unload(entries)`` is called after a check that unloaded
+    something.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+        rss_limit_mb: float | None = None,
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        on_unload: Callable[[list[Resident]], None] | None = None,
+        measure: Callable[[], float | None] = rss_mb,
+    ):
+        self.idle_timeout = idle_timeout
+        self.rss_limit_mb = rss_limit_mb
+        self.interval = interval
+        self.on_unload = on_unload
+        self.measure = measure
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self, now: float | None = None) -> list[Resident]:
+        """Unload what the rules allow and return the unloaded entries."""
+        now = time.monotonic() if now is None else now
+        dropped: list[Resident] = []
+        candidates = [entry for entry in resident() if not is_busy(entry.backend)]
+        if self.idle_timeout:
+            for entry in candidates:
+                if now - entry.last_used >= self.idle_timeout and _drop(entry):
+                    dropped.append(entry)
+            if dropped:
+                clear_memory()
+                print(f"[INFO] Unloaded idle models: {', '.join(e.describe() for e in dropped)}")
+        if self.rss_limit_mb:
+            rss = self.measure()
+            remaining = [entry for entry in candidates if entry not in dropped]
+            # Least recently used first, re-measuring after each unload
+            # because models differ widely in size.
+            while rss is not None and rss > self.rss_limit_mb and remaining:
+                entry = remaining.pop(0)
+                if not _drop(entry):
+                    continue
+                dropped.append(entry)
+                clear_memory()
+                print(
+                    f"[INFO] Unloaded {entry.describe()}: RSS {rss:.0f} MiB over "
+                    f"{self.rss_limit_mb:.0f} MiB"
+                )
+                rss = self.measure()
+        if dropped and self.on_unload is not None:
+            self.on_unload(dropped)
+        return dropped
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="memory-governor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"[WARN] Memory governor check failed: {e}")
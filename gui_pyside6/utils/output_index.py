@@ -0,0 +1,301 @@
+"""Index and retention policy for an output directory.
+
+Every file written below an output directory is recorded in a small SQLite
+database at its root (``.index.sqlite3``) with its size, backend, input
+snippet and last access time. Totals, listings and cleanups are queries on
+that index instead of walks over the tree; ``scan`` reconciles it with the
+disk for files written by older versions or other tools.
+
+``cleanup`` first removes outputs not used for ``max_age_days``, then the
+least recently used ones until the directory fits in ``max_bytes``.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+INDEX_NAME = ".index.sqlite3"
+
+# Characters of the input text kept with each output.
+SNIPPET_CHARS = 200
+
+AUDIO_SUFFIXES = {".wav", ".flac", ".ogg", ".mp3"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    path TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    backend TEXT,
+    kind TEXT NOT NULL DEFAULT 'audio',
+    text TEXT NOT NULL DEFAULT '',
+    duration REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_outputs_accessed ON outputs (accessed, created);
+"""
+
+_INDEXES: dict[Path, "OutputIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class OutputEntry:
+    path: Path
+    created: float
+    accessed: float
+    size: int
+    backend: str | None
+    kind: str
+    text: str
+    duration: float | None
+
+
+def _skipped(name: str) -> bool:
+    """Files that are not outputs: the index itself, peak sidecars, temp files."""
+    return (
+        name.startswith(INDEX_NAME)
+        or name.endswith(".peaks")
+        or name.endswith(".part")
+        or ".part." in name
+    )
+
+
+class OutputIndex:
+    """SQLite index of the files below ``root``.
+
+    Paths are stored relative to ``root`` so the directory can be moved.
+    Each change is a single transaction, and the connection is shared
+    between threads behind a lock.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / INDEX_NAME), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _key(self, path: str | Path) -> str:
+        """Path relative to the root; ValueError for files outside it."""
+        return Path(path).resolve().relative_to(self.root).as_posix()
+
+    def contains(self, path: str | Path) -> bool:
+        """Whether ``path`` lies below the root."""
+        try:
+            self._key(path)
+        except ValueError:
+            return False
+        return True
+
+    def _entry(self, row) -> OutputEntry:
+        return OutputEntry(self.root / row[0], *row[1:])
+
+    def add(
+        self,
+        paths: str | Path | Iterable[str | Path],
+        *,
+        backend: str | None = None,
+        kind: str = "audio",
+        text: str = "",
+        duration: float | None = None,
+        created: float | None = None,
+    ) -> int:
+        """Record files written below the root and return how many were added.
+
+        Several ``paths``, e.g. the stems of one separation, are recorded in
+        one transaction. Missing files and files outside the root are skipped.
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        now = created if created is not None else time.time()
+        rows = []
+        for path in paths:
+            try:
+                key = self._key(path)
+                size = Path(path).stat().st_size
+            except (OSError, ValueError):
+                continue
+            rows.append((key, now, now, size, backend, kind, text[:SNIPPET_CHARS], duration))
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO outputs"
+                    " (path, created, accessed, size, backend, kind, text, duration)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def touch(self, path: str | Path, when: float | None = None) -> None:
+        """Mark ``path`` as used, e.g. when it is played."""
+        try:
+            key = self._key(path)
+        except ValueError:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outputs SET accessed = ? WHERE path = ?",
+                (when if when is not None else time.time(), key),
+            )
+
+    def entries(self, limit: int | None = None) -> list[OutputEntry]:
+        """Indexed outputs, most recently used first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, created, accessed, size, backend, kind, text, duration"
+                " FROM outputs ORDER BY accessed DESC, created DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM outputs").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+
+    def scan(self) -> tuple[int, int]:
+        """Index files missing from the index and forget files that are gone.
+
+        Files found on disk are dated by their modification time. Returns
+        the number of ``(added, dropped)`` entries.
+        """
+        with self._lock:
+            known = {row[0] for row in self._conn.execute("SELECT path FROM outputs")}
+        found, new_rows = set(), []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if _skipped(name):
+                    continue
+                path = Path(dirpath) / name
+                key = path.relative_to(self.root).as_posix()
+                found.add(key)
+                if key in known:
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                kind = "audio" if path.suffix.lower() in AUDIO_SUFFIXES else "file"
+                new_rows.append((key, st.st_mtime, st.st_mtime, st.st_size, None, kind, "", None))
+        gone = [(key,) for key in known - found]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO outputs"
+                " (path, created, accessed, size, backend, kind, text, duration)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                new_rows,
+            )
+            self._conn.executemany("DELETE FROM outputs WHERE path = ?", gone)
+        return len(new_rows), len(gone)
+
+    def cleanup(
+        self,
+        *,
+        max_age_days: float | None = None,
+        max_bytes: int | None = None,
+        keep: Iterable[str | Path] = (),
+        now: float | None = None,
+    ) -> list[Path]:
+        """Apply the retention policy and return the removed files.
+
+        Outputs not used for ``max_age_days`` are removed, then the least
+        recently used ones until the indexed total is at most ``max_bytes``.
+        Files in ``keep`` (e.g. the output just written) are never removed.
+        Peak sidecars go with their audio, and directories left empty are
+        removed up to the root.
+        """
+        if not max_age_days and max_bytes is None:
+            return []
+        now = time.time() if now is None else now
+        protected = {self._key(p) for p in keep if self.contains(p)}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, accessed, size FROM outputs ORDER BY accessed, created"
+            ).fetchall()
+        rows = [row for row in rows if row[0] not in protected]
+        doomed: dict[str, int] = {}
+        if max_age_days:
+            cutoff = now - max_age_days * 86400
+            doomed.update((key, size) for key, accessed, size in rows if accessed < cutoff)
+        if max_bytes is not None:
+            with self._lock:
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM outputs").fetchone()[0]
+            total -= sum(doomed.values())
+            for key, _, size in rows:
+                if total <= max_bytes:
+                    break
+                if key not in doomed:
+                    doomed[key] = size
+                    total -= size
+        removed, forgotten = [], []
+        for key in doomed:
+            path = self.root / key
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                print(f"[WARN] Could not remove {path}: {e}")
+                continue
+            Path(f"{path}.peaks").unlink(missing_ok=True)
+            forgotten.append((key,))
+            removed.append(path)
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM outputs WHERE path = ?", forgotten)
+        self._prune_dirs(removed)
+        return removed
+
+    def _prune_dirs(self, removed: Iterable[Path]) -> None:
+        for parent in sorted({p.parent for p in removed}, key=lambda p: len(p.parts), reverse=True):
+            while parent != self.root and self.root in parent.parents:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+
+
+def open_index(root: str | Path) -> OutputIndex:
+    """Shared ``OutputIndex`` of ``root``, opened on first use."""
+    root = Path(root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            index = _INDEXES[root] = OutputIndex(root)
+        return index
+
+
+def apply_retention(
+    root: str | Path,
+    *,
+    max_age_days: float | None = None,
+    max_bytes: int | None = None,
+    scan: bool = False,
+    keep: Iterable[str | Path] = (),
+) -> list[Path]:
+    """Run ``cleanup`` on the index of ``root``, after a ``scan`` if asked.
+
+    Does nothing, and creates nothing, when neither limit is set.
+    """
+    if not max_age_days and max_bytes is None:
+        return []
+    index = open_index(root)
+    if scan:
+        index.scan()
+    removed = index.cleanup(max_age_days=max_age_days, max_bytes=max_bytes, keep=keep)
+    if removed:
+        print(f"[INFO] Removed {len(removed)} old outputs from {index.root}")
+    return removed
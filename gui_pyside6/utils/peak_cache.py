@@ -0,0 +1,219 @@
+"""Multi-resolution peak files for fast waveform display.
+
+A peak file stores, for each of ``LEVELS`` samples per bin, the minimum,
+maximum and RMS of every bin as float32. It is computed once per audio file
+by streaming the audio in blocks and is then memory-mapped, so opening even
+an hour-long recording only reads the bins that are drawn.
+
+Layout (little endian)::
+
+    magic  b"HTPK"  | version u16 | n_levels u16 | sample_rate u32
+    n_samples u64   | source size u64 | source mtime_ns i64
+    levels u32 * n_levels
+    level data: float32 [bins, 3] (min, max, rms) for each level in order
+
+Peak files live next to the audio as ``<name>.peaks`` or, for audio the app
+does not own, in ``~/.hybrid_tts/peaks``. They are rebuilt when the size or
+modification time of the audio changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+LEVELS = (256, 1024, 4096)
+CACHE_DIR = Path.home() / ".hybrid_tts" / "peaks"
+
+_MAGIC = b"HTPK"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQQq")
+_BLOCK = LEVELS[0] * 4096
+
+
+class LoadCancelled(Exception):
+    """Raised when a peak computation is abandoned through ``cancelled``."""
+
+
+def peak_file(path: str | Path, *, sidecar: bool = True) -> Path:
+    path = Path(path)
+    if sidecar:
+        return path.with_name(path.name + ".peaks")
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.peaks"
+
+
+class PeakPyramid:
+    """Memory-mapped min/max/RMS bins of one audio file."""
+
+    def __init__(self, sample_rate: int, n_samples: int, levels: dict[int, np.ndarray]):
+        self.sample_rate = sample_rate
+        self.n_samples = n_samples
+        self.levels = levels
+
+    @property
+    def duration(self) -> float:
+        return self.n_samples / self.sample_rate if self.sample_rate else 0.0
+
+    def columns(self, start: int, end: int, width: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(mins, maxs, rms)`` for samples ``start:end`` in ``width`` columns.
+
+        The coarsest level that still gives at least one bin per column is
+        used. When zoomed in past the finest level fewer than ``width``
+        columns are returned.
+        """
+        start = max(0, int(start))
+        end = min(self.n_samples, int(end))
+        span = max(0, end - start)
+        per_column = span / max(1, width)
+        level = LEVELS[0]
+        for candidate in LEVELS:
+            if candidate <= per_column:
+                level = candidate
+        bins = self.levels[level]
+        first = start // level
+        last = max(first + 1, -(-end // level))
+        view = np.asarray(bins[first:last])
+        count = view.shape[0]
+        columns = min(width, count)
+        if columns <= 0:
+            empty = np.empty(0, dtype=np.float32)
+            return empty, empty, empty
+        edges = np.linspace(0, count, columns + 1).astype(np.int64)[:-1]
+        mins = np.minimum.reduceat(view[:, 0], edges)
+        maxs = np.maximum.reduceat(view[:, 1], edges)
+        counts = np.diff(np.append(edges, count))
+        rms = np.sqrt(np.add.reduceat(np.square(view[:, 2]), edges) / counts)
+        return mins, maxs, rms.astype(np.float32)
+
+
+def _reduce(bins: np.ndarray, factor: int) -> np.ndarray:
+    """Combine every ``factor`` consecutive bins into one."""
+    count = -(-bins.shape[0] // factor)
+    pad = count * factor - bins.shape[0]
+    mins = np.pad(bins[:, 0], (0, pad), mode="edge").reshape(count, factor).min(axis=1)
+    maxs = np.pad(bins[:, 1], (0, pad), mode="edge").reshape(count, factor).max(axis=1)
+    energy = np.pad(np.square(bins[:, 2]), (0, pad)).reshape(count, factor)
+    sizes = np.full(count, factor)
+    sizes[-1] -= pad
+    rms = np.sqrt(energy.sum(axis=1) / sizes)
+    return np.stack([mins, maxs, rms], axis=1).astype(np.float32)
+
+
+def _block_bins(block: np.ndarray, level: int) -> np.ndarray:
+    if block.ndim > 1:
+        block = block.mean(axis=1, dtype=np.float32)
+    count = -(-block.size // level)
+    pad = count * level - block.size
+    padded = np.pad(block, (0, pad), mode="edge").reshape(count, level)
+    energy = np.square(np.pad(block, (0, pad))).reshape(count, level).sum(axis=1)
+    sizes = np.full(count, level)
+    sizes[-1] -= pad
+    return np.stack(
+        [padded.min(axis=1), padded.max(axis=1), np.sqrt(energy / sizes)], axis=1
+    ).astype(np.float32)
+
+
+def compute_levels(
+    audio_path: str | Path, cancelled: Callable[[], bool] | None = None
+) -> tuple[int, int, dict[int, np.ndarray]]:
+    """Stream ``audio_path`` and return ``(sample_rate, n_samples, levels)``.
+
+    ``cancelled`` is polled between blocks; when it returns True the
+    computation stops with ``LoadCancelled``.
+    """
+    import soundfile as sf
+
+    finest: list[np.ndarray] = []
+    n_samples = 0
+    with sf.SoundFile(str(audio_path)) as f:
+        sample_rate = f.samplerate
+        for block in f.blocks(blocksize=_BLOCK, dtype="float32", always_2d=True):
+            if cancelled is not None and cancelled():
+                raise LoadCancelled(str(audio_path))
+            finest.append(_block_bins(block, LEVELS[0]))
+            n_samples += block.shape[0]
+    base = np.concatenate(finest) if finest else np.zeros((0, 3), dtype=np.float32)
+    levels = {LEVELS[0]: base}
+    for prev, level in zip(LEVELS, LEVELS[1:]):
+        levels[level] = _reduce(levels[prev], level // prev) if base.size else base
+    return sample_rate, n_samples, levels
+
+
+def write_peaks(
+    target: Path, source: Path, sample_rate: int, n_samples: int, levels: dict[int, np.ndarray]
+) -> None:
+    st = source.stat()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(
+            _HEADER.pack(_MAGIC, _VERSION, len(LEVELS), sample_rate, n_samples, st.st_size, st.st_mtime_ns)
+        )
+        f.write(struct.pack(f"<{len(LEVELS)}I", *LEVELS))
+        for level in LEVELS:
+            f.write(np.ascontiguousarray(levels[level], dtype="<f4").tobytes())
+    os.replace(tmp, target)
+
+
+def read_peaks(target: Path, source: Path) -> PeakPyramid | None:
+    """Memory-map ``target`` if it is a valid peak file for ``source``."""
+    try:
+        st = source.stat()
+        with target.open("rb") as f:
+            header = f.read(_HEADER.size)
+            magic, version, n_levels, sample_rate, n_samples, size, mtime = _HEADER.unpack(header)
+            if (magic, version, size, mtime) != (_MAGIC, _VERSION, st.st_size, st.st_mtime_ns):
+                return None
+            stored = struct.unpack(f"<{n_levels}I", f.read(4 * n_levels))
+    except (OSError, struct.error):
+        return None
+    if tuple(stored) != LEVELS:
+        return None
+    offset = _HEADER.size + 4 * n_levels
+    counts = [-(-n_samples // level) for level in LEVELS]
+    if target.stat().st_size != offset + sum(counts) * 3 * 4:
+        return None
+    levels = {}
+    for level, bins in zip(LEVELS, counts):
+        if bins:
+            levels[level] = np.memmap(target, dtype="<f4", mode="r", offset=offset, shape=(bins, 3))
+        else:
+            levels[level] = np.zeros((0, 3), dtype=np.float32)
+        offset += bins * 3 * 4
+    return PeakPyramid(sample_rate, n_samples, levels)
+
+
+def get_peaks(
+    audio_path: str | Path,
+    *,
+    sidecar: bool = True,
+    cancelled: Callable[[], bool] | None = None,
+) -> PeakPyramid:
+    """Return the peak pyramid of ``audio_path``, computing it if needed.
+
+    With ``sidecar`` the peak file is written next to the audio, falling back
+    to ``CACHE_DIR`` when that directory is not writable.
+    """
+    source = Path(audio_path)
+    targets = [peak_file(source, sidecar=True)] if sidecar else []
+    targets.append(peak_file(source, sidecar=False))
+    for target in targets:
+        pyramid = read_peaks(target, source)
+        if pyramid is not None:
+            return pyramid
+    sample_rate, n_samples, levels = compute_levels(source, cancelled)
+    for target in targets:
+        try:
+            write_peaks(target, source, sample_rate, n_samples, levels)
+        except OSError as e:
+            print(f"[WARN] Could not save peak file {target}: {e}")
+            continue
+        pyramid = read_peaks(target, source)
+        if pyramid is not None:
+            return pyramid
+    return PeakPyramid(sample_rate, n_samples, levels)
@@ -0,0 +1,95 @@
+"""Statistics of the input text: size, chunking and time estimates.
+
+``compute_stats`` walks the whole text, so the GUI runs it on a worker
+thread once typing pauses rather than on every keystroke.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from statistics import median
+
+# Average speaking rate used to estimate audio length, about 150 words per
+# minute of English.
+CHARS_PER_SECOND = 14.0
+
+_SENTENCE_END = re.compile(r"[.!?]+(?=\s|$)")
+
+
+@dataclass
+class TextStats:
+    characters: int
+    words: int
+    sentences: int
+    chunks: int
+    audio_seconds: float
+    # Estimated processing time, from the backend's recent real-time factor.
+    synthesis_seconds: float | None = None
+
+    def describe(self) -> str:
+        """One line for the label under the editor."""
+        if not self.words:
+            return ""
+        parts = [
+            f"{self.characters:,} characters",
+            f"{self.words:,} words",
+            f"{self.sentences:,} sentences",
+        ]
+        if self.chunks > 1:
+            parts.append(f"{self.chunks:,} chunks")
+        parts.append(f"~{format_duration(self.audio_seconds)} audio")
+        if self.synthesis_seconds is not None:
+            parts.append(f"~{format_duration(self.synthesis_seconds)} to synthesize")
+        return " · ".join(parts)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def backend_rtf(backend: str, store=None, limit: int = 20) -> float | None:
+    """Median real-time factor of the backend's recent jobs.
+
+    Reads the timings stored with the latest ``limit`` history entries of
+    ``store`` (a ``HistoryStore``), or the in-memory records of this session
+    when no store is given.
+    """
+    if store is not None:
+        records = [entry.stages or {} for entry in store.page(limit, None, None, backend)]
+    else:
+        from .timer import recent_records
+
+        records = [r for r in recent_records() if r.get("backend") == backend][-limit:]
+    values = [r["rtf"] for r in records if r.get("rtf")]
+    return median(values) if values else None
+
+
+def compute_stats(text: str, *, long_threshold: int | None = None, rtf: float | None = None) -> TextStats:
+    """Measure ``text``.
+
+    Texts longer than ``long_threshold`` characters are rendered as long
+    documents, so their chunk count is that of ``split_document``.
+    """
+    characters = len(text)
+    stripped = text.strip()
+    sentences = len(_SENTENCE_END.findall(text))
+    if stripped and stripped[-1] not in ".!?":
+        # Trailing text without a final full stop.
+        sentences += 1
+    chunks = 1 if stripped else 0
+    if long_threshold is not None and len(stripped) > long_threshold:
+        from .long_document import split_document
+
+        chunks = len(split_document(stripped))
+    audio_seconds = len(stripped) / CHARS_PER_SECOND
+    return TextStats(
+        characters=characters,
+        words=len(text.split()),
+        sentences=sentences,
+        chunks=chunks,
+        audio_seconds=audio_seconds,
+        synthesis_seconds=audio_seconds * rtf if rtf else None,
+    )
@@ -1,5 +1,18 @@
+from __future__ import annotations
+
+import json
+import logging
 import time
+from collections import deque
 from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger("gui_pyside6.jobs")
+
+# Most recent job records, newest last; see ``recent_records``.
+_RECENT: deque[dict] = deque(maxlen=100)
+
+_CURRENT: ContextVar["StageTimer | None"] = ContextVar("stage_timer", default=None)
 
 
 @contextmanager
@@ -9,3 +22,123 @@ def Timer():
     end_time = time.time()
     elapsed_time = end_time - start_time
     print("Generated in", "{:.3f}".format(elapsed_time), "seconds")
+
+
+class StageTimer:
+    """Wall time spent in the named stages of one job.
+
+    Stages nest: while an inner stage runs the outer one is paused, so the
+    stage times add up to the measured total. A worker can wrap the whole
+    backend call in ``stage("inference")`` and backends only mark the parts
+    that are not inference (``model_load``, ``preprocess``, ``write``).
+
+    Backends reach the timer of the job they run for through the module
+    level ``stage`` and ``note`` helpers, which do nothing outside of
+    ``activate``.
+    """
+
+    def __init__(self, **info):
+        self.stages: dict[str, float] = {}
+        self.info: dict = dict(info)
+        self._stack: list[list] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.add(parent[0], now - parent[1])
+        self._stack.append([name, now])
+        try:
+            yield self
+        finally:
+            now = time.perf_counter()
+            _, start = self._stack.pop()
+            self.add(name, now - start)
+            if self._stack:
+                self._stack[-1][1] = now
+
+    @contextmanager
+    def activate(self):
+        """Make this the timer used by ``stage`` and ``note`` in this context."""
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def note(self, **info) -> None:
+        self.info.update(info)
+
+    @property
+    def total(self) -> float:
+        return sum(self.stages.values())
+
+    def rtf(self) -> float | None:
+        """Real-time factor: processing time per second of produced audio."""
+        duration = self.info.get("audio_duration")
+        return self.total / duration if duration else None
+
+    def record(self) -> dict:
+        """Return the timings as a JSON-serialisable dict."""
+        rtf = self.rtf()
+        return {
+            **self.info,
+            "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            "total": round(self.total, 4),
+            "rtf": round(rtf, 4) if rtf is not None else None,
+        }
+
+    def summary(self) -> str:
+        """Short human-readable breakdown, e.g. for the status bar."""
+        return summarize(self.record())
+
+    def log(self) -> dict:
+        """Write the record to the ``gui_pyside6.jobs`` log and keep it in memory."""
+        record = self.record()
+        _RECENT.append(record)
+        logger.info("job timing %s", json.dumps(record, default=str))
+        return record
+
+
+def summarize(record: dict) -> str:
+    """Format a ``StageTimer.record`` as ``"model load (hit) 0.12s · ... · RTF 0.30"``."""
+    parts = []
+    for name, seconds in record.get("stages", {}).items():
+        label = name.replace("_", " ")
+        if name == "model_load" and record.get("model_cache"):
+            label += f" ({record['model_cache']})"
+        parts.append(f"{label} {seconds:.2f}s")
+    if record.get("rtf") is not None:
+        parts.append(f"RTF {record['rtf']:.2f}")
+    return " · ".join(parts)
+
+
+def current() -> StageTimer | None:
+    return _CURRENT.get()
+
+
+@contextmanager
+def stage(name: str):
+    """Time ``name`` on the active ``StageTimer``, if any."""
+    timer = _CURRENT.get()
+    if timer is None:
+        yield None
+    else:
+        with timer.stage(name):
+            yield timer
+
+
+def note(**info) -> None:
+    """Attach ``info`` (e.g. ``model_cache="hit"``) to the active timer."""
+    timer = _CURRENT.get()
+    if timer is not None:
+        timer.note(**info)
+
+
+def recent_records() -> list[dict]:
+    """Return the timing records of recent jobs, oldest first."""
+    return list(_RECENT)
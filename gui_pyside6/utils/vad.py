@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return start and end indices of consecutive ``True`` runs in ``mask``."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    return edges[0::2], edges[1::2]
+
+
+def frame_energy_db(audio: np.ndarray, frame_length: int) -> np.ndarray:
+    """Return the RMS level of each non-overlapping frame in dBFS."""
+    n_frames = len(audio) // frame_length
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float32)
+    frames = np.asarray(audio[: n_frames * frame_length], dtype=np.float32)
+    frames = frames.reshape(n_frames, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def detect_speech_regions(
+    audio: np.ndarray,
+    sample_rate: int,
+    *,
+    frame_ms: float = 30.0,
+    threshold_db: float | None = None,
+    dynamic_range_db: float = 35.0,
+    min_speech_ms: float = 250.0,
+    min_silence_ms: float = 400.0,
+    pad_ms: float = 200.0,
+) -> list[tuple[int, int]]:
+    """Find regions of ``audio`` that likely contain speech.
+
+    Frames whose energy lies above the threshold are marked as speech. Gaps
+    shorter than ``min_silence_ms`` are bridged, runs shorter than
+    ``min_speech_ms`` are dropped and the remaining regions are padded by
+    ``pad_ms`` on both sides.
+
+    Parameters
+    ----------
+    audio:
+        Mono audio samples.
+    sample_rate:
+        Sample rate of ``audio``.
+    frame_ms:
+        Analysis frame length in milliseconds.
+    threshold_db:
+        Absolute speech threshold in dBFS. If ``None`` the threshold is
+        ``dynamic_range_db`` below the loudest frame, but never below -60 dBFS.
+    Returns
+    -------
+    list[tuple[int, int]]
+        ``(start, end)`` sample indices of each speech region.
+    """
+    audio = np.asarray(audio)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    frame_length = max(1, int(sample_rate * frame_ms / 1000))
+    db = frame_energy_db(audio, frame_length)
+    if db.size == 0:
+        return [(0, len(audio))] if len(audio) else []
+
+    if threshold_db is None:
+        threshold_db = max(float(db.max()) - dynamic_range_db, -60.0)
+    speech = db > threshold_db
+
+    # Bridge short pauses between words.
+    starts, ends = _runs(~speech)
+    max_gap = int(np.ceil(min_silence_ms / frame_ms))
+    inner = (starts > 0) & (ends < speech.size) & (ends - starts < max_gap)
+    fill = np.zeros(speech.size + 1, dtype=np.int32)
+    np.add.at(fill, starts[inner], 1)
+    np.add.at(fill, ends[inner], -1)
+    speech |= np.cumsum(fill[:-1]) > 0
+
+    starts, ends = _runs(speech)
+    keep = (ends - starts) * frame_ms >= min_speech_ms
+    starts, ends = starts[keep], ends[keep]
+    if starts.size == 0:
+        return []
+
+    pad = int(sample_rate * pad_ms / 1000)
+    total = len(audio)
+    starts = np.maximum(starts * frame_length - pad, 0)
+    ends = np.minimum(ends * frame_length + pad, total)
+    # The last partial frame is never analysed; extend a trailing region to
+    # cover it rather than dropping the tail of the final word.
+    if ends[-1] >= db.size * frame_length:
+        ends[-1] = total
+
+    regions: list[tuple[int, int]] = []
+    for s, e in zip(starts.tolist(), ends.tolist()):
+        if regions and s <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], e))
+        else:
+            regions.append((s, e))
+    return regions
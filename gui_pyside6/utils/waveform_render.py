@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def to_mono(audio: np.ndarray) -> np.ndarray:
+    """Return ``audio`` as a contiguous mono float32 array."""
+    arr = np.asarray(audio, dtype=np.float32)
+    if arr.ndim > 1:
+        arr = arr.mean(axis=1, dtype=np.float32)
+    return np.ascontiguousarray(arr)
+
+
+def decimate(audio: np.ndarray, columns: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce ``audio`` to per-column minimum, maximum and RMS values.
+
+    The signal is split into ``columns`` nearly equal spans (fewer if the
+    signal is shorter) and each span is reduced with ``np.*.reduceat``, so
+    the cost is a few passes over the samples regardless of ``columns``.
+    The function keeps no state and can be called from any thread.
+
+    Parameters
+    ----------
+    audio:
+        Mono samples.
+    columns:
+        Number of output columns, usually the widget width in pixels.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        ``(mins, maxs, rms)`` float32 arrays of equal length.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    n = audio.size
+    columns = min(int(columns), n)
+    if columns <= 0:
+        empty = np.empty(0, dtype=np.float32)
+        return empty, empty, empty
+    edges = np.linspace(0, n, columns + 1).astype(np.int64)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    mins = np.minimum.reduceat(audio, starts)
+    maxs = np.maximum.reduceat(audio, starts)
+    energy = np.add.reduceat(np.square(audio, dtype=np.float32), starts)
+    rms = np.sqrt(energy / counts).astype(np.float32)
+    return mins, maxs, rms
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6 import backend
+from gui_pyside6.utils import history_store
+
+
+@pytest.fixture(autouse=True)
+def _isolated_history(tmp_path, monkeypatch):
+    """Keep MainWindow instances from writing to the real history database."""
+    monkeypatch.setattr(history_store, 'HISTORY_DB', tmp_path / 'history.sqlite3')
+
+
+@pytest.fixture(autouse=True)
+def _isolated_install_state(tmp_path, monkeypatch):
+    """Keep the install log and installed-state snapshot out of the real home."""
+    log_dir = tmp_path / 'hybrid_tts'
+    monkeypatch.setattr(backend, '_LOG_DIR', log_dir)
+    monkeypatch.setattr(backend, '_INSTALL_LOG', log_dir / 'install.log')
+    monkeypatch.setattr(backend, '_STATE_FINGERPRINT', None)
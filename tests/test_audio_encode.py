@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.audio_encode import FORMATS, _resample_blocks, encode_file, encoding, negotiate, resolve_format
+from gui_pyside6.utils.timer import StageTimer
+
+
+def _speech_like(path, sr=24000, seconds=2.0):
+    t = np.arange(int(sr * seconds)) / sr
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    sf.write(str(path), audio.astype(np.float32), sr)
+    return path
+
+
+def test_encode_flac_is_lossless_and_smaller(tmp_path):
+    wav = _speech_like(tmp_path / 'clip.wav')
+    original, sr = sf.read(str(wav), dtype='int16')
+    size = wav.stat().st_size
+
+    flac = encode_file(wav, 'flac')
+    assert flac == tmp_path / 'clip.flac' and not wav.exists()
+    decoded, flac_sr = sf.read(str(flac), dtype='int16')
+    assert flac_sr == sr and np.array_equal(decoded, original)
+    assert flac.stat().st_size < size
+
+
+def test_encode_opus_resamples_unsupported_rates(tmp_path):
+    wav = _speech_like(tmp_path / 'clip.wav', sr=22050)
+    ogg = encode_file(wav, 'opus', keep_source=True)
+    info = sf.info(str(ogg))
+    assert (info.format, info.subtype, info.samplerate) == ('OGG', 'OPUS', 48000)
+    assert abs(info.duration - 2.0) < 0.05
+    assert ogg.stat().st_size * 5 < wav.stat().st_size
+
+
+def test_blockwise_resampling_matches_whole_signal():
+    audio = np.random.default_rng(0).standard_normal((10007, 2)).astype(np.float32)
+    whole = np.concatenate(list(_resample_blocks([audio], 22050, 48000)))
+    assert whole.shape == (21784, 2)
+    for size in (333, 4096):
+        blocks = [audio[i:i + size] for i in range(0, len(audio), size)]
+        assert np.allclose(np.concatenate(list(_resample_blocks(blocks, 22050, 48000))), whole, atol=1e-6)
+
+
+def test_negotiate_accept_header():
+    assert negotiate('audio/ogg;q=0.5, audio/flac') == FORMATS['flac']
+    assert negotiate('application/json, audio/mpeg;q=0.2') == FORMATS['mp3']
+    assert negotiate('audio/x-wav') == FORMATS['wav']
+    assert negotiate('*/*') is None and negotiate(None) is None
+    assert resolve_format('.OGG') == resolve_format('audio/opus') == FORMATS['ogg']
+
+
+def test_encoding_wrapper_records_stage(tmp_path):
+    synth = encoding(lambda text, output: _speech_like(output), 'flac')
+    stages = StageTimer()
+    with stages.activate():
+        result = synth('hi', tmp_path / 'out.wav')
+    assert result == tmp_path / 'out.flac' and result.exists()
+    assert 'encode' in stages.stages
+
+
+def test_api_synthesize_negotiates_format(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from gui_pyside6.backend import api_server
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(api_server.BACKENDS, 'fake', lambda text, output, **kw: _speech_like(output))
+    client = TestClient(api_server.app)
+
+    resp = client.post('/synthesize', json={'text': 'hi', 'backend': 'fake'}, headers={'Accept': 'audio/flac'})
+    assert resp.status_code == 200 and resp.headers['content-type'] == 'audio/flac'
+    assert resp.content[:4] == b'fLaC'
+    assert json.loads(resp.headers['x-timings'])['stages']['encode'] >= 0
+
+    resp = client.post('/synthesize', json={'text': 'hi', 'backend': 'fake', 'format': 'ogg'})
+    assert resp.json()['format'] == 'ogg' and resp.json()['output'].endswith('.ogg')
+
+    resp = client.post('/synthesize', json={'text': 'hi', 'backend': 'fake', 'format': 'aiff'})
+    assert resp.status_code == 400
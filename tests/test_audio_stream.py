@@ -0,0 +1,136 @@
+import os
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.audio_stream import AudioStream, RingBuffer, StreamPlayer, split_sentences
+
+
+def test_ring_buffer_wraps_and_grows():
+    buf = RingBuffer(8)
+    buf.write(np.arange(6))
+    assert buf.read(4).tolist() == [0, 1, 2, 3]
+    buf.write(np.arange(6, 12))  # wraps around the end
+    buf.write(np.arange(12, 20))  # grows past the capacity
+    assert len(buf) == 16
+    assert buf.read(100).tolist() == list(range(4, 20))
+    assert not buf.drained
+    buf.close()
+    assert buf.drained
+    with pytest.raises(ValueError):
+        buf.write([1.0])
+
+
+def test_concurrent_writer_keeps_order():
+    buf = RingBuffer(16)
+    chunks = [np.full(7, i, dtype=np.float32) for i in range(200)]
+
+    def produce():
+        for chunk in chunks:
+            buf.write(chunk)
+        buf.close()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    out = []
+    while not buf.drained:
+        out.append(buf.read(5))
+    thread.join()
+    assert np.array_equal(np.concatenate(out), np.concatenate(chunks))
+
+
+def test_split_sentences():
+    text = 'First one. Second one!  Third?\n\nFourth ' + 'word ' * 80
+    pieces = split_sentences(text, max_chars=100)
+    assert pieces[:3] == ['First one.', 'Second one!', 'Third?']
+    assert all(len(p) <= 100 for p in pieces)
+    assert ' '.join(pieces[3:]) == ' '.join(('Fourth ' + 'word ' * 80).split())
+
+
+class FakeDevice:
+    def __init__(self):
+        self.data = b''
+
+    def write(self, data):
+        self.data += data
+
+
+class FakeSink:
+    def __init__(self, size):
+        self.size = size
+        self.device = FakeDevice()
+
+    def bytesFree(self):
+        # The fake device plays instantly.
+        return self.size
+
+    def bufferSize(self):
+        return self.size
+
+    def stop(self):
+        pass
+
+
+def test_player_starts_on_first_chunk_and_drains():
+    stream = AudioStream()
+    shown, finished = [], []
+    player = StreamPlayer(stream, on_chunks=shown.append, on_finished=lambda: finished.append(True))
+    sink = FakeSink(size=8)
+
+    def open_sink():
+        player._sink = sink
+        player._device = sink.device
+        player.started = True
+
+    player._open_sink = open_sink
+
+    player._tick()
+    assert not player.started
+
+    stream.push(np.full((6, 2), 0.5), 16000)
+    player._tick()
+    assert player.started
+    assert len(shown) == 1 and shown[0][0].shape == (6,)
+    assert np.frombuffer(sink.device.data, dtype='<i2').tolist() == [16383] * 4
+
+    stream.push(np.zeros(2), 16000)
+    stream.finish()
+    player._tick()
+    player._tick()
+    assert len(np.frombuffer(sink.device.data, dtype='<i2')) == 8
+    assert finished == [True]
+    with pytest.raises(ValueError):
+        stream.push(np.zeros(2), 22050)
+
+
+def test_player_finishes_when_sink_fails():
+    stream = AudioStream()
+    finished = []
+    player = StreamPlayer(stream, on_finished=lambda: finished.append(True))
+
+    def open_sink():
+        raise RuntimeError('no audio device')
+
+    player._open_sink = open_sink
+    stream.push(np.zeros(4), 16000)
+    player._tick()
+    assert player.finished and finished == [True]
+    player._tick()
+    assert finished == [True]
+
+
+def test_player_volume_applies_to_live_sink():
+    stream = AudioStream()
+    player = StreamPlayer(stream, volume=0.5)
+    player.set_volume(0.2)
+    assert player.volume == 0.2
+
+    volumes = []
+    player._sink = types.SimpleNamespace(setVolume=volumes.append)
+    player.set_volume(0.8)
+    assert volumes == [0.8]
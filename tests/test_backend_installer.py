@@ -41,3 +41,52 @@ def test_pip_used_when_uv_missing():
     install_cmd = [c[1] for c in calls if c[0] == 'call'][0]
     assert install_cmd[:4] == [sys.executable, '-m', 'pip', 'install']
     assert '--no-deps' not in install_cmd
+
+
+def test_ensurepip_skipped_when_pip_present():
+    calls, run_fn, call_fn = _capture_calls()
+    with mock.patch('gui_pyside6.backend._uv_available', return_value=False), \
+         mock.patch('gui_pyside6.backend.install_utils._is_venv_active', return_value=True), \
+         mock.patch('gui_pyside6.backend._pip_available', return_value=True), \
+         mock.patch('subprocess.run', side_effect=run_fn), \
+         mock.patch('subprocess.check_call', side_effect=call_fn):
+        _install_backend_packages(['foo'])
+
+    assert [c for c in calls if c[0] == 'run'] == []
+
+
+def test_batch_install_resolves_union_once(tmp_path):
+    from gui_pyside6 import backend
+
+    missing = {
+        'a': ['foo==1', 'shared'],
+        'b': ['shared', 'bar'],
+        'bark': ['bark-pkg', 'shared'],
+    }
+    with mock.patch('gui_pyside6.backend.missing_backend_packages', side_effect=missing.get), \
+         mock.patch('gui_pyside6.backend._install_backend_packages') as install, \
+         mock.patch('gui_pyside6.backend._log_action'), \
+         mock.patch('gui_pyside6.backend._state_file', return_value=tmp_path / 'state.json'), \
+         mock.patch.object(backend, '_INSTALLED_STATE', {}):
+        installed = backend.ensure_backends_installed(['a', 'b', 'bark'])
+
+    assert installed == ['a', 'b', 'bark']
+    assert install.call_count == 2
+    first, second = install.call_args_list
+    assert first.args[0] == ['foo==1', 'shared', 'bar']
+    assert first.kwargs['no_deps'] is False
+    assert second.args[0] == ['bark-pkg']
+    assert second.kwargs['no_deps'] is True
+
+
+def test_install_output_streamed():
+    lines = []
+    with mock.patch('subprocess.check_call') as call:
+        from gui_pyside6 import backend
+        backend._run_install_command(
+            [sys.executable, '-c', 'print("Collecting foo"); print("Installed foo")'],
+            lines.append,
+        )
+        call.assert_not_called()
+
+    assert lines == ['Collecting foo', 'Installed foo']
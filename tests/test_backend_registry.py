@@ -0,0 +1,77 @@
+import os
+import sys
+import json
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.backend import registry as registry_mod
+from gui_pyside6.backend.registry import BackendRegistry, MetadataView
+
+
+def _make_registry(tmp_path, reqs=None):
+    req_file = tmp_path / "req.json"
+    req_file.write_text(json.dumps(reqs or {"a": ["foo==1", "bar @ git+https://x"]}))
+    meta_dir = tmp_path / "metadata"
+    meta_dir.mkdir()
+    (meta_dir / "a.toml").write_text('description = "Backend A"\nrepo_url = "https://a"\n')
+    return BackendRegistry(
+        req_file,
+        meta_dir,
+        backends={},
+        transcribers={},
+        features={},
+        categories={"tts": [], "tool": [], "experimental": []},
+    )
+
+
+def test_files_parsed_once(tmp_path):
+    reg = _make_registry(tmp_path)
+    with mock.patch.object(reg, "_load", wraps=reg._load) as load:
+        assert reg.requirements("a") == ["foo==1", "bar @ git+https://x"]
+        assert reg.distributions("a") == ["foo", "bar"]
+        assert reg.metadata("a")["repo_url"] == "https://a"
+    assert load.call_count == 1
+
+
+def test_reload_when_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_mod, "_CHECK_INTERVAL", 0.0)
+    reg = _make_registry(tmp_path)
+    assert reg.requirements("b") == []
+    reg.requirements_file.write_text(json.dumps({"a": ["foo==1"], "b": ["baz>=2"]}))
+    assert reg.distributions("b") == ["baz"]
+
+
+def test_metadata_view(tmp_path):
+    reg = _make_registry(tmp_path)
+    info = MetadataView(reg, "description")
+    assert info.get("a") == "Backend A"
+    assert info.get("missing", "") == ""
+    assert list(info) == ["a"]
+
+
+def test_plugin_discovery_registers_backend(tmp_path):
+    reg = _make_registry(tmp_path)
+
+    def hook(r):
+        r.register(
+            "plugin_tts",
+            lambda text, output, **kw: output,
+            features={"voice"},
+            requirements=["plugin-pkg==1.0"],
+            metadata={"description": "Plugin"},
+        )
+
+    ep = mock.Mock()
+    ep.name = "plugin"
+    ep.load.return_value = hook
+    with mock.patch("importlib.metadata.entry_points", return_value=[ep]):
+        assert reg.discover_plugins() == ["plugin"]
+        assert reg.discover_plugins() == []
+
+    assert "plugin_tts" in reg.backends
+    assert reg.categories["tts"] == ["plugin_tts"]
+    assert reg.backend_features("plugin_tts") == {"voice"}
+    assert reg.distributions("plugin_tts") == ["plugin-pkg"]
+    assert reg.metadata("plugin_tts")["description"] == "Plugin"
+    assert reg.category("plugin_tts") == "tts"
@@ -0,0 +1,142 @@
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils import batch_render
+from gui_pyside6.utils.batch_render import BatchItem, item_kwargs, load_items, output_name, render_batch
+
+
+def test_load_items_from_each_format(tmp_path):
+    txt = tmp_path / 'lines.txt'
+    txt.write_text('Hello there\n\n  Second line  \n', encoding='utf-8')
+    assert [i.text for i in load_items(txt)] == ['Hello there', 'Second line']
+
+    csv_file = tmp_path / 'lines.csv'
+    csv_file.write_text('text,voice,rate,filename\nHi,af_bella,250,greeting\n,x,,\nBye,,,\n', encoding='utf-8')
+    items = load_items(csv_file)
+    assert items == [
+        BatchItem(0, 'Hi', voice='af_bella', rate=250, filename='greeting'),
+        BatchItem(1, 'Bye'),
+    ]
+
+    headerless = tmp_path / 'plain.csv'
+    headerless.write_text('One\nTwo\n', encoding='utf-8')
+    assert [i.text for i in load_items(headerless)] == ['One', 'Two']
+
+    jsonl = tmp_path / 'lines.jsonl'
+    jsonl.write_text('{"text": "A", "lang": "fr"}\n"B"\n', encoding='utf-8')
+    assert load_items(jsonl) == [BatchItem(0, 'A', lang='fr'), BatchItem(1, 'B')]
+
+
+def test_item_kwargs_and_names():
+    item = BatchItem(4, 'Hello, world!', voice='v', lang='de', rate=220, filename='../evil')
+    assert item_kwargs('edge_tts', item, {'voice': 'default'}) == {'voice': 'v', 'rate': '+20%'}
+    assert item_kwargs('gtts', item) == {'lang': 'de'}
+    assert output_name(item) == 'evil.wav'
+    assert output_name(BatchItem(4, 'Hello, world!')) == '0005_hello_world.wav'
+
+
+def test_render_batch_runs_in_parallel_and_writes_manifest(tmp_path):
+    source = tmp_path / 'lines.jsonl'
+    source.write_text(
+        '\n'.join(json.dumps({'text': f'line {i}', 'voice': 'bad' if i == 3 else None}) for i in range(6)),
+        encoding='utf-8',
+    )
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_backend(text, output, voice=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if voice == 'bad':
+            raise RuntimeError('unknown voice')
+        output.write_text(text)
+        return output
+
+    progress = []
+    manifest = render_batch(
+        source,
+        tmp_path / 'out' / 'manifest.jsonl',
+        backend='kokoro',
+        workers=3,
+        func=fake_backend,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    rows = sorted(batch_render.read_manifest(manifest), key=lambda r: r['index'])
+    assert peak[0] > 1
+    assert progress[-1] == (6, 6)
+    assert [r['index'] for r in rows] == list(range(6))
+    assert rows[3]['error'] == 'unknown voice'
+    assert (tmp_path / 'out' / '0001_line_0.wav').read_text() == 'line 0'
+    assert 'inference' in rows[0]['timings']['stages']
+    assert rows[0]['elapsed'] >= 0.02
+
+
+def test_cancelled_batch_skips_remaining_lines(tmp_path, capsys):
+    source = tmp_path / 'lines.txt'
+    source.write_text('a\nb\nc\n', encoding='utf-8')
+    calls = []
+
+    def fake_backend(text, output, **kw):
+        calls.append(text)
+        output.write_text(text)
+
+    manifest = render_batch(
+        source, tmp_path / 'm.jsonl', backend='pyttsx3', workers=1,
+        func=fake_backend, cancelled=lambda: len(calls) >= 1,
+    )
+    assert calls == ['a']
+    assert len(batch_render.read_manifest(manifest)) == 1
+    assert '1 of 3 lines rendered' in capsys.readouterr().out
+
+
+def test_batch_encodes_clips(tmp_path):
+    import numpy as np
+    import soundfile as sf
+
+    source = tmp_path / 'lines.txt'
+    source.write_text('one\ntwo\n', encoding='utf-8')
+
+    def fake_backend(text, output, **kw):
+        sf.write(str(output), np.zeros(1600, dtype=np.float32), 16000)
+        return output
+
+    manifest = render_batch(
+        source, tmp_path / 'm.jsonl', backend='mms', func=fake_backend, output_format='flac',
+    )
+    rows = batch_render.read_manifest(manifest)
+    assert all(r['output'].endswith('.flac') and r['duration'] == 0.1 for r in rows)
+    assert 'encode' in rows[0]['timings']['stages']
+    assert not list(tmp_path.glob('*.wav'))
+
+
+def test_invalid_rows_recorded_and_unsafe_backends_serialised(tmp_path, capsys):
+    source = tmp_path / 'lines.csv'
+    source.write_text('text,rate\none,1.5\ntwo,fast\nthree,180\nfour,\n', encoding='utf-8')
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_backend(text, output, **kw):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        output.write_text(text)
+
+    manifest = render_batch(source, tmp_path / 'm.jsonl', backend='pyttsx3', workers=4, func=fake_backend)
+    rows = sorted(batch_render.read_manifest(manifest), key=lambda r: r['index'])
+    assert peak[0] == 1
+    assert [r['index'] for r in rows] == [0, 1, 2, 3]
+    assert [r.get('error', '') for r in rows[:2]] == ["Invalid rate: '1.5'", "Invalid rate: 'fast'"]
+    assert rows[2]['rate'] == 180 and 'error' not in rows[3]
+    assert '2 of 4 lines rendered' in capsys.readouterr().out
@@ -0,0 +1,65 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.backend import available_transcribers
+from gui_pyside6.backend import faster_whisper_backend as fwb
+
+
+def _install_stub(monkeypatch):
+    created = []
+
+    class Segment:
+        def __init__(self, text):
+            self.text = text
+
+    class WhisperModel:
+        def __init__(self, name, device=None, compute_type=None):
+            created.append((name, device, compute_type))
+
+        def transcribe(self, audio, **kwargs):
+            return iter([Segment(" hello"), Segment(" world ")]), None
+
+    class BatchedInferencePipeline:
+        def __init__(self, model):
+            self.model = model
+
+        def transcribe(self, audio, **kwargs):
+            if not kwargs.get("vad_filter"):
+                # faster-whisper 1.1 for clips of 30 s or more.
+                raise RuntimeError("No clip timestamps found.")
+            created.append(("batched", kwargs["batch_size"]))
+            return self.model.transcribe(audio)
+
+    mod = types.ModuleType("faster_whisper")
+    mod.WhisperModel = WhisperModel
+    mod.BatchedInferencePipeline = BatchedInferencePipeline
+    monkeypatch.setitem(sys.modules, "faster_whisper", mod)
+    monkeypatch.setattr(fwb, "_MODELS", {})
+    return created
+
+
+def test_faster_whisper_registered():
+    assert "faster_whisper" in available_transcribers()
+
+
+def test_int8_on_cpu_and_model_cached(monkeypatch, tmp_path):
+    created = _install_stub(monkeypatch)
+
+    audio = tmp_path / "a.wav"
+    text = fwb.transcribe_to_text(audio, model_name="openai/whisper-small", device="cpu")
+    fwb.transcribe_to_text(audio, model_name="small", device="cpu")
+
+    assert text == "hello world"
+    assert created == [("small", "cpu", "int8")]
+
+
+def test_batched_pipeline_only_with_vad(monkeypatch, tmp_path):
+    created = _install_stub(monkeypatch)
+
+    audio = tmp_path / "a.wav"
+    assert fwb.transcribe_to_text(audio, device="cpu") == "hello world"
+    assert fwb.transcribe_to_text(audio, device="cpu", vad=True, batch_size=4) == "hello world"
+    assert created == [("small", "cpu", "int8"), ("batched", 4)]
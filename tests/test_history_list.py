@@ -184,8 +184,8 @@ def test_history_list_populated(tmp_path):
     window.on_synthesize_finished(out_path, None, 0.0)
 
     assert window.last_output == out_path
-    assert window.history_list.items[0] == str(out_path)
-    assert len(window.history_list.items) == 1
+    assert window.history_model.entry(0).output == str(out_path)
+    assert window.history_model.rowCount() == 1
     for m in list(sys.modules):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
@@ -211,7 +211,8 @@ def test_transcription_results_displayed(tmp_path):
     assert window.last_output is None
     assert window.transcript_view.toPlainText() == "hello world"
     assert window.transcript_view.isVisible()
-    assert window.history_list.items[0].startswith("Transcribed:")
+    assert window.history_model.entry(0).label.startswith("Transcribed:")
+    assert window.history_model.entry(0).text == "hello world"
     for m in list(sys.modules):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
@@ -248,8 +249,8 @@ def test_list_of_paths_handled(tmp_path):
     assert calls == [p2, p1, p1]
 
     assert window.last_output == p1
-    assert window.history_list.items[0] == str(p1)
-    assert window.history_list.items[1] == str(p2)
+    assert window.history_model.entry(0).output == str(p1)
+    assert window.history_model.entry(1).output == str(p2)
     for m in list(sys.modules):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
@@ -277,8 +278,8 @@ def test_vocos_history_single_entry(tmp_path):
     window.on_synthesize_finished(vocos_out, None, 0.0)
 
     assert window.last_output == vocos_out
-    assert window.history_list.items[0] == str(vocos_out)
-    assert len(window.history_list.items) == 1
+    assert window.history_model.entry(0).output == str(vocos_out)
+    assert window.history_model.rowCount() == 1
     for m in list(sys.modules):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
@@ -324,7 +325,7 @@ def test_whisper_does_not_leave_busy(tmp_path):
 
     window.on_synthesize()
 
-    assert not window._synth_busy
+    assert window.job_queue.running == 0
     for m in list(sys.modules):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
@@ -362,3 +363,235 @@ def test_button_visibility_updates_by_backend(tmp_path):
             sys.modules.pop(m)
     sys.modules.update(saved)
 
+
+
+def test_queue_panel_refresh_keeps_selection(tmp_path, monkeypatch):
+    saved = _setup_pyside6_stubs()
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+
+    class Item:
+        def __init__(self, text):
+            self._text, self._data, self.selected = text, None, False
+        def setData(self, role, value):
+            self._data = value
+        def data(self, role):
+            return self._data
+        def text(self):
+            return self._text
+        def setText(self, text):
+            self._text = text
+
+    class QueueList:
+        def __init__(self):
+            self.items = []
+        def count(self):
+            return len(self.items)
+        def item(self, row):
+            return self.items[row]
+        def takeItem(self, row):
+            return self.items.pop(row)
+        def addItem(self, item):
+            self.items.append(item)
+        def selectedItems(self):
+            return [i for i in self.items if i.selected]
+
+    class Job:
+        def __init__(self, job_id, state):
+            self.id, self.state = job_id, state
+        def describe(self):
+            return f'#{self.id} {self.state}'
+
+    monkeypatch.setattr(main_window.QtWidgets, 'QListWidgetItem', Item)
+    jobs = [Job(1, 'running'), Job(2, 'queued')]
+    panel = types.SimpleNamespace(
+        queue_list=QueueList(),
+        job_queue=types.SimpleNamespace(jobs=jobs, running=1),
+        _queue_tick_pending=True,
+    )
+    refresh = main_window.MainWindow.refresh_queue_panel
+    refresh(panel)
+    first, second = panel.queue_list.items
+    second.selected = True
+
+    jobs[0].state = 'done'
+    jobs.append(Job(3, 'queued'))
+    refresh(panel)
+    assert panel.queue_list.items[:2] == [first, second]
+    assert [i.text() for i in panel.queue_list.items] == ['#1 done', '#2 queued', '#3 queued']
+    assert [i.data(0) for i in panel.queue_list.selectedItems()] == [2]
+
+    del jobs[0]
+    refresh(panel)
+    assert panel.queue_list.items[0] is second and second.selected
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
+
+
+def test_streams_play_in_turn_and_stop(tmp_path):
+    saved = _setup_pyside6_stubs()
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+    MainWindow = main_window.MainWindow
+
+    class Player:
+        def __init__(self, stream):
+            self.stream, self.finished, self.stopped = stream, False, False
+        def stop(self):
+            self.stopped = True
+
+    window = types.SimpleNamespace(
+        _streams={1: 's1', 2: 's2'}, _stream_waiting=[], _stream_player=None,
+        _stopped_streams=set(), player=types.SimpleNamespace(stop=lambda: None),
+    )
+    window._play_stream = lambda stream: setattr(window, '_stream_player', Player(stream))
+    for name in ('_queue_stream', '_play_next_stream', 'on_stop_playback'):
+        setattr(window, name, types.MethodType(getattr(MainWindow, name), window))
+
+    window._queue_stream(1)
+    first = window._stream_player
+    window._queue_stream(2)
+    assert window._stream_player is first and window._stream_waiting == [2]
+
+    window._play_next_stream()  # the first stream's on_finished
+    assert window._stream_player.stream == 's2'
+
+    window._streams[3] = 's3'
+    window._queue_stream(3)
+    window.on_stop_playback()
+    assert window._stream_player is None and window._stopped_streams == {'s2', 's3'}
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
+
+
+def test_retention_keeps_batch_outputs_and_forgets_removed(tmp_path):
+    import json
+
+    saved = _setup_pyside6_stubs()
+    prefs.PREF_FILE = tmp_path / 'prefs.json'
+    out_dir = tmp_path / 'outputs'
+    prefs.save_preferences({'output_dir': str(out_dir)})
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+    window = main_window.MainWindow()
+
+    old, played = out_dir / 'old' / 'old.wav', out_dir / 'played' / 'played.wav'
+    for path in (old, played):
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b'\0' * 10)
+        window.history_model.add('gtts', text=path.stem, output=path)
+    main_window.open_index(out_dir).add([old, played])
+    window.last_output = played
+
+    batch = out_dir / 'batch'
+    batch.mkdir()
+    rows = [{'index': i, 'text': f'line {i}', 'output': str(batch / f'{i}.wav')} for i in range(2)]
+    for row in rows:
+        Path(row['output']).write_bytes(b'\0' * 10)
+    manifest = batch / 'manifest.jsonl'
+    manifest.write_text(''.join(json.dumps(row) + '\n' for row in rows))
+
+    # Keep nothing but the outputs in use.
+    window._retention_limits = lambda: {'max_age_days': None, 'max_bytes': 0}
+    job = types.SimpleNamespace(error=None, result=str(manifest), backend='gtts', kwargs={})
+    window._on_batch_finished(job)
+
+    assert not old.exists() and played.exists() and manifest.exists()
+    assert all(Path(row['output']).exists() for row in rows)
+    indexed = {e.path for e in main_window.open_index(out_dir).entries()}
+    assert {Path(row['output']).resolve() for row in rows} | {manifest.resolve()} <= indexed
+    outputs = [window.history_model.entry(i).output for i in range(window.history_model.rowCount())]
+    assert str(old) not in outputs and str(played) in outputs
+    assert window.last_output == Path(rows[-1]['output'])
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
+
+
+def test_waveform_time_recorded_once_peaks_are_shown(tmp_path):
+    saved = _setup_pyside6_stubs()
+    prefs.PREF_FILE = tmp_path / 'prefs.json'
+    prefs.save_preferences({})
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+    from gui_pyside6.utils.timer import StageTimer
+
+    window = main_window.MainWindow()
+    window.autoplay_check = types.SimpleNamespace(isChecked=lambda: False)
+    loads = []
+    window.waveform.set_audio_file = lambda path, on_loaded=None: loads.append(on_loaded)
+
+    out_path = tmp_path / 'out.wav'
+    out_path.write_text('x')
+    stages = StageTimer()
+    stages.add('inference', 1.0)
+    window._job_stages = stages
+    window.on_synthesize_finished(out_path, None, 1.0)
+
+    # The peaks load in the background; the record waits for them.
+    assert window.history_model.rowCount() == 0
+    loads[-1](0.25)
+    entry = window.history_model.entry(0)
+    assert entry.output == str(out_path)
+    assert entry.stages['stages'] == {'inference': 1.0, 'waveform': 0.25}
+    assert window._deferred_record is None and window._waveform_load is None
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
+
+
+def test_lazy_install_starts_post_install(tmp_path):
+    saved = _setup_pyside6_stubs()
+    prefs.PREF_FILE = tmp_path / 'prefs.json'
+    prefs.save_preferences({})
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+
+    window = main_window.MainWindow()
+    started = []
+    window._start_post_install = started.append
+    main_window.is_backend_installed = lambda name: False
+    main_window.ensure_backend_installed = lambda name: name == 'pyttsx3'
+
+    # Nothing to synthesize; the backend is still installed first.
+    window._run_backend('pyttsx3')
+    window._run_backend('gtts')
+    assert started == [['pyttsx3']]
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
+
+
+def test_preferences_keep_default_idle_timeout(tmp_path):
+    saved = _setup_pyside6_stubs()
+    prefs.PREF_FILE = tmp_path / 'prefs.json'
+    prefs.save_preferences({})
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+
+    window = main_window.MainWindow()
+    assert window.memory_governor.idle_timeout == main_window.DEFAULT_IDLE_TIMEOUT
+    window.memory_governor.idle_timeout = 0
+
+    class Dialog:
+        def __init__(self, *a, **k):
+            pass
+        def exec(self):
+            return True
+        def get_preferences(self):
+            return {'autoplay': False}
+
+    main_window.PreferencesDialog = Dialog
+    window.on_preferences()
+    assert window.memory_governor.idle_timeout == main_window.DEFAULT_IDLE_TIMEOUT
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
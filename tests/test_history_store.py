@@ -0,0 +1,104 @@
+import importlib
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.history_store import HistoryStore
+
+
+def _fill(store, n):
+    for i in range(n):
+        backend = 'kokoro' if i % 2 else 'bark'
+        store.add(backend, text=f'line {i} hello' if i % 10 == 0 else f'line {i}',
+                  output=f'/out/{i}.wav', created=1000.0 + i)
+
+
+def test_keyset_paging_and_filters(tmp_path):
+    store = HistoryStore(tmp_path / 'h.sqlite3')
+    _fill(store, 50)
+
+    first = store.page(20)
+    second = store.page(20, after=first[-1])
+    rest = store.page(20, after=second[-1])
+    ids = [e.id for e in first + second + rest]
+    assert len(ids) == 50 and len(set(ids)) == 50
+    assert first[0].output == '/out/49.wav'
+    assert [e.created for e in first + second + rest] == sorted(
+        (e.created for e in first + second + rest), reverse=True)
+
+    assert store.count(backend='kokoro') == 25
+    hits = store.page(100, query='hello')
+    assert [e.output for e in hits] == [f'/out/{i}.wav' for i in (40, 30, 20, 10, 0)]
+    assert store.count(query='hello', backend='bark') == 5
+    assert store.count(query='"quoted') == 0
+
+    store.delete(hits[0].id)
+    assert store.count(query='hello') == 4
+    assert store.forget_outputs(['/out/30.wav', '/out/31.wav', '/out/missing.wav']) == 2
+    assert store.count(query='hello') == 3 and store.count() == 47
+    store.close()
+
+
+def test_stage_timings_round_trip_and_old_schema(tmp_path):
+    import sqlite3
+
+    path = tmp_path / 'old.sqlite3'
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries (id INTEGER PRIMARY KEY, created REAL NOT NULL,"
+        " backend TEXT NOT NULL, voice TEXT, text TEXT NOT NULL DEFAULT '', output TEXT,"
+        " kind TEXT NOT NULL DEFAULT 'audio', duration REAL, elapsed REAL)"
+    )
+    conn.execute("INSERT INTO entries (created, backend, text) VALUES (1.0, 'gtts', 'old')")
+    conn.commit()
+    conn.close()
+
+    store = HistoryStore(path)
+    record = {'stages': {'inference': 1.5}, 'rtf': 0.5}
+    store.add('kokoro', text='new', stages=record)
+    new, old = store.page(10)
+    assert new.stages == record
+    assert old.stages is None and old.text == 'old'
+    store.close()
+
+
+def test_model_fetches_pages_on_demand(tmp_path, monkeypatch):
+    qtcore = types.ModuleType('QtCore')
+    qtcore.Qt = types.SimpleNamespace(UserRole=256)
+    pyside6 = types.ModuleType('PySide6')
+    pyside6.QtCore = qtcore
+    monkeypatch.setitem(sys.modules, 'PySide6', pyside6)
+    monkeypatch.setitem(sys.modules, 'PySide6.QtCore', qtcore)
+    # Import a private copy bound to the stubs; monkeypatch puts back the
+    # module (and package attribute) other tests imported.
+    import gui_pyside6.ui as ui_package
+    name = 'gui_pyside6.ui.history_model'
+    monkeypatch.setitem(sys.modules, name, sys.modules.get(name))
+    monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(ui_package, 'history_model', getattr(ui_package, 'history_model', None), raising=False)
+    HistoryModel = importlib.import_module('gui_pyside6.ui.history_model').HistoryModel
+
+    store = HistoryStore(tmp_path / 'h.sqlite3')
+    _fill(store, 25)
+    monkeypatch.setattr(HistoryModel, 'PAGE_SIZE', 10)
+    try:
+        model = HistoryModel(store)
+        assert model.rowCount() == 10
+        assert model.canFetchMore()
+        model.fetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 25
+        assert not model.canFetchMore()
+
+        model.add('bark', text='new entry', output='/out/new.wav')
+        assert model.entry(0).output == '/out/new.wav'
+
+        model.set_filter('hello')
+        assert [model.entry(i).output for i in range(model.rowCount())] == [
+            '/out/20.wav', '/out/10.wav', '/out/0.wav']
+        model.add('bark', text='unrelated')
+        assert model.rowCount() == 3
+    finally:
+        store.close()
@@ -0,0 +1,96 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.ui.job_queue import CANCELLED, DONE, FAILED, QUEUED, RUNNING, JobQueue
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class FakeWorker:
+    """Worker that only finishes when the test says so."""
+
+    def __init__(self, func, text, output, kwargs):
+        self.text = text
+        self.finished = FakeSignal()
+        self.started = False
+
+    def start(self):
+        self.started = True
+        started.append(self)
+
+
+started = []
+
+
+def _queue(**kw):
+    started.clear()
+    finished = []
+    queue = JobQueue(FakeWorker, on_finished=finished.append, **kw)
+    return queue, finished
+
+
+def test_per_backend_limit_and_pool_size():
+    queue, finished = _queue(pool_size=3, limits={'edge_tts': 2})
+    a1 = queue.submit('kokoro', None, 'a1', None, {})
+    a2 = queue.submit('kokoro', None, 'a2', None, {})
+    b1 = queue.submit('edge_tts', None, 'b1', None, {})
+    b2 = queue.submit('edge_tts', None, 'b2', None, {})
+    b3 = queue.submit('edge_tts', None, 'b3', None, {})
+
+    # kokoro is limited to one job, so a2 waits while the edge jobs fill the pool
+    assert [w.text for w in started] == ['a1', 'b1', 'b2']
+    assert (a1.state, a2.state, b3.state) == (RUNNING, QUEUED, QUEUED)
+
+    started[0].finished.emit('out.wav', None, 1.5)
+    assert a1.state == DONE and a1.result == 'out.wav' and a1.progress == 1.0
+    assert finished == [a1]
+    assert a2.state == RUNNING and b3.state == QUEUED
+
+    started[1].finished.emit(None, RuntimeError('boom'), 0.0)
+    assert b1.state == FAILED
+    assert b3.state == RUNNING
+    assert queue.running == 3 and queue.pending == 0
+
+
+def test_cancel_queued_jobs():
+    queue, finished = _queue(pool_size=1)
+    running = queue.submit('kokoro', None, 'first', None, {})
+    waiting = queue.submit('bark', None, 'second', None, {})
+
+    assert queue.cancel(waiting.id)
+    assert waiting.state == CANCELLED
+
+    started[0].finished.emit('out.wav', None, 0.1)
+    assert len(started) == 1
+    queue.clear_finished()
+    assert queue.jobs == []
+    assert finished == [running]
+
+
+def test_cancel_running_job_sets_event():
+    queue, finished = _queue(pool_size=2)
+    ignores = queue.submit('kokoro', None, 'ignores cancel', None, {})
+    stops = queue.submit('bark', None, 'polls cancel', None, {})
+
+    assert queue.cancel(ignores.id) and queue.cancel(stops.id)
+    assert ignores.cancel_event.is_set() and ignores.state == RUNNING
+
+    # A function that ignores the request still completes normally ...
+    started[0].finished.emit('out.wav', None, 0.1)
+    assert ignores.state == DONE
+    # ... while one that gives up ends as cancelled rather than failed.
+    started[1].finished.emit(None, RuntimeError('cancelled'), 0.1)
+    assert stops.state == CANCELLED
+    assert not queue.cancel(stops.id)
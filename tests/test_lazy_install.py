@@ -3,6 +3,8 @@ import sys
 import json
 from unittest import mock
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Provide a dummy pyttsx3 module so backend import works
@@ -22,19 +24,27 @@ from gui_pyside6.backend import (
     load_persisted_installs,
 )
 import importlib.metadata
+from gui_pyside6 import backend
+
+
+@pytest.fixture(autouse=True)
+def fresh_installed_state(monkeypatch, tmp_path):
+    """Answer installed checks from the patched metadata, not the snapshot."""
+    monkeypatch.setattr(backend, "_INSTALLED_STATE", {})
+    monkeypatch.setattr(backend, "_state_file", lambda: tmp_path / "installed_state.json")
 
 
 def test_install_called_when_missing():
     with mock.patch('importlib.metadata.distribution', side_effect=importlib.metadata.PackageNotFoundError):
         with mock.patch('gui_pyside6.backend._install_backend_packages') as install:
-            ensure_backend_installed('pyttsx3')
+            assert ensure_backend_installed('pyttsx3') is True
             install.assert_called_once()
 
 
 def test_install_skipped_when_present():
     with mock.patch('importlib.metadata.distribution', return_value=object()):
         with mock.patch('gui_pyside6.backend._install_backend_packages') as install:
-            ensure_backend_installed('pyttsx3')
+            assert ensure_backend_installed('pyttsx3') is False
             install.assert_not_called()
 
 
@@ -97,3 +107,34 @@ def test_install_logged_and_persisted(tmp_path):
         assert log_file.exists()
         backend.load_persisted_installs()
         assert backend_was_installed('dummy')
+
+
+def test_snapshot_skips_package_scan_when_environment_unchanged(tmp_path):
+    with mock.patch('importlib.metadata.distribution', return_value=object()):
+        load_persisted_installs()
+    assert (tmp_path / "installed_state.json").exists()
+    assert is_backend_installed('pyttsx3')
+
+    with mock.patch('gui_pyside6.backend.missing_backend_packages') as missing:
+        load_persisted_installs()
+        assert is_backend_installed('pyttsx3')
+        missing.assert_not_called()
+
+
+def test_snapshot_invalidated_by_fingerprint_change(tmp_path):
+    with mock.patch('importlib.metadata.distribution', return_value=object()):
+        load_persisted_installs()
+    with mock.patch('gui_pyside6.backend._environment_fingerprint', return_value='changed'), \
+         mock.patch('importlib.metadata.distribution', side_effect=importlib.metadata.PackageNotFoundError):
+        load_persisted_installs()
+        assert not is_backend_installed('pyttsx3')
+
+
+def test_negative_result_rechecked_after_outside_install():
+    with mock.patch('gui_pyside6.backend._environment_fingerprint', return_value='before'), \
+         mock.patch('importlib.metadata.distribution', side_effect=importlib.metadata.PackageNotFoundError):
+        assert not is_backend_installed('pyttsx3')
+    # pip run outside the app changes the site-packages mtime.
+    with mock.patch('gui_pyside6.backend._environment_fingerprint', return_value='after'), \
+         mock.patch('importlib.metadata.distribution', return_value=object()):
+        assert is_backend_installed('pyttsx3')
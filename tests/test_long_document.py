@@ -0,0 +1,105 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.long_document import (
+    PARAGRAPH_PAUSE,
+    RenderCancelled,
+    render_document,
+    split_document,
+)
+
+SR = 8000
+
+
+def _fake_backend(calls, fail_at=None):
+    def synthesize(text, output, **kwargs):
+        if fail_at is not None and len(calls) == fail_at:
+            raise RuntimeError('backend crashed')
+        calls.append(text)
+        # One sample per character so the output length reveals the chunks.
+        sf.write(str(output), np.full(len(text), 0.1, dtype=np.float32), SR)
+        return output
+
+    return synthesize
+
+
+DOCUMENT = (
+    'First paragraph is short.\n\n'
+    + ' '.join(f'Sentence number {i} of the long paragraph.' for i in range(12))
+    + '\n\nThe end.'
+)
+
+
+def test_split_document_keeps_paragraphs_and_sentence_limit():
+    chunks = split_document(DOCUMENT, max_chars=120)
+    assert chunks[0] == ('First paragraph is short.', True)
+    assert chunks[-1] == ('The end.', True)
+    middle = chunks[1:-1]
+    assert len(middle) > 1
+    assert all(len(text) <= 120 for text, _ in middle)
+    assert [end for _, end in middle] == [False] * (len(middle) - 1) + [True]
+    assert ' '.join(text for text, _ in middle).startswith('Sentence number 0 of')
+
+
+def test_render_document_resumes_after_failure(tmp_path):
+    out = tmp_path / 'book.wav'
+    root = tmp_path / 'checkpoints'
+    chunks = split_document(DOCUMENT, max_chars=120)
+
+    calls = []
+    with pytest.raises(RuntimeError):
+        render_document(
+            DOCUMENT, out, func=_fake_backend(calls, fail_at=3), backend='pyttsx3',
+            max_chars=120, checkpoint_root=root,
+        )
+    assert len(calls) == 3 and not out.exists()
+
+    resumed, progress = [], []
+    result = render_document(
+        DOCUMENT, out, func=_fake_backend(resumed), backend='pyttsx3',
+        max_chars=120, checkpoint_root=root, on_progress=lambda d, t: progress.append((d, t)),
+    )
+    # Only the chunks that were missing are rendered again.
+    assert resumed == [text for text, _ in chunks[3:]]
+    assert progress[-1] == (len(chunks), len(chunks))
+    assert result == out
+    audio, sr = sf.read(str(out))
+    pauses = sum(end for _, end in chunks[:-1])
+    expected = sum(len(text) for text, _ in chunks) + pauses * int(PARAGRAPH_PAUSE * SR)
+    assert sr == SR and len(audio) == expected
+    assert list(root.iterdir()) == []
+
+
+def test_render_document_cancel_keeps_checkpoints(tmp_path):
+    calls = []
+    with pytest.raises(RenderCancelled):
+        render_document(
+            DOCUMENT, tmp_path / 'book.wav', func=_fake_backend(calls), backend='pyttsx3',
+            max_chars=120, checkpoint_root=tmp_path, cancelled=lambda: len(calls) >= 2,
+        )
+    (folder,) = [p for p in tmp_path.iterdir() if p.is_dir()]
+    assert sorted(p.name for p in folder.glob('chunk_*')) == ['chunk_00001.wav', 'chunk_00002.wav']
+
+    # Different settings do not reuse the checkpoint.
+    other = []
+    render_document(
+        DOCUMENT, tmp_path / 'other.wav', func=_fake_backend(other), backend='pyttsx3',
+        max_chars=120, checkpoint_root=tmp_path, rate=150,
+    )
+    assert len(other) == len(split_document(DOCUMENT, 120))
+    assert folder.is_dir()
+
+
+def test_render_document_streams_finished_chunks(tmp_path):
+    received = []
+    render_document(
+        'One.\n\nTwo.', tmp_path / 'short.wav', func=_fake_backend([]), backend='pyttsx3',
+        checkpoint_root=tmp_path, on_chunk=lambda samples, sr: received.append((len(samples), sr)),
+    )
+    assert received == [(4, SR), (4, SR)]
@@ -0,0 +1,71 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils import memory_governor
+from gui_pyside6.utils.memory_governor import MemoryGovernor, in_use, register, resident, touch
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(memory_governor, '_CACHES', [])
+    monkeypatch.setattr(memory_governor, '_LAST_USED', {})
+    monkeypatch.setattr(memory_governor, '_BUSY', {})
+    cleared = []
+    monkeypatch.setattr(memory_governor, 'clear_memory', lambda: cleared.append(True))
+    return cleared
+
+
+def _use(cache, key, value, when, monkeypatch):
+    cache[key] = value
+    monkeypatch.setattr(memory_governor.time, 'monotonic', lambda: when)
+    touch(cache, key)
+
+
+def test_idle_models_are_unloaded(monkeypatch, fresh_registry):
+    models, voices = {}, {}
+    register('kokoro', models)
+    register('kokoro', voices, 'voice')
+    _use(models, 'm', object(), 100.0, monkeypatch)
+    _use(voices, 'af', object(), 500.0, monkeypatch)
+
+    governor = MemoryGovernor(idle_timeout=300)
+    dropped = governor.check(now=500.0)
+    assert [(e.backend, e.label, e.key) for e in dropped] == [('kokoro', 'model', 'm')]
+    assert models == {} and 'af' in voices
+    assert fresh_registry == [True]
+    assert memory_governor.summary() == 'kokoro (1)'
+
+
+def test_busy_backend_and_loading_lock_are_respected(monkeypatch):
+    busy, loading = {}, {}
+    lock = threading.Lock()
+    register('mms', busy)
+    register('chatterbox', loading, lock=lock)
+    _use(busy, 'eng', object(), 0.0, monkeypatch)
+    _use(loading, 'cpu', object(), 0.0, monkeypatch)
+
+    governor = MemoryGovernor(idle_timeout=1)
+    with in_use('mms'), lock:
+        assert governor.check(now=100.0) == []
+    assert [e.key for e in governor.check(now=100.0)] == ['eng', 'cpu']
+
+
+def test_memory_pressure_unloads_least_recently_used(monkeypatch):
+    cache = {}
+    register('whisper', cache, 'pipeline')
+    for i, key in enumerate(['old', 'mid', 'new']):
+        _use(cache, key, object(), float(i), monkeypatch)
+    readings = iter([3000, 2500, 1800])
+
+    governor = MemoryGovernor(idle_timeout=0, rss_limit_mb=2000, measure=lambda: next(readings))
+    unloaded = []
+    governor.on_unload = unloaded.extend
+    governor.check(now=3.0)
+    assert [e.key for e in unloaded] == ['old', 'mid']
+    assert list(cache) == ['new']
+    assert [e.key for e in resident()] == ['new']
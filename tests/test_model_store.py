@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.backend import model_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    root = tmp_path / 'models'
+    monkeypatch.setattr(model_store, 'MODELS_DIR', root)
+    return root
+
+
+def _fake_hub(monkeypatch, calls):
+    def snapshot_download(repo_id, local_dir=None, endpoint=None, ignore_patterns=None):
+        calls.append((repo_id, endpoint))
+        os.makedirs(local_dir, exist_ok=True)
+        with open(os.path.join(local_dir, 'config.json'), 'w') as f:
+            f.write('{}')
+        with open(os.path.join(local_dir, 'model.bin'), 'wb') as f:
+            f.write(b'weights')
+        return local_dir
+
+    hub = types.ModuleType('huggingface_hub')
+    hub.snapshot_download = snapshot_download
+    monkeypatch.setitem(sys.modules, 'huggingface_hub', hub)
+
+
+def test_prefetch_records_hashes_and_resolves(store, monkeypatch):
+    calls = []
+    _fake_hub(monkeypatch, calls)
+    monkeypatch.setenv(model_store.MIRROR_ENV, 'https://mirror.local')
+
+    assert model_store.resolve('org/model') == 'org/model'
+    model_store.prefetch('org/model')
+    model_store.prefetch('org/model')
+
+    assert calls == [('org/model', 'https://mirror.local')]
+    assert model_store.resolve('org/model') == str(store / 'org--model')
+    entry = json.loads((store / 'manifest.json').read_text())['org/model']
+    assert set(entry['files']) == {'config.json', 'model.bin'}
+    assert model_store.verify('org/model') == []
+
+    (store / 'org--model' / 'model.bin').write_bytes(b'corrupt')
+    assert model_store.verify('org/model') == ['model.bin']
+
+
+def test_import_models_checks_source_manifest(store, tmp_path, monkeypatch):
+    _fake_hub(monkeypatch, [])
+    model_store.prefetch('org/model')
+    usb = tmp_path / 'usb'
+    shutil.copytree(store, usb)
+
+    other = tmp_path / 'other'
+    monkeypatch.setattr(model_store, 'MODELS_DIR', other)
+    model_store.import_models(usb)
+    assert model_store.resolve('org/model') == str(other / 'org--model')
+
+    (usb / 'org--model' / 'model.bin').write_bytes(b'tampered')
+    with pytest.raises(ValueError, match='model.bin'):
+        model_store.import_models(usb, ['org/model'])
+
+
+def test_prefetch_checks_hub_checksums(store, monkeypatch):
+    import hashlib
+
+    _fake_hub(monkeypatch, [])
+    upstream = {'model.bin': hashlib.sha256(b'weights').hexdigest()}
+
+    class Sibling:
+        def __init__(self, name, sha256=None, blob_id=None):
+            self.rfilename, self.blob_id = name, blob_id
+            self.lfs = {'sha256': sha256} if sha256 else None
+
+    class HfApi:
+        def __init__(self, endpoint=None):
+            pass
+
+        def model_info(self, repo_id, files_metadata=False):
+            config_blob = hashlib.sha1(b'blob 2\0{}').hexdigest()
+            return types.SimpleNamespace(siblings=[
+                Sibling('config.json', blob_id=config_blob),
+                Sibling('model.bin', sha256=upstream['model.bin']),
+                Sibling('tf_model.h5', sha256='ignored'),
+            ])
+
+    sys.modules['huggingface_hub'].HfApi = HfApi
+    model_store.prefetch('org/model')
+    assert model_store.verify('org/model') == []
+
+    upstream['model.bin'] = '0' * 64
+    with pytest.raises(ValueError, match='model.bin'):
+        model_store.prefetch('org/model', force=True)
+
+
+def test_manifest_cached_until_changed(store, monkeypatch):
+    _fake_hub(monkeypatch, [])
+    model_store.prefetch('org/model')
+    reads = []
+    real_open = model_store.Path.open
+    monkeypatch.setattr(model_store.Path, 'open', lambda self, *a, **k: reads.append(self) or real_open(self, *a, **k))
+    for _ in range(3):
+        model_store.resolve('org/model')
+    assert len(reads) == 1
+
+    model_store.prefetch('org/other')
+    assert 'org/other' in model_store.load_manifest()
@@ -97,3 +97,5 @@ def test_output_dir_preference_used(tmp_path):
     assert main_window.OUTPUT_DIR == output_dir
     path = window._generate_output_path('hello', 'pyttsx3')
     assert str(path).startswith(str(output_dir))
+    assert window._generate_output_path('hello', 'pyttsx3') != path
+    assert path.name.split('__')[-1].startswith('hello_')
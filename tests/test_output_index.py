@@ -0,0 +1,70 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.create_base_filename import create_base_filename
+from gui_pyside6.utils.output_index import OutputIndex, apply_retention
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'\0' * size)
+    return path
+
+
+def test_layouts(tmp_path):
+    date = '2024-05-06_07-08-09'
+    per_clip = create_base_filename('hi there', str(tmp_path), 'kokoro', date)
+    assert Path(per_clip).parent.name == Path(per_clip).name == f'{date}__kokoro__hi_there'
+
+    by_date = Path(create_base_filename('hi', str(tmp_path), 'kokoro', date, 'date'))
+    assert by_date.parent == tmp_path / '2024' / '05' / '06' and by_date.parent.is_dir()
+
+    by_hash = Path(create_base_filename('hi', str(tmp_path), 'kokoro', date, 'hash'))
+    assert len(by_hash.relative_to(tmp_path).parts) == 3
+    assert by_hash == Path(create_base_filename('hi', str(tmp_path), 'kokoro', date, 'hash'))
+
+    with pytest.raises(ValueError):
+        create_base_filename('hi', str(tmp_path), 'kokoro', date, 'flat')
+
+
+def test_add_and_scan(tmp_path):
+    index = OutputIndex(tmp_path)
+    clip = _write(tmp_path / '2024' / '01' / '01' / 'a.wav', 100)
+    assert index.add([clip, tmp_path.parent / 'outside.wav'], backend='kokoro', text='hello') == 1
+    entry, = index.entries()
+    assert entry.path == clip.resolve() and entry.size == 100 and entry.text == 'hello'
+
+    legacy = _write(tmp_path / 'old' / 'old.wav', 50)
+    _write(tmp_path / 'old' / 'old.wav.peaks', 8)
+    _write(tmp_path / 'old' / 'x.part.wav', 8)
+    clip.unlink()
+    assert index.scan() == (1, 1)
+    assert [e.path for e in index.entries()] == [legacy.resolve()]
+    assert index.total_size() == 50
+
+
+def test_cleanup_by_age_then_lru(tmp_path):
+    index = OutputIndex(tmp_path)
+    paths = [_write(tmp_path / 'clips' / f'{i}' / f'{i}.wav', 100) for i in range(5)]
+    for i, path in enumerate(paths):
+        index.add(path, created=1000.0 + i * 86400)
+    _write(tmp_path / 'clips' / '0' / '0.wav.peaks', 8)
+    index.touch(paths[1], when=1000.0 + 10 * 86400)
+
+    now = 1000.0 + 10 * 86400
+    removed = index.cleanup(max_age_days=7.5, max_bytes=300, keep=[paths[2]], now=now)
+    # 0 is too old; then 3 is least recently used (2 is kept, 1 was played).
+    assert removed == [tmp_path.resolve() / 'clips' / '0' / '0.wav', tmp_path.resolve() / 'clips' / '3' / '3.wav']
+    assert not (tmp_path / 'clips' / '0').exists() and not (tmp_path / 'clips' / '3').exists()
+    assert {e.path.name for e in index.entries()} == {'1.wav', '2.wav', '4.wav'}
+    assert (tmp_path / 'clips').is_dir()
+
+
+def test_apply_retention_without_limits_creates_nothing(tmp_path):
+    assert apply_retention(tmp_path / 'out') == []
+    assert not (tmp_path / 'out').exists()
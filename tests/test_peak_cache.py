@@ -0,0 +1,74 @@
+import os
+import sys
+from unittest import mock
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils import peak_cache
+
+
+def _write(path, n=100_003, sr=8000):
+    rng = np.random.default_rng(1)
+    audio = rng.uniform(-0.9, 0.9, n).astype(np.float32)
+    sf.write(str(path), audio, sr, subtype='FLOAT')
+    return audio
+
+
+def test_peaks_built_once_and_memory_mapped(tmp_path):
+    wav = tmp_path / 'clip.wav'
+    audio = _write(wav)
+
+    pyramid = peak_cache.get_peaks(wav)
+    assert (tmp_path / 'clip.wav.peaks').exists()
+    assert pyramid.n_samples == audio.size and pyramid.sample_rate == 8000
+    assert isinstance(pyramid.levels[256], np.memmap)
+
+    with mock.patch.object(peak_cache, 'compute_levels') as compute:
+        again = peak_cache.get_peaks(wav)
+        compute.assert_not_called()
+    np.testing.assert_array_equal(again.levels[4096], pyramid.levels[4096])
+
+
+def test_columns_pick_level_for_zoom(tmp_path):
+    wav = tmp_path / 'clip.wav'
+    audio = _write(wav)
+    pyramid = peak_cache.get_peaks(wav)
+
+    mins, maxs, _ = pyramid.columns(0, audio.size, 10)
+    assert mins.min() == audio.min() and maxs.max() == audio.max()
+    assert mins.size == 10
+
+    # Zoomed into 1000 samples the finest level is used.
+    mins, maxs, _ = pyramid.columns(2560, 3560, 400)
+    assert mins.size == 4
+    assert maxs.max() <= audio[2560:3840].max()
+
+
+def test_peaks_rebuilt_when_audio_changes(tmp_path):
+    wav = tmp_path / 'clip.wav'
+    _write(wav)
+    peak_cache.get_peaks(wav)
+    _write(wav, n=5000)
+    os.utime(wav, ns=(0, 10**9))
+    assert peak_cache.get_peaks(wav).n_samples == 5000
+
+
+def test_cache_dir_used_without_sidecar(tmp_path, monkeypatch):
+    monkeypatch.setattr(peak_cache, 'CACHE_DIR', tmp_path / 'cache')
+    wav = tmp_path / 'input.wav'
+    _write(wav, n=3000)
+    peak_cache.get_peaks(wav, sidecar=False)
+    assert not (tmp_path / 'input.wav.peaks').exists()
+    assert len(list((tmp_path / 'cache').glob('*.peaks'))) == 1
+
+
+def test_cancelled_load_stops(tmp_path):
+    wav = tmp_path / 'clip.wav'
+    _write(wav)
+    with pytest.raises(peak_cache.LoadCancelled):
+        peak_cache.get_peaks(wav, cancelled=lambda: True)
+    assert not (tmp_path / 'clip.wav.peaks').exists()
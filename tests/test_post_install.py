@@ -0,0 +1,53 @@
+import os
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.backend import post_install
+
+
+class FakeDist:
+    def __init__(self, root):
+        self.root = root
+
+    def read_text(self, name):
+        return "fakepkg\n" if name == "top_level.txt" else None
+
+    def locate_file(self, path):
+        return self.root / path
+
+
+def test_backend_module_resolves_lazy_backends():
+    assert post_install.backend_module('kokoro') == 'gui_pyside6.backend.kokoro_backend'
+
+
+def test_smoke_test_reports_import_errors():
+    results = post_install.smoke_test(['json', 'no_such_module_for_smoke_test'])
+    assert results['json'][1] is None
+    assert 'ModuleNotFoundError' in results['no_such_module_for_smoke_test'][1]
+
+
+def test_finalize_precompiles_and_logs(tmp_path):
+    pkg = tmp_path / 'fakepkg'
+    pkg.mkdir()
+    (pkg / '__init__.py').write_text('VALUE = 1\n')
+    registry = mock.Mock()
+    registry.distributions.return_value = ['fake-dist']
+    smoke = {
+        'gui_pyside6.backend.kokoro_backend': (0.5, None),
+        'fakepkg': (1.5, None),
+    }
+
+    with mock.patch('gui_pyside6.backend._registry', return_value=registry), \
+         mock.patch('importlib.metadata.distribution', return_value=FakeDist(tmp_path)), \
+         mock.patch.object(post_install, 'smoke_test', return_value=smoke) as run_smoke, \
+         mock.patch('gui_pyside6.backend._write_snapshot'), \
+         mock.patch('gui_pyside6.backend._log_action') as log:
+        post_install.finalize(['kokoro'])
+
+    assert list((pkg / '__pycache__').glob('__init__.*.pyc'))
+    run_smoke.assert_called_once_with(['gui_pyside6.backend.kokoro_backend', 'fakepkg'])
+    actions = [(c.args[0], c.args[1], c.args[2][-1]) for c in log.call_args_list]
+    assert actions == [('precompile', 'kokoro', '1 dirs'), ('smoke_test', 'kokoro', 'ok')]
+    assert log.call_args_list[1].args[2][0] == '1.50s'
@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils import timer
+from gui_pyside6.utils.timer import StageTimer, note, recent_records, stage, summarize
+
+
+def test_nested_stages_are_exclusive():
+    stages = StageTimer(backend='kokoro')
+    with stages.stage('inference'):
+        time.sleep(0.02)
+        with stages.stage('model_load'):
+            time.sleep(0.05)
+        with stages.stage('write'):
+            time.sleep(0.01)
+    assert set(stages.stages) == {'inference', 'model_load', 'write'}
+    assert stages.stages['model_load'] >= 0.05
+    assert stages.stages['inference'] < 0.05
+    assert abs(stages.total - sum(stages.stages.values())) < 1e-9
+
+
+def test_module_helpers_follow_active_timer():
+    # Outside of a job the helpers are no-ops.
+    with stage('model_load') as active:
+        assert active is None
+    note(model_cache='hit')
+
+    stages = StageTimer()
+    seen = []
+
+    def worker():
+        with stages.activate():
+            with stage('model_load'):
+                note(model_cache='miss')
+        seen.append(timer.current())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen == [None]
+    assert 'model_load' in stages.stages
+    assert stages.info['model_cache'] == 'miss'
+    assert timer.current() is None
+
+
+def test_record_summary_and_log(caplog):
+    stages = StageTimer(backend='mms')
+    stages.add('model_load', 1.0)
+    stages.add('inference', 2.0)
+    stages.note(model_cache='hit', audio_duration=6.0)
+
+    with caplog.at_level(logging.INFO, logger='gui_pyside6.jobs'):
+        record = stages.log()
+    assert record['rtf'] == 0.5 and record['total'] == 3.0
+    assert recent_records()[-1] == record
+    logged = caplog.records[-1].getMessage()
+    assert json.loads(logged.split(' ', 2)[2]) == record
+    assert summarize(record) == 'model load (hit) 1.00s · inference 2.00s · RTF 0.50'
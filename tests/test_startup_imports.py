@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cold-start budget in milliseconds for importing the modules below. Override
+# with HYBRID_TTS_IMPORT_BUDGET_MS on slow machines.
+IMPORT_BUDGET_MS = float(os.environ.get("HYBRID_TTS_IMPORT_BUDGET_MS", 1500))
+
+# Modules that must only be imported when a feature first needs them.
+HEAVY_MODULES = {"torch", "matplotlib", "transformers", "scipy", "PySide6.QtMultimedia"}
+
+
+def _import_times(module, tmp_path):
+    """Return ``{module: cumulative_us}`` from ``python -X importtime``."""
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _check(module, tmp_path):
+    # First run fills the bytecode caches.
+    _import_times(module, tmp_path)
+    times = _import_times(module, tmp_path)
+    heavy = sorted(
+        name for name in times if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES
+    )
+    assert not heavy, f"{module} imported {heavy} at startup"
+    assert times[module] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_backend_import_within_budget(tmp_path):
+    _check("gui_pyside6.backend", tmp_path)
+
+
+def test_gui_import_within_budget(tmp_path):
+    # Other tests replace PySide6 in sys.modules with stubs, so probe a
+    # clean interpreter.
+    probe = subprocess.run([sys.executable, "-c", "import PySide6"], capture_output=True)
+    if probe.returncode != 0:
+        pytest.skip("PySide6 not installed")
+    _check("gui_pyside6.main", tmp_path)
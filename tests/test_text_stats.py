@@ -0,0 +1,46 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils import timer
+from gui_pyside6.utils.history_store import HistoryStore
+from gui_pyside6.utils.long_document import split_document
+from gui_pyside6.utils.text_stats import CHARS_PER_SECOND, backend_rtf, compute_stats, format_duration
+
+
+def test_compute_stats_counts_and_estimates():
+    stats = compute_stats('Hello there. How are you?  Fine', rtf=0.5)
+    assert (stats.characters, stats.words, stats.sentences, stats.chunks) == (31, 6, 3, 1)
+    assert stats.audio_seconds == 31 / CHARS_PER_SECOND
+    assert stats.synthesis_seconds == stats.audio_seconds * 0.5
+    assert '3 sentences' in stats.describe() and 'to synthesize' in stats.describe()
+
+    empty = compute_stats('   ')
+    assert empty.chunks == 0 and empty.describe() == ''
+
+
+def test_long_text_reports_document_chunks():
+    text = '\n\n'.join(['Word ' * 100 + 'end.'] * 5)
+    stats = compute_stats(text, long_threshold=1000)
+    assert stats.chunks == len(split_document(text)) > 1
+    assert compute_stats(text).chunks == 1
+    assert stats.synthesis_seconds is None
+
+
+def test_backend_rtf_uses_history_then_session(tmp_path, monkeypatch):
+    store = HistoryStore(tmp_path / 'history.sqlite3')
+    for rtf in (0.2, 0.4, 0.9):
+        store.add('kokoro', text='x', output='x.wav', stages={'rtf': rtf})
+    store.add('mms', text='x', output='y.wav', stages={'rtf': 3.0})
+    assert backend_rtf('kokoro', store) == 0.4
+    assert backend_rtf('edge_tts', store) is None
+
+    monkeypatch.setattr(timer, '_RECENT', [{'backend': 'mms', 'rtf': 1.5}, {'backend': 'kokoro', 'rtf': None}])
+    assert backend_rtf('mms') == 1.5
+    assert backend_rtf('kokoro') is None
+
+
+def test_format_duration():
+    assert format_duration(65.4) == '1:05'
+    assert format_duration(3725) == '1:02:05'
@@ -34,7 +34,7 @@ def test_update_called_on_text_changed(tmp_path):
 
     window = main_window.MainWindow()
     calls = []
-    window.update_synthesize_enabled = lambda: calls.append('call')
+    window.update_synthesize_enabled = lambda **kwargs: calls.append('call')
 
     window.on_text_changed()
 
@@ -36,3 +36,36 @@ def test_stored_text_enables_synth(tmp_path):
         if m.startswith('PySide6'):
             sys.modules.pop(m)
     sys.modules.update(saved)
+
+
+def test_settled_text_copied_once(tmp_path):
+    saved = _setup_pyside6_stubs()
+    prefs.PREF_FILE = tmp_path / 'prefs.json'
+    prefs.save_preferences({})
+
+    import importlib
+    import gui_pyside6.ui.main_window as main_window
+    importlib.reload(main_window)
+
+    main_window.is_backend_installed = lambda name: True
+
+    window = main_window.MainWindow()
+    window.synth_button.setEnabled = lambda val: setattr(window.synth_button, '_enabled', val)
+    copies = []
+
+    def to_plain():
+        copies.append(1)
+        return "hello"
+
+    window.text_edit.document = lambda: types.SimpleNamespace(toPlainText=to_plain)
+    window.text_edit.toPlainText = to_plain
+
+    window._on_text_settled()
+
+    assert len(copies) == 1
+    assert window.text_edit._stored_text == "hello" and window.synth_button._enabled is True
+
+    for m in list(sys.modules):
+        if m.startswith('PySide6'):
+            sys.modules.pop(m)
+    sys.modules.update(saved)
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.vad import detect_speech_regions
+
+
+SR = 16000
+
+
+def _tone(seconds):
+    t = np.arange(int(SR * seconds)) / SR
+    return (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(SR * seconds), dtype=np.float32)
+
+
+def test_speech_regions_found_between_silence():
+    audio = np.concatenate([_silence(2), _tone(1), _silence(3), _tone(0.5), _silence(2)])
+    regions = detect_speech_regions(audio, SR, pad_ms=0)
+
+    assert len(regions) == 2
+    (s1, e1), (s2, e2) = regions
+    assert abs(s1 - 2 * SR) < SR * 0.05 and abs(e1 - 3 * SR) < SR * 0.05
+    assert abs(s2 - 6 * SR) < SR * 0.05 and abs(e2 - 6.5 * SR) < SR * 0.05
+
+
+def test_short_pauses_are_bridged():
+    audio = np.concatenate([_tone(1), _silence(0.2), _tone(1), _silence(2)])
+    assert len(detect_speech_regions(audio, SR)) == 1
+
+
+def test_pure_silence_has_no_regions():
+    assert detect_speech_regions(_silence(5), SR) == []
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.utils.waveform_render import decimate, to_mono
+
+
+def test_decimate_matches_per_column_reduction():
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-1, 1, 10_007).astype(np.float32)
+    mins, maxs, rms = decimate(audio, 64)
+
+    edges = np.linspace(0, audio.size, 65).astype(int)
+    spans = [audio[a:b] for a, b in zip(edges[:-1], edges[1:])]
+    np.testing.assert_allclose(mins, [s.min() for s in spans])
+    np.testing.assert_allclose(maxs, [s.max() for s in spans])
+    np.testing.assert_allclose(rms, [np.sqrt(np.mean(s ** 2)) for s in spans], rtol=1e-5)
+
+
+def test_decimate_short_and_empty_signals():
+    mins, maxs, _ = decimate(np.array([0.1, -0.2, 0.3]), 800)
+    assert mins.tolist() == maxs.tolist() == [np.float32(0.1), np.float32(-0.2), np.float32(0.3)]
+    assert decimate(np.zeros(0), 10)[0].size == 0
+
+
+def test_to_mono_returns_float32():
+    out = to_mono(np.ones((4, 2), dtype=np.int16))
+    assert out.dtype == np.float32 and out.shape == (4,)
@@ -3,26 +3,6 @@ import sys
 import types
 import numpy as np
 
-matplotlib = types.ModuleType('matplotlib')
-
-class DummyFig:
-    def __init__(self):
-        self.canvas = types.SimpleNamespace(get_width_height=lambda: (1, 1))
-    def savefig(self, buff, format='raw'):
-        buff.write(b'\x00' * 4)
-
-pyplot = types.ModuleType('pyplot')
-pyplot.figure = lambda *a, **k: DummyFig()
-pyplot.style = types.SimpleNamespace(use=lambda *a, **k: None)
-pyplot.plot = lambda *a, **k: None
-pyplot.axis = lambda *a, **k: None
-pyplot.close = lambda *a, **k: None
-matplotlib.use = lambda *a, **k: None
-matplotlib.figure = types.SimpleNamespace(Figure=DummyFig)
-sys.modules.setdefault('matplotlib', matplotlib)
-sys.modules.setdefault('matplotlib.figure', matplotlib.figure)
-sys.modules.setdefault('matplotlib.pyplot', pyplot)
-
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 class Dummy:
@@ -137,14 +117,88 @@ sys.modules['PySide6.QtMultimedia'] = qtmultimedia_mod
 import importlib
 import gui_pyside6.ui.main_window as main_window
 importlib.reload(main_window)
-from gui_pyside6.ui.main_window import WaveformWidget, MainWindow
+from gui_pyside6.ui.main_window import WaveformWidget, MainWindow, PeakLoadTask
 
 
-def test_waveform_widget_sets_pixmap():
+def test_waveform_widget_decimates_to_width():
     w = WaveformWidget()
-    data = np.zeros(100)
+    data = np.stack([np.linspace(-1, 1, 1000), np.zeros(1000)], axis=1)
     w.set_audio_array(data)
-    assert w.pixmap == 'pixmap'
+    assert w.has_waveform()
+    mins, maxs, rms = w.waveform_columns(100)
+    assert mins.shape == maxs.shape == rms.shape == (100,)
+    assert mins[0] == -0.5 and maxs[-1] == 0.5
+    assert w.waveform_columns(100)[0] is mins
+
+
+def test_waveform_widget_zoom_and_scroll():
+    w = WaveformWidget()
+    w.set_audio_array(np.arange(1000, dtype=np.float32) / 1000)
+    w.zoom(4, anchor=0.5)
+    assert w.view() == (0.375, 0.625)
+    mins, maxs, _ = w.waveform_columns(10)
+    assert mins[0] == np.float32(0.375) and maxs[-1] == np.float32(0.624)
+    w.scroll(10)
+    assert w.view() == (0.75, 1.0)
+    w.reset_view()
+    assert w.view() == (0.0, 1.0)
+
+
+def test_stale_peak_loads_ignored():
+    w = WaveformWidget()
+    w.set_audio_array(np.zeros(10))
+    stale = w._generation
+    w.set_audio_array(np.ones(10))
+    w._on_peaks_loaded(stale, object(), None)
+    assert w._peaks is None and w._samples is not None
+
+
+def test_appended_chunks_reuse_buffer():
+    w = WaveformWidget()
+    w.set_audio_array(np.zeros(10, dtype=np.float32))
+    chunks = [np.full(100, i, dtype=np.float32) for i in range(1, 50)]
+    w.append_audio(chunks[0])
+    buffer = w._sample_buffer
+    for chunk in chunks[1:]:
+        w.append_audio(chunk)
+    assert w._sample_buffer is buffer
+    assert np.array_equal(w._samples, np.concatenate([np.zeros(10, dtype=np.float32), *chunks]))
+    w.set_audio_array(np.ones(5))
+    w.append_audio(np.zeros(3))
+    assert w._samples.tolist() == [1, 1, 1, 1, 1, 0, 0, 0]
+
+
+def test_set_audio_file_reports_load_time(tmp_path):
+    import soundfile as sf
+
+    wav = tmp_path / 'a.wav'
+    sf.write(str(wav), np.zeros(1000, dtype=np.float32), 8000)
+    w = WaveformWidget()
+    loaded = []
+    # Without a Qt thread pool the peaks load synchronously.
+    w.set_audio_file(wav, on_loaded=loaded.append)
+    assert len(loaded) == 1 and loaded[0] >= 0
+
+    w._on_loaded = loaded.append
+    w.set_audio_array(np.zeros(10))
+    assert loaded[1] is None
+    w.set_audio_file(tmp_path / 'missing.wav', on_loaded=loaded.append)
+    assert loaded[2] is None and len(loaded) == 3
+
+
+def test_superseded_task_does_not_emit(tmp_path):
+    import soundfile as sf
+
+    wav = tmp_path / 'a.wav'
+    sf.write(str(wav), np.zeros(1000, dtype=np.float32), 8000)
+    emitted = []
+    signals = types.SimpleNamespace(loaded=types.SimpleNamespace(emit=lambda *a: emitted.append(a)))
+
+    PeakLoadTask(wav, True, 1, lambda g: False, signals).run()
+    assert emitted == [] and not (tmp_path / 'a.wav.peaks').exists()
+
+    PeakLoadTask(wav, True, 2, lambda g: True, signals).run()
+    assert emitted[0][0] == 2 and emitted[0][1].n_samples == 1000
 
 
 def test_volume_slider_orientation_vertical():
@@ -0,0 +1,63 @@
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6 import backend
+from gui_pyside6.backend import wheelhouse
+
+
+@pytest.fixture
+def lock_dir(tmp_path, monkeypatch):
+    locks = tmp_path / 'locks'
+    locks.mkdir()
+    monkeypatch.setattr(wheelhouse, 'LOCK_DIR', locks)
+    monkeypatch.setattr(backend, '_INSTALLED_STATE', {})
+    monkeypatch.setattr(backend, '_state_file', lambda: tmp_path / 'state.json')
+    return locks
+
+
+def test_locked_requirements_parsed(lock_dir):
+    (lock_dir / 'demo.txt').write_text(
+        "# generated\nfoo==1.0\n    # via -r demo.in\n--index-url https://x\nbar==2.0  # via foo\n"
+    )
+    assert wheelhouse.locked_requirements('demo') == ['foo==1.0', 'bar==2.0']
+    assert wheelhouse.locked_requirements('other') is None
+
+
+def test_install_uses_wheelhouse_and_lockfile(lock_dir, tmp_path, monkeypatch):
+    (lock_dir / 'demo.txt').write_text("foo==1.0\nbar==2.0\n")
+    wheels = tmp_path / 'wheels'
+    wheels.mkdir()
+    monkeypatch.setenv(wheelhouse.WHEELHOUSE_ENV, str(wheels))
+
+    with mock.patch('gui_pyside6.backend.missing_backend_packages', return_value=['foo']), \
+         mock.patch('gui_pyside6.backend._target_python', return_value=sys.executable), \
+         mock.patch('gui_pyside6.backend._uv_available', return_value=True), \
+         mock.patch('gui_pyside6.backend._log_action'), \
+         mock.patch('subprocess.check_call') as call:
+        backend.ensure_backend_installed('demo')
+
+    cmd = call.call_args.args[0]
+    assert cmd[:3] == ['uv', 'pip', 'install']
+    assert cmd[cmd.index('--find-links') + 1] == str(wheels)
+    assert '--no-index' in cmd and '--no-deps' in cmd
+    assert cmd[-2:] == ['foo==1.0', 'bar==2.0']
+
+
+def test_build_wheelhouse_downloads_locked_packages(lock_dir, tmp_path):
+    (lock_dir / 'demo.txt').write_text("foo==1.0\n")
+    registry = mock.Mock()
+    registry.all_requirements.return_value = {'demo': ['foo'], 'plain': ['baz']}
+
+    with mock.patch('gui_pyside6.backend._registry', return_value=registry), \
+         mock.patch('subprocess.check_call') as call:
+        wheelhouse.build_wheelhouse(tmp_path / 'wheels')
+
+    demo, plain = [c.args[0] for c in call.call_args_list]
+    assert demo[1:4] == ['-m', 'pip', 'download']
+    assert demo[-2:] == ['--no-deps', 'foo==1.0']
+    assert '--no-deps' not in plain and plain[-1] == 'baz'
@@ -0,0 +1,178 @@
+import os
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui_pyside6.backend import whisper_backend
+
+
+def _install_stubs(monkeypatch):
+    created = []
+    calls = []
+
+    def fake_pipeline(task, model=None, device=None):
+        created.append((task, model, device))
+
+        def run(audio, **kwargs):
+            calls.append((audio, kwargs))
+            return {"text": "hello"}
+
+        return run
+
+    transformers = types.ModuleType("transformers")
+    transformers.pipeline = fake_pipeline
+    torch = types.ModuleType("torch")
+    torch.cuda = types.SimpleNamespace(is_available=lambda: False)
+    monkeypatch.setitem(sys.modules, "transformers", transformers)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(whisper_backend, "_PIPELINES", {})
+    return created, calls
+
+
+def test_pipeline_cached_between_calls(monkeypatch, tmp_path):
+    created, calls = _install_stubs(monkeypatch)
+    monkeypatch.setattr(whisper_backend, "_audio_duration", lambda p: 5.0)
+
+    audio = tmp_path / "a.wav"
+    assert whisper_backend.transcribe_to_text(audio) == "hello"
+    assert whisper_backend.transcribe_to_text(audio) == "hello"
+
+    assert created == [("automatic-speech-recognition", "openai/whisper-small", -1)]
+    assert calls[0][1] == {"return_timestamps": False}
+
+
+def test_long_audio_uses_batched_chunks(monkeypatch, tmp_path):
+    _, calls = _install_stubs(monkeypatch)
+    monkeypatch.setattr(whisper_backend, "_audio_duration", lambda p: 3600.0)
+
+    whisper_backend.transcribe_to_text(tmp_path / "long.wav", batch_size=16)
+
+    kwargs = calls[0][1]
+    assert kwargs["chunk_length_s"] == 30.0
+    assert kwargs["batch_size"] == 16
+    assert kwargs["return_timestamps"] is True
+
+
+def test_transcribe_batch_writes_manifest(monkeypatch, tmp_path):
+    import json
+
+    import numpy as np
+    import soundfile as sf
+
+    _install_stubs(monkeypatch)
+    batches = []
+
+    def fake_pipeline(task, model=None, device=None):
+        def run(inputs, **kwargs):
+            batches.append(kwargs["batch_size"])
+            for item in inputs:
+                assert item["sampling_rate"] == 16000
+                assert item["raw"].dtype == np.float32
+            return [{"text": f"clip {len(item['raw'])}"} for item in inputs]
+
+        return run
+
+    sys.modules["transformers"].pipeline = fake_pipeline
+
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for i, seconds in enumerate([3, 1, 2]):
+        sf.write(str(clips / f"c{i}.wav"), np.zeros(8000 * seconds, dtype=np.float32), 8000)
+    (clips / "notes.txt").write_text("skip me")
+
+    manifest = whisper_backend.transcribe_batch(
+        clips, tmp_path / "out.jsonl", batch_size=2, num_workers=2
+    )
+
+    records = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert [Path(r["audio"]).name for r in records] == ["c1.wav", "c2.wav", "c0.wav"]
+    assert [r["text"] for r in records] == ["clip 16000", "clip 32000", "clip 48000"]
+    assert batches == [2, 2]
+
+
+def test_transcribe_batch_probes_durations_on_pool(monkeypatch, tmp_path):
+    import json
+    import threading
+
+    import numpy as np
+    import soundfile as sf
+
+    _install_stubs(monkeypatch)
+    sys.modules["transformers"].pipeline = lambda task, model=None, device=None: (
+        lambda inputs, **kwargs: [{"text": "x"} for _ in inputs]
+    )
+    probe = whisper_backend._audio_duration
+    on_main = []
+
+    def audio_duration(path):
+        on_main.append(threading.current_thread() is threading.main_thread())
+        return probe(path)
+
+    monkeypatch.setattr(whisper_backend, "_audio_duration", audio_duration)
+    for i in range(4):
+        sf.write(str(tmp_path / f"c{i}.wav"), np.zeros(800 * (4 - i), dtype=np.float32), 8000)
+
+    manifest = whisper_backend.transcribe_batch(tmp_path, tmp_path / "out.jsonl", num_workers=2)
+
+    assert on_main == [False] * 4
+    records = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert [Path(r["audio"]).name for r in records] == ["c3.wav", "c2.wav", "c1.wav", "c0.wav"]
+
+
+def test_vad_maps_timestamps_to_original_timeline(monkeypatch, tmp_path):
+    import numpy as np
+
+    _install_stubs(monkeypatch)
+    seen = []
+
+    def fake_pipeline(task, model=None, device=None):
+        def run(inputs, **kwargs):
+            seen.extend(item["raw"].size for item in inputs)
+            return [{"text": "hi", "chunks": [{"timestamp": (0.1, 0.5), "text": "hi"}]} for _ in inputs]
+
+        return run
+
+    sys.modules["transformers"].pipeline = fake_pipeline
+    tone = (0.5 * np.sin(np.arange(16000) * 0.1)).astype(np.float32)
+    audio = np.concatenate([np.zeros(48000, np.float32), tone, np.zeros(48000, np.float32)])
+    monkeypatch.setattr(whisper_backend, "_load_audio", lambda p: audio)
+
+    result = whisper_backend.transcribe_segments(tmp_path / "a.wav", return_timestamps=True)
+
+    assert len(seen) == 1 and seen[0] < audio.size
+    segment = result["segments"][0]
+    assert 2.7 < segment["start"] < 3.2
+    assert result["skipped"] > 5.0
+    assert result["text"] == "hi"
+
+
+def test_speculative_decoding_passes_draft_model(monkeypatch, tmp_path):
+    _, calls = _install_stubs(monkeypatch)
+    monkeypatch.setattr(whisper_backend, "_audio_duration", lambda p: 5.0)
+    loaded = []
+
+    class FakeDraft:
+        @classmethod
+        def from_pretrained(cls, name):
+            loaded.append(name)
+            return cls()
+
+        def eval(self):
+            return self
+
+    sys.modules["transformers"].AutoModelForSpeechSeq2Seq = FakeDraft
+    monkeypatch.setattr(whisper_backend, "_ASSISTANTS", {})
+
+    whisper_backend.transcribe_to_text(
+        tmp_path / "a.wav", model_name="openai/whisper-large-v3", speculative=True
+    )
+    whisper_backend.transcribe_to_text(
+        tmp_path / "a.wav", model_name="openai/whisper-large-v3", speculative=True
+    )
+
+    assert loaded == ["distil-whisper/distil-large-v3"]
+    kwargs = calls[0][1]
+    assert isinstance(kwargs["generate_kwargs"]["assistant_model"], FakeDraft)
+    assert kwargs["batch_size"] == 1